@@ -20,7 +20,12 @@
 
 from __future__ import absolute_import
 
-from ._gi import _API, Repository
+from ._gi import _API, Repository, set_array_buffers
+from ._gi import set_string_cache_size, get_string_cache_info
+from ._gi import get_callable_cache_info
+
+from .profiler import profile_imports
+from .preload import warmup
 
 # Force loading the GObject typelib so we have available the wrappers for
 # base classes such as GInitiallyUnowned
@@ -28,6 +33,12 @@ import gi._gobject
 gi  # pyflakes
 
 _API = _API  # pyflakes
+set_array_buffers  # pyflakes
+set_string_cache_size  # pyflakes
+get_string_cache_info  # pyflakes
+profile_imports  # pyflakes
+get_callable_cache_info  # pyflakes
+warmup  # pyflakes
 
 import os
 
@@ -36,6 +36,11 @@ GQuark pygenum_class_key;
 
 PYGLIB_DEFINE_TYPE("gobject.GEnum", PyGEnum_Type, PyGEnum);
 
+/* Metaclass of GEnum and GFlags. Wrappers may store a dict mapping the names
+ * of their values to integers in __lazy_values__, the value attributes are
+ * then only created on first access. */
+PYGLIB_DEFINE_TYPE("gobject.GEnumMeta", PyGEnumMeta_Type, PyHeapTypeObject);
+
 static PyObject *
 pyg_enum_val_new(PyObject* subclass, GType gtype, PyObject *intval)
 {     
@@ -346,11 +351,163 @@ static PyGetSetDef pyg_enum_getsets[] = {
     { NULL, 0, 0 }
 };
 
+/* Create the value attributes which were not accessed yet, for lookups
+ * which don't go through pyg_enum_meta_getattro(): the class __dict__ and
+ * attributes of the values themselves. __lazy_values__ is removed once all
+ * values exist. */
+static int
+pyg_enum_meta_create_values(PyObject *cls)
+{
+    PyObject *dict, *lazy_values, *key, *value, *attr;
+    Py_ssize_t pos = 0;
+
+    dict = ((PyTypeObject *)cls)->tp_dict;
+    lazy_values = PyDict_GetItemString(dict, "__lazy_values__");
+    if (lazy_values == NULL || !PyDict_Check(lazy_values))
+        return 0;
+
+    Py_INCREF(lazy_values);
+    while (PyDict_Next(lazy_values, &pos, &key, &value)) {
+        if (PyDict_GetItem(dict, key) != NULL)
+            continue;
+
+        attr = PyObject_CallFunctionObjArgs(cls, value, NULL);
+        if (attr == NULL || PyObject_SetAttr(cls, key, attr) < 0) {
+            Py_XDECREF(attr);
+            Py_DECREF(lazy_values);
+            return -1;
+        }
+        Py_DECREF(attr);
+    }
+    Py_DECREF(lazy_values);
+
+    return PyObject_DelAttrString(cls, "__lazy_values__");
+}
+
+/* Shared by GEnum and GFlags instances */
+PyObject *
+pyg_enum_getattro(PyObject *self, PyObject *name)
+{
+    PyObject *attr;
+
+    attr = PyObject_GenericGetAttr(self, name);
+    if (attr != NULL || !PyErr_ExceptionMatches(PyExc_AttributeError))
+        return attr;
+
+    if (PyDict_GetItemString(Py_TYPE(self)->tp_dict, "__lazy_values__") == NULL)
+        return NULL;
+
+    PyErr_Clear();
+    if (pyg_enum_meta_create_values((PyObject *)Py_TYPE(self)) < 0)
+        return NULL;
+
+    return PyObject_GenericGetAttr(self, name);
+}
+
+static PyObject *
+pyg_enum_meta_getattro(PyObject *cls, PyObject *name)
+{
+    PyObject *attr, *lazy_values, *value;
+
+    if (PYGLIB_PyUnicode_Check(name) &&
+        strcmp(PYGLIB_PyUnicode_AsString(name), "__dict__") == 0 &&
+        pyg_enum_meta_create_values(cls) < 0)
+        return NULL;
+
+    attr = PyType_Type.tp_getattro(cls, name);
+    if (attr != NULL || !PyErr_ExceptionMatches(PyExc_AttributeError))
+        return attr;
+
+    lazy_values = PyDict_GetItemString(((PyTypeObject *)cls)->tp_dict,
+                                       "__lazy_values__");
+    if (lazy_values == NULL || !PyDict_Check(lazy_values))
+        return NULL;
+
+    value = PyDict_GetItem(lazy_values, name);
+    if (value == NULL)
+        return NULL;
+
+    PyErr_Clear();
+
+    attr = PyObject_CallFunctionObjArgs(cls, value, NULL);
+    if (attr == NULL)
+        return NULL;
+
+    if (PyObject_SetAttr(cls, name, attr) < 0) {
+        Py_DECREF(attr);
+        return NULL;
+    }
+
+    return attr;
+}
+
+static PyObject *
+pyg_enum_meta_dir(PyObject *cls)
+{
+    PyObject *names, *mro, *lazy_values, *key, *value, *result;
+    Py_ssize_t i, pos;
+
+    names = PySet_New(NULL);
+    if (names == NULL)
+        return NULL;
+
+    mro = ((PyTypeObject *)cls)->tp_mro;
+    for (i = 0; mro != NULL && i < PyTuple_GET_SIZE(mro); i++) {
+        PyObject *dict = ((PyTypeObject *)PyTuple_GET_ITEM(mro, i))->tp_dict;
+
+        pos = 0;
+        while (dict != NULL && PyDict_Next(dict, &pos, &key, &value)) {
+            if (PySet_Add(names, key) < 0) {
+                Py_DECREF(names);
+                return NULL;
+            }
+        }
+    }
+
+    lazy_values = PyDict_GetItemString(((PyTypeObject *)cls)->tp_dict,
+                                       "__lazy_values__");
+    if (lazy_values != NULL && PyDict_Check(lazy_values)) {
+        pos = 0;
+        while (PyDict_Next(lazy_values, &pos, &key, &value)) {
+            if (PySet_Add(names, key) < 0) {
+                Py_DECREF(names);
+                return NULL;
+            }
+        }
+    }
+
+    result = PySequence_List(names);
+    Py_DECREF(names);
+    return result;
+}
+
+static PyMethodDef pyg_enum_meta_methods[] = {
+    { "__dir__", (PyCFunction)pyg_enum_meta_dir, METH_NOARGS },
+    { NULL, NULL, 0 }
+};
+
+int
+pyg_enum_meta_ready(void)
+{
+    if (PyGEnumMeta_Type.tp_flags & Py_TPFLAGS_READY)
+        return 0;
+
+    PyGEnumMeta_Type.tp_base = &PyType_Type;
+    PyGEnumMeta_Type.tp_getattro = pyg_enum_meta_getattro;
+    PyGEnumMeta_Type.tp_methods = pyg_enum_meta_methods;
+    PyGEnumMeta_Type.tp_flags = Py_TPFLAGS_DEFAULT;
+    return PyType_Ready(&PyGEnumMeta_Type);
+}
+
 void
 pygobject_enum_register_types(PyObject *d)
 {
     pygenum_class_key        = g_quark_from_static_string("PyGEnum::class");
 
+    if (pyg_enum_meta_ready() < 0)
+        return;
+
+    Py_TYPE(&PyGEnum_Type) = &PyGEnumMeta_Type;
     PyGEnum_Type.tp_base = &PYGLIB_PyLong_Type;
 #if PY_VERSION_HEX < 0x03000000
     PyGEnum_Type.tp_new = pyg_enum_new;
@@ -362,6 +519,7 @@ pygobject_enum_register_types(PyObject *d)
     PyGEnum_Type.tp_str = (reprfunc)pyg_enum_repr;
     PyGEnum_Type.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE;
     PyGEnum_Type.tp_richcompare = (richcmpfunc)pyg_enum_richcompare;
+    PyGEnum_Type.tp_getattro = pyg_enum_getattro;
     PyGEnum_Type.tp_methods = pyg_enum_methods;
     PyGEnum_Type.tp_getset = pyg_enum_getsets;
     PYGOBJECT_REGISTER_GTYPE(d, PyGEnum_Type, "GEnum", G_TYPE_ENUM);
@@ -468,6 +468,10 @@ pygobject_flags_register_types(PyObject *d)
 {
     pygflags_class_key = g_quark_from_static_string("PyGFlags::class");
 
+    if (pyg_enum_meta_ready() < 0)
+        return;
+
+    Py_TYPE(&PyGFlags_Type) = &PyGEnumMeta_Type;
     PyGFlags_Type.tp_base = &PYGLIB_PyLong_Type;
 #if PY_VERSION_HEX < 0x03000000
     PyGFlags_Type.tp_new = pyg_flags_new;
@@ -480,6 +484,7 @@ pygobject_flags_register_types(PyObject *d)
     PyGFlags_Type.tp_str = (reprfunc)pyg_flags_repr;
     PyGFlags_Type.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE;
     PyGFlags_Type.tp_richcompare = (richcmpfunc)pyg_flags_richcompare;
+    PyGFlags_Type.tp_getattro = pyg_enum_getattro;
     PyGFlags_Type.tp_getset = pyg_flags_getsets;
     PYGOBJECT_REGISTER_GTYPE(d, PyGFlags_Type, "GFlags", G_TYPE_FLAGS);
 }
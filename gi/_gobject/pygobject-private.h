@@ -205,6 +205,10 @@ typedef struct {
 } PyGEnum;
 
 extern PyTypeObject PyGEnum_Type;
+extern PyTypeObject PyGEnumMeta_Type;
+
+extern int pyg_enum_meta_ready (void);
+extern PyObject * pyg_enum_getattro (PyObject *self, PyObject *name);
 
 extern PyObject * pyg_enum_add        (PyObject *   module,
 				       const char * type_name,
@@ -1220,6 +1220,108 @@ pyg_closure_invalidate(gpointer data, GClosure *closure)
     pc->swap_data = NULL;
 }
 
+/* arguments of closure calls with up to this many go on the stack */
+#define PYG_CLOSURE_N_STACK_ARGS 8
+
+/* Call the callback of pc with the n_args references in args, which are
+ * released, and convert the result to return_value. */
+static void
+pyg_closure_call(PyGClosure *pc,
+		 PyObject **args,
+		 Py_ssize_t n_args,
+		 GValue *return_value,
+		 guint n_param_values,
+		 const GValue *param_values)
+{
+    PyObject *ret;
+    Py_ssize_t i;
+
+#if PY_VERSION_HEX >= 0x03090000
+    ret = PyObject_Vectorcall(pc->callback, args, n_args, NULL);
+    for (i = 0; i < n_args; i++)
+	Py_DECREF(args[i]);
+#else
+    PyObject *params;
+
+    params = PyTuple_New(n_args);
+    if (params == NULL) {
+	for (i = 0; i < n_args; i++)
+	    Py_DECREF(args[i]);
+	PyErr_Print();
+	return;
+    }
+    for (i = 0; i < n_args; i++)
+	PyTuple_SET_ITEM(params, i, args[i]);
+    ret = PyObject_Call(pc->callback, params, NULL);
+    Py_DECREF(params);
+#endif
+
+    if (ret == NULL) {
+	if (pc->exception_handler)
+	    pc->exception_handler(return_value, n_param_values, param_values);
+	else
+	    PyErr_Print();
+	return;
+    }
+
+    if (return_value && pyg_value_from_pyobject(return_value, ret) != 0) {
+	/* If we already have an exception set, use that, otherwise set a
+	 * generic one */
+	if (!PyErr_Occurred())
+	    PyErr_SetString(PyExc_TypeError,
+                            "can't convert return value to desired type");
+
+	if (pc->exception_handler)
+	    pc->exception_handler(return_value, n_param_values, param_values);
+	else
+	    PyErr_Print();
+    }
+    Py_DECREF(ret);
+}
+
+/* Marshaller of closures without extra arguments or swap data, passing
+ * the parameter values only. */
+static void
+pyg_closure_marshal_simple(GClosure *closure,
+			   GValue *return_value,
+			   guint n_param_values,
+			   const GValue *param_values,
+			   gpointer invocation_hint,
+			   gpointer marshal_data)
+{
+    PyGILState_STATE state;
+    PyGClosure *pc = (PyGClosure *)closure;
+    PyObject *stack_args[PYG_CLOSURE_N_STACK_ARGS];
+    PyObject **args = stack_args;
+    guint i;
+
+    state = pyglib_gil_state_ensure();
+
+    if (n_param_values > PYG_CLOSURE_N_STACK_ARGS)
+	args = g_new(PyObject *, n_param_values);
+
+    for (i = 0; i < n_param_values; i++) {
+	args[i] = pyg_value_as_pyobject(&param_values[i], FALSE);
+
+	/* error condition */
+	if (!args[i]) {
+	    while (i > 0)
+		Py_DECREF(args[--i]);
+	    goto out;
+	}
+    }
+
+    pyg_closure_call(pc, args, n_param_values,
+		     return_value, n_param_values, param_values);
+
+ out:
+    if (args != stack_args)
+	g_free(args);
+    pyglib_gil_state_release(state);
+}
+
+/* Marshaller of closures with extra arguments or swap data. The argument
+ * vector is sized for both the parameter values and the extra arguments. */
 static void
 pyg_closure_marshal(GClosure *closure,
 		    GValue *return_value,
@@ -1230,60 +1332,53 @@ pyg_closure_marshal(GClosure *closure,
 {
     PyGILState_STATE state;
     PyGClosure *pc = (PyGClosure *)closure;
-    PyObject *params, *ret;
-    guint i;
+    PyObject *stack_args[PYG_CLOSURE_N_STACK_ARGS];
+    PyObject **args = stack_args;
+    Py_ssize_t n_extra_args = 0;
+    Py_ssize_t n_args;
+    Py_ssize_t i;
 
     state = pyglib_gil_state_ensure();
 
-    /* construct Python tuple for the parameter values */
-    params = PyTuple_New(n_param_values);
+    if (pc->extra_args)
+	n_extra_args = PyTuple_GET_SIZE(pc->extra_args);
+    n_args = n_param_values + n_extra_args;
+    if (n_args > PYG_CLOSURE_N_STACK_ARGS)
+	args = g_new(PyObject *, n_args);
+
     for (i = 0; i < n_param_values; i++) {
 	/* swap in a different initial data for connect_object() */
 	if (i == 0 && G_CCLOSURE_SWAP_DATA(closure)) {
-	    g_return_if_fail(pc->swap_data != NULL);
+	    if (pc->swap_data == NULL) {
+		g_critical("closure %p has no swap data", closure);
+		goto out;
+	    }
 	    Py_INCREF(pc->swap_data);
-	    PyTuple_SetItem(params, 0, pc->swap_data);
+	    args[0] = pc->swap_data;
 	} else {
-	    PyObject *item = pyg_value_as_pyobject(&param_values[i], FALSE);
+	    args[i] = pyg_value_as_pyobject(&param_values[i], FALSE);
 
 	    /* error condition */
-	    if (!item) {
+	    if (!args[i]) {
+		while (i > 0)
+		    Py_DECREF(args[--i]);
 		goto out;
 	    }
-	    PyTuple_SetItem(params, i, item);
 	}
     }
     /* params passed to function may have extra arguments */
-    if (pc->extra_args) {
-	PyObject *tuple = params;
-	params = PySequence_Concat(tuple, pc->extra_args);
-	Py_DECREF(tuple);
+    for (i = 0; i < n_extra_args; i++) {
+	PyObject *item = PyTuple_GET_ITEM(pc->extra_args, i);
+	Py_INCREF(item);
+	args[n_param_values + i] = item;
     }
-    ret = PyObject_CallObject(pc->callback, params);
-    if (ret == NULL) {
-	if (pc->exception_handler)
-	    pc->exception_handler(return_value, n_param_values, param_values);
-	else
-	    PyErr_Print();
-	goto out;
-    }
-
-    if (return_value && pyg_value_from_pyobject(return_value, ret) != 0) {
-	/* If we already have an exception set, use that, otherwise set a
-	 * generic one */
-	if (!PyErr_Occurred())
-	    PyErr_SetString(PyExc_TypeError,
-                            "can't convert return value to desired type");
 
-	if (pc->exception_handler)
-	    pc->exception_handler(return_value, n_param_values, param_values);
-	else
-	    PyErr_Print();
-    }
-    Py_DECREF(ret);
+    pyg_closure_call(pc, args, n_args,
+		     return_value, n_param_values, param_values);
 
  out:
-    Py_DECREF(params);
+    if (args != stack_args)
+	g_free(args);
     pyglib_gil_state_release(state);
 }
 
@@ -1307,7 +1402,6 @@ pyg_closure_new(PyObject *callback, PyObject *extra_args, PyObject *swap_data)
     g_return_val_if_fail(callback != NULL, NULL);
     closure = g_closure_new_simple(sizeof(PyGClosure), NULL);
     g_closure_add_invalidate_notifier(closure, NULL, pyg_closure_invalidate);
-    g_closure_set_marshal(closure, pyg_closure_marshal);
     Py_INCREF(callback);
     ((PyGClosure *)closure)->callback = callback;
     if (extra_args && extra_args != Py_None) {
@@ -1324,6 +1418,14 @@ pyg_closure_new(PyObject *callback, PyObject *extra_args, PyObject *swap_data)
 	((PyGClosure *)closure)->swap_data = swap_data;
 	closure->derivative_flag = TRUE;
     }
+
+    /* pick the marshaller once, instead of checking on every call;
+     * connect() passes an empty tuple when there are no extra arguments */
+    extra_args = ((PyGClosure *)closure)->extra_args;
+    if ((extra_args && PyTuple_GET_SIZE(extra_args) > 0) || swap_data)
+	g_closure_set_marshal(closure, pyg_closure_marshal);
+    else
+	g_closure_set_marshal(closure, pyg_closure_marshal_simple);
     return closure;
 }
 
@@ -0,0 +1,224 @@
+# -*- Mode: Python; py-indent-offset: 4 -*-
+# vim: tabstop=4 shiftwidth=4 expandtab
+#
+#   cache.py: persistent cache for wrapper metadata.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+"""Persistent cache for the metadata computed when creating wrappers.
+
+Wrapping a namespace needs a few tables which only depend on its typelib:
+enum and flags values, parents and interfaces of objects, class members and
+method resolution orders. When enabled, these are stored per namespace in
+the cache directory and reused as long as the typelib file (path, size and
+modification time), the PyGObject version and the Python version match.
+
+The cache is enabled by setting the PYGOBJECT_METADATA_CACHE environment
+variable to a non-empty value, or by calling enable().
+
+Independently of that, the data of a namespace can be preloaded from a
+snapshot, see gi.snapshot.
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import marshal
+import os
+import sys
+
+from ._gi import Repository
+from ._gobject import pygobject_version
+
+repository = Repository.get_default()
+
+_cache_dir = None
+_atexit_registered = False
+
+# namespace -> (key, {section: {name: value}})
+_namespaces = {}
+_dirty = set()
+
+# namespace -> {section: {name: value}}, from snapshots
+_preloaded = {}
+# namespace -> {section: {name: value}}, recorded for snapshots
+_recording = {}
+
+
+def get_default_cache_dir():
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if not cache_home:
+        cache_home = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'pygobject')
+
+
+def enable(cache_dir=None):
+    """Enable the cache, stored in cache_dir or get_default_cache_dir()."""
+    global _cache_dir, _atexit_registered
+
+    if cache_dir is None:
+        cache_dir = get_default_cache_dir()
+
+    _cache_dir = cache_dir
+    _namespaces.clear()
+    _dirty.clear()
+
+    if not _atexit_registered:
+        atexit.register(save)
+        _atexit_registered = True
+
+
+def disable():
+    """Disable the cache, dropping anything not saved yet."""
+    global _cache_dir
+
+    _cache_dir = None
+    _namespaces.clear()
+    _dirty.clear()
+
+
+def is_enabled():
+    return _cache_dir is not None
+
+
+def is_used(namespace):
+    """Return whether lookup() reads or records values for namespace, as
+    opposed to only calling compute()."""
+    return _cache_dir is not None or namespace in _preloaded or \
+        namespace in _recording
+
+
+def _get_key(namespace):
+    path = repository.get_typelib_path(namespace)
+    stat = os.stat(path)
+    return (path, stat.st_size, stat.st_mtime,
+            tuple(pygobject_version), tuple(sys.version_info[:2]))
+
+
+def _get_cache_path(namespace):
+    return os.path.join(_cache_dir, '%s-%s.cache' %
+                        (namespace, repository.get_version(namespace)))
+
+
+def _load(namespace):
+    try:
+        key = _get_key(namespace)
+    except (OSError, TypeError):
+        key = None
+
+    data = {}
+    if key is not None:
+        try:
+            with open(_get_cache_path(namespace), 'rb') as cache_file:
+                cached_key, cached_data = marshal.loads(cache_file.read())
+            if cached_key == key and isinstance(cached_data, dict):
+                data = cached_data
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            pass
+
+    entry = (key, data)
+    _namespaces[namespace] = entry
+    return entry
+
+
+def lookup(namespace, section, name, compute):
+    """Return the value cached for name in section of namespace, calling
+    compute() to create it if needed.
+
+    The value must be serializable by the marshal module, and must not be
+    modified by the caller.
+    """
+    preloaded = _preloaded.get(namespace)
+    if preloaded is not None:
+        try:
+            return preloaded[section][name]
+        except KeyError:
+            pass
+
+    recording = _recording.get(namespace)
+    if recording is not None:
+        value = compute()
+        recording.setdefault(section, {})[name] = value
+        return value
+
+    if _cache_dir is None:
+        return compute()
+
+    entry = _namespaces.get(namespace)
+    if entry is None:
+        entry = _load(namespace)
+
+    key, data = entry
+    section_data = data.setdefault(section, {})
+    try:
+        return section_data[name]
+    except KeyError:
+        pass
+
+    value = compute()
+    section_data[name] = value
+    if key is not None:
+        _dirty.add(namespace)
+    return value
+
+
+def preload(namespace, data):
+    """Use data, a dict mapping sections to dicts of names and values, for
+    the lookups in namespace."""
+    _preloaded[namespace] = data
+
+
+def record(namespace):
+    """Start recording the values computed by the lookups in namespace,
+    and return the dict mapping sections to dicts they are recorded in."""
+    return _recording.setdefault(namespace, {})
+
+
+def stop_recording(namespace):
+    _recording.pop(namespace, None)
+
+
+def save():
+    """Write the namespaces which got new entries to the cache directory."""
+    if _cache_dir is None:
+        return
+
+    try:
+        os.makedirs(_cache_dir)
+    except OSError:
+        if not os.path.isdir(_cache_dir):
+            _dirty.clear()
+            return
+
+    for namespace in _dirty:
+        key, data = _namespaces[namespace]
+        path = _get_cache_path(namespace)
+        tmp_path = '%s.%d' % (path, os.getpid())
+        try:
+            with open(tmp_path, 'wb') as cache_file:
+                cache_file.write(marshal.dumps((key, data)))
+            os.rename(tmp_path, path)
+        except (IOError, OSError, ValueError):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    _dirty.clear()
+
+
+if os.environ.get('PYGOBJECT_METADATA_CACHE'):
+    enable()
@@ -455,6 +455,24 @@ _wrap_pyg_variant_type_from_string (PyObject *self, PyObject *args)
     return py_variant;
 }
 
+static PyObject *
+_wrap_pyg_set_array_buffers (PyObject *self, PyObject *args)
+{
+    PyObject *py_enabled;
+    int enabled;
+
+    if (!PyArg_ParseTuple (args, "O:set_array_buffers", &py_enabled))
+        return NULL;
+
+    enabled = PyObject_IsTrue (py_enabled);
+    if (enabled < 0)
+        return NULL;
+
+    _pygi_array_buffers_default = enabled;
+
+    Py_RETURN_NONE;
+}
+
 static PyMethodDef _gi_functions[] = {
     { "enum_add", (PyCFunction) _wrap_pyg_enum_add, METH_VARARGS | METH_KEYWORDS },
     { "enum_register_new_gtype_and_add", (PyCFunction) _wrap_pyg_enum_register_new_gtype_and_add, METH_VARARGS | METH_KEYWORDS },
@@ -465,6 +483,11 @@ static PyMethodDef _gi_functions[] = {
     { "hook_up_vfunc_implementation", (PyCFunction) _wrap_pyg_hook_up_vfunc_implementation, METH_VARARGS },
     { "variant_new_tuple", (PyCFunction) _wrap_pyg_variant_new_tuple, METH_VARARGS },
     { "variant_type_from_string", (PyCFunction) _wrap_pyg_variant_type_from_string, METH_VARARGS },
+    { "set_array_buffers", (PyCFunction) _wrap_pyg_set_array_buffers, METH_VARARGS },
+    { "set_string_cache_size", (PyCFunction) _wrap_pyg_set_string_cache_size, METH_VARARGS },
+    { "get_string_cache_info", (PyCFunction) _wrap_pyg_get_string_cache_info, METH_NOARGS },
+    { "get_info_count", (PyCFunction) _wrap_pyg_get_info_count, METH_NOARGS },
+    { "get_callable_cache_info", (PyCFunction) _wrap_pyg_get_callable_cache_info, METH_NOARGS },
     { NULL, NULL, 0 }
 };
 
@@ -493,6 +516,7 @@ PYGLIB_MODULE_START(_gi, "_gi")
     _pygi_struct_register_types (module);
     _pygi_boxed_register_types (module);
     _pygi_ccallback_register_types (module);
+    _pygi_array_buffer_register_types (module);
     _pygi_argument_init();
 
     api = PYGLIB_CPointer_WrapPointer ( (void *) &CAPI, "gi._API");
@@ -35,6 +35,9 @@ except AttributeError:
     from string import maketrans
 
 import gi
+from . import cache
+from . import profiler
+from . import snapshot
 from .overrides import registry
 
 from ._gi import \
@@ -57,44 +60,94 @@ from ._gi import \
     flags_register_new_gtype_and_add
 from .types import \
     GObjectMeta, \
-    StructMeta, \
-    Function
+    StructMeta
 
 repository = Repository.get_default()
 
 
+def _get_bases_names(object_info):
+    """Return the (namespace, name, type name) of the parent, or None, and
+    the list of (namespace, name, type name) of the interfaces of
+    object_info."""
+    def get_names():
+        parent_object_info = object_info.get_parent()
+        if parent_object_info:
+            parent = (parent_object_info.get_namespace(),
+                      parent_object_info.get_name(),
+                      parent_object_info.get_type_name())
+        else:
+            parent = None
+
+        interfaces = [(interface_info.get_namespace(),
+                       interface_info.get_name(),
+                       interface_info.get_type_name())
+                      for interface_info in object_info.get_interfaces()]
+        return parent, interfaces
+
+    return cache.lookup(object_info.get_namespace(), 'base_types',
+                        object_info.get_name(), get_names)
+
+
+def _get_wrapper(namespace, name, type_name):
+    """Return the wrapper of namespace.name, found through its GType when it
+    has already been created."""
+    if type_name is not None:
+        try:
+            wrapper = _gobject.GType.from_name(type_name).pytype
+        except RuntimeError:
+            wrapper = None
+        if wrapper is not None:
+            return wrapper
+
+    module = sys.modules.get('gi.repository.' + namespace)
+    if module is None:
+        module = __import__('gi.repository.%s' % namespace, fromlist=[name])
+    return getattr(module, name)
+
+
 def get_parent_for_object(object_info):
-    parent_object_info = object_info.get_parent()
+    parent = _get_bases_names(object_info)[0]
 
-    if not parent_object_info:
+    if not parent:
         return object
 
-    namespace = parent_object_info.get_namespace()
-    name = parent_object_info.get_name()
+    namespace, name, type_name = parent
 
     # Workaround for GObject.Object and GObject.InitiallyUnowned.
     if namespace == 'GObject' and name == 'Object' or name == 'InitiallyUnowned':
         return _gobject.GObject
 
-    module = __import__('gi.repository.%s' % namespace, fromlist=[name])
-    return getattr(module, name)
+    return _get_wrapper(namespace, name, type_name)
 
 
 def get_interfaces_for_object(object_info):
-    interfaces = []
-    for interface_info in object_info.get_interfaces():
-        namespace = interface_info.get_namespace()
-        name = interface_info.get_name()
+    return [_get_wrapper(namespace, name, type_name)
+            for namespace, name, type_name in _get_bases_names(object_info)[1]]
 
-        module = __import__('gi.repository.%s' % namespace, fromlist=[name])
-        interfaces.append(getattr(module, name))
-    return interfaces
+
+def _get_enum_values(info):
+    """Return the list of (attribute name, value) of the values of the enum
+    or flags info."""
+    def get_values():
+        # Don't use upper() here to avoid locale specific
+        # identifier conversion (e. g. in Turkish 'i'.upper() == 'i')
+        # see https://bugzilla.gnome.org/show_bug.cgi?id=649165
+        ascii_upper_trans = maketrans(
+            'abcdefgjhijklmnopqrstuvwxyz',
+            'ABCDEFGJHIJKLMNOPQRSTUVWXYZ')
+        return [(value_info.get_name_unescaped().translate(ascii_upper_trans),
+                 value_info.get_value())
+                for value_info in info.get_values()]
+
+    return cache.lookup(info.get_namespace(), 'enums', info.get_name(),
+                        get_values)
 
 
 class IntrospectionModule(object):
 
     def __init__(self, namespace, version=None):
-        repository.require(namespace, version)
+        with profiler.measure('require', namespace):
+            repository.require(namespace, version)
         self._namespace = namespace
         self._version = version
         self.__name__ = 'gi.repository.' + namespace
@@ -109,11 +162,16 @@ class IntrospectionModule(object):
             self._version = repository.get_version(self._namespace)
 
     def __getattr__(self, name):
+        with profiler.measure('getattr', self._namespace, name):
+            return self._create_wrapper(name)
+
+    def _create_wrapper(self, name):
         info = repository.find_by_name(self._namespace, name)
         if not info:
             raise AttributeError("%r object has no attribute %r" % (
                                  self.__name__, name))
 
+        g_type = None
         if isinstance(info, EnumInfo):
             g_type = info.get_g_type()
             wrapper = g_type.pytype
@@ -135,18 +193,10 @@ class IntrospectionModule(object):
                 wrapper.__info__ = info
                 wrapper.__module__ = 'gi.repository.' + info.get_namespace()
 
-                # Don't use upper() here to avoid locale specific
-                # identifier conversion (e. g. in Turkish 'i'.upper() == 'i')
-                # see https://bugzilla.gnome.org/show_bug.cgi?id=649165
-                ascii_upper_trans = maketrans(
-                    'abcdefgjhijklmnopqrstuvwxyz',
-                    'ABCDEFGJHIJKLMNOPQRSTUVWXYZ')
-                for value_info in info.get_values():
-                    value_name = value_info.get_name_unescaped().translate(ascii_upper_trans)
-                    setattr(wrapper, value_name, wrapper(value_info.get_value()))
-
-            if g_type != _gobject.TYPE_NONE:
-                g_type.pytype = wrapper
+                # The value attributes are created on first access by the
+                # GEnum/GFlags metaclass, see pyg_enum_meta_getattro().
+                with profiler.measure('enum', self._namespace, name):
+                    wrapper.__lazy_values__ = dict(_get_enum_values(info))
 
         elif isinstance(info, RegisteredTypeInfo):
             g_type = info.get_g_type()
@@ -192,18 +242,22 @@ class IntrospectionModule(object):
             }
             wrapper = metaclass(name, bases, dict_)
 
-            # Register the new Python wrapper.
-            if g_type != _gobject.TYPE_NONE:
-                g_type.pytype = wrapper
-
         elif isinstance(info, FunctionInfo):
-            wrapper = Function(info)
+            # FunctionInfo objects are directly callable
+            wrapper = info
         elif isinstance(info, ConstantInfo):
             wrapper = info.get_value()
         else:
             raise NotImplementedError(info)
 
-        self.__dict__[name] = wrapper
+        # Another thread may have created the same wrapper meanwhile, e.g.
+        # gi.warmup(), only register the first one.
+        wrapper = self.__dict__.setdefault(name, wrapper)
+
+        # Register the new Python wrapper.
+        if g_type is not None and g_type != _gobject.TYPE_NONE:
+            g_type.pytype = wrapper
+
         return wrapper
 
     def __repr__(self):
@@ -234,24 +288,29 @@ class DynamicModule(types.ModuleType):
         self._namespace = namespace
         self._introspection_module = None
         self._overrides_module = None
+        self._override_exports = frozenset()
+        self._loaded = False
         self.__path__ = None
 
     def _load(self):
         version = gi.get_required_version(self._namespace)
         self._introspection_module = IntrospectionModule(self._namespace,
                                                          version)
+        snapshot.load(self._namespace, self._introspection_module._version)
 
-        overrides_modules = __import__('gi.overrides', fromlist=[self._namespace])
+        with profiler.measure('overrides', self._namespace):
+            overrides_modules = __import__('gi.overrides', fromlist=[self._namespace])
         self._overrides_module = getattr(overrides_modules, self._namespace, None)
+        self._override_exports = frozenset(getattr(self._overrides_module, '__all__', ()))
         self.__path__ = repository.get_typelib_path(self._namespace)
         if _have_py3:
             # get_typelib_path() delivers bytes, not a string
             self.__path__ = self.__path__.decode('UTF-8')
+        self._loaded = True
 
-    def __getattr__(self, name):
+    def _resolve(self, name):
         if self._overrides_module is not None:
-            override_exports = getattr(self._overrides_module, '__all__', ())
-            if name in override_exports:
+            if name in self._override_exports:
                 return getattr(self._overrides_module, name, None)
         else:
             # check the registry just in case the module hasn't loaded yet
@@ -265,6 +324,21 @@ class DynamicModule(types.ModuleType):
 
         return getattr(self._introspection_module, name)
 
+    def _cache(self, name, attr):
+        # Only cache once the overrides module is known, attributes looked up
+        # while it is being imported may still get overridden.
+        if self._loaded and attr is not None:
+            self.__dict__[name] = attr
+        return attr
+
+    def _invalidate(self, name):
+        """Drop a cached attribute, e.g. after an override got registered
+        for it once the module was already loaded."""
+        self.__dict__.pop(name, None)
+
+    def __getattr__(self, name):
+        return self._cache(name, self._resolve(name))
+
     def __dir__(self):
         # Python's default dir() is just dir(self.__class__) + self.__dict__.keys()
         result = set(dir(self.__class__))
@@ -314,9 +388,9 @@ class DynamicGObjectModule(DynamicModule):
 
         # if not in module assume request for an attr exported through GI
         if attr is None:
-            attr = super(DynamicGObjectModule, self).__getattr__(name)
+            attr = super(DynamicGObjectModule, self)._resolve(name)
 
-        return attr
+        return self._cache(name, attr)
 
 
 class DynamicGLibModule(DynamicModule):
@@ -341,6 +415,6 @@ class DynamicGLibModule(DynamicModule):
 
         # if not in module assume request for an attr exported through GI
         if attr is None:
-            attr = super(DynamicGLibModule, self).__getattr__(name)
+            attr = super(DynamicGLibModule, self)._resolve(name)
 
-        return attr
+        return self._cache(name, attr)
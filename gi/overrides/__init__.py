@@ -1,6 +1,7 @@
 import types
 
 from gi import _gobject
+from gi._gi import FunctionInfo
 from pkgutil import extend_path
 
 registry = None
@@ -9,6 +10,15 @@ __path__ = extend_path(__path__, __name__)
 print __path__, __name__
 
 
+def _invalidate_module_attr(namespace, name):
+    '''Drop the attribute cached by the DynamicModule of namespace, so the
+    override registered for it is picked up on the next lookup.'''
+    from ..importer import modules
+    module = modules.get(namespace)
+    if module is not None:
+        module._invalidate(name)
+
+
 class _Registry(dict):
     def __setitem__(self, key, value):
         '''We do checks here to make sure only submodules of the override
@@ -39,6 +49,7 @@ class _Registry(dict):
             module = value.__module__[13:]
             key = "%s.%s" % (module, value.__name__)
             super(_Registry, self).__setitem__(key, value)
+            _invalidate_module_attr(module, value.__name__)
 
     def register(self, override_class):
         self[override_class] = override_class
@@ -57,6 +68,7 @@ class overridefunc(object):
             return func(*args, **kwargs)
         wrapper.__name__ = func.__name__
         setattr(self.module, func.__name__, wrapper)
+        _invalidate_module_attr(self.module._namespace, func.__name__)
         return wrapper
 
 registry = _Registry()
@@ -64,7 +76,7 @@ registry = _Registry()
 
 def override(type_):
     '''Decorator for registering an override'''
-    if isinstance(type_, types.FunctionType):
+    if isinstance(type_, (types.FunctionType, FunctionInfo)):
         return overridefunc(type_)
     else:
         registry.register(type_)
@@ -0,0 +1,91 @@
+# -*- Mode: Python; py-indent-offset: 4 -*-
+# vim: tabstop=4 shiftwidth=4 expandtab
+#
+#   preload.py: load namespaces and build wrappers ahead of their first use.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+"""Warm-up of namespaces, wrapper classes and callable caches.
+
+The first call of a function or method builds the cache describing how to
+marshal its arguments, and the first access to a class creates its wrapper.
+warmup() does this work ahead of time, by default on a background thread
+while the application keeps initializing:
+
+    gi.require_version('Gtk', '3.0')
+    gi.warmup(namespaces=['Gtk'],
+              classes=['Gtk.FileChooserDialog', 'Gtk.TreeView'])
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+from ._gi import \
+    FunctionInfo, \
+    VFuncInfo
+
+
+def _import_namespace(namespace):
+    module = __import__('gi.repository', fromlist=[namespace])
+    return getattr(module, namespace)
+
+
+def _build_caches(info):
+    for method_info in getattr(info, 'get_methods', tuple)():
+        method_info.build_cache()
+    for vfunc_info in getattr(info, 'get_vfuncs', tuple)():
+        vfunc_info.build_cache()
+
+
+def _warmup(namespaces, classes):
+    for namespace in namespaces:
+        _import_namespace(namespace)
+
+    for qualified_name in classes:
+        namespace, name = qualified_name.split('.', 1)
+        wrapper = getattr(_import_namespace(namespace), name)
+
+        info = getattr(wrapper, '__info__', None)
+        if isinstance(info, (FunctionInfo, VFuncInfo)):
+            info.build_cache()
+        elif info is not None:
+            _build_caches(info)
+
+
+def warmup(namespaces=(), classes=(), in_thread=True):
+    """Import the namespaces, create the wrappers of classes and build the
+    callable caches of their methods and vfuncs.
+
+    namespaces is a list of namespace names, loaded in the versions given to
+    gi.require_version(). classes is a list of qualified names such as
+    'Gtk.Window', which can also name functions.
+
+    With in_thread, the work is done on a daemon thread, which is started
+    and returned. Otherwise it is done before returning None.
+    """
+    namespaces = list(namespaces)
+    classes = list(classes)
+
+    if not in_thread:
+        _warmup(namespaces, classes)
+        return None
+
+    thread = threading.Thread(target=_warmup, args=(namespaces, classes),
+                              name='gi-warmup')
+    thread.daemon = True
+    thread.start()
+    return thread
@@ -0,0 +1,198 @@
+# -*- Mode: Python; py-indent-offset: 4 -*-
+# vim: tabstop=4 shiftwidth=4 expandtab
+#
+#   profiler.py: time spent importing namespaces and creating wrappers.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+"""Profiler for gi.repository imports and wrapper creation.
+
+    with gi.profile_imports() as profile:
+        from gi.repository import Gtk
+        Gtk.Window
+    profile.report()
+
+Setting the PYGOBJECT_PROFILE_IMPORTS environment variable to a non-empty
+value profiles the whole process and prints the report to stderr at exit.
+
+Each entry is identified by a category and a namespace or class name:
+
+    require    loading the typelib with Repository.require()
+    overrides  importing the overrides module of a namespace
+    getattr    IntrospectionModule.__getattr__()
+    enum       creating the values of an enum or flags wrapper
+    class      GObjectMeta.__init__() and StructMeta.__init__(), by module
+               and class name
+
+For each entry, the report gives the number of calls, the total time, the
+time not spent in other entries, and the number of info objects and members
+(methods, constructors, vfuncs, fields and constants) created in it.
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import os
+import sys
+import time
+
+from ._gi import get_info_count
+
+try:
+    _timer = time.perf_counter
+except AttributeError:
+    # fallback for Python 2
+    if sys.platform == 'win32':
+        _timer = time.clock
+    else:
+        _timer = time.time
+
+# the ImportProfile currently recording, if any
+_active = None
+
+
+class ProfileEntry(object):
+    __slots__ = ('calls', 'total_time', 'self_time', 'infos', 'members')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.infos = 0
+        self.members = 0
+
+
+class _Measure(object):
+    __slots__ = ('profile', 'key', 'start_time', 'start_infos',
+                 'start_members', 'child_time', 'child_infos', 'child_members')
+
+    def __init__(self, profile, key):
+        self.profile = profile
+        self.key = key
+
+    def __enter__(self):
+        self.child_time = 0.0
+        self.child_infos = 0
+        self.child_members = 0
+        self.start_infos = get_info_count()
+        self.start_members = self.profile.n_members
+        self.profile._stack.append(self)
+        self.start_time = _timer()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = _timer() - self.start_time
+        profile = self.profile
+        infos = get_info_count() - self.start_infos
+        members = profile.n_members - self.start_members
+
+        profile._stack.pop()
+        if profile._stack:
+            parent = profile._stack[-1]
+            parent.child_time += elapsed
+            parent.child_infos += infos
+            parent.child_members += members
+
+        entry = profile.entries.get(self.key)
+        if entry is None:
+            entry = profile.entries[self.key] = ProfileEntry()
+        entry.calls += 1
+        entry.total_time += elapsed
+        entry.self_time += elapsed - self.child_time
+        entry.infos += infos - self.child_infos
+        entry.members += members - self.child_members
+
+
+class _NullMeasure(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+_null_measure = _NullMeasure()
+
+
+class ImportProfile(object):
+    """Timings recorded by profile_imports(), in the entries dict mapping
+    (category, name) to ProfileEntry objects."""
+
+    def __init__(self):
+        self.entries = {}
+        self.n_members = 0
+        self._stack = []
+
+    def report(self, file=None, limit=None):
+        """Print the entries sorted by self time to file, sys.stderr by
+        default, limited to the first limit entries if given."""
+        if file is None:
+            file = sys.stderr
+
+        items = sorted(self.entries.items(),
+                       key=lambda item: item[1].self_time, reverse=True)
+        if limit is not None:
+            items = items[:limit]
+
+        file.write('%-10s %-40s %6s %10s %10s %7s %7s\n' %
+                   ('category', 'name', 'calls', 'total ms', 'self ms',
+                    'infos', 'members'))
+        for (category, name), entry in items:
+            file.write('%-10s %-40s %6d %10.3f %10.3f %7d %7d\n' %
+                       (category, name, entry.calls,
+                        entry.total_time * 1000, entry.self_time * 1000,
+                        entry.infos, entry.members))
+
+
+def measure(category, namespace, name=None):
+    """Return a context manager recording the time spent in it under
+    category for namespace or namespace.name, which does nothing unless a
+    profile is active."""
+    if _active is None:
+        return _null_measure
+    if name is not None:
+        namespace = '%s.%s' % (namespace, name)
+    return _Measure(_active, (category, namespace))
+
+
+def add_member():
+    """Count a member created for a wrapper class."""
+    if _active is not None:
+        _active.n_members += 1
+
+
+class profile_imports(object):
+    """Context manager recording an ImportProfile of the gi.repository
+    imports and wrappers created in its block."""
+
+    def __init__(self):
+        self.profile = ImportProfile()
+        self._previous = None
+
+    def __enter__(self):
+        global _active
+        self._previous = _active
+        _active = self.profile
+        return self.profile
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active
+        _active = self._previous
+
+
+if os.environ.get('PYGOBJECT_PROFILE_IMPORTS'):
+    _active = ImportProfile()
+    atexit.register(_active.report)
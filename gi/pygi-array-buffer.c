@@ -0,0 +1,161 @@
+/* -*- Mode: C; c-basic-offset: 4 -*-
+ * vim: tabstop=4 shiftwidth=4 expandtab
+ *
+ *   pygi-array-buffer.c: read-only buffers over numeric C arrays.
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 2.1 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library; if not, write to the Free Software
+ * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301
+ * USA
+ */
+
+#include "pygi-private.h"
+
+#include <pyglib-python-compat.h>
+
+/* Numeric arrays coming out of C are normally turned into a list of python
+ * numbers. When array buffers are enabled for a callable (see
+ * FunctionInfo.array_buffers and gi.set_array_buffers()) they are returned
+ * as a memoryview over an ArrayBuffer instead, which owns one g_malloc'ed
+ * block holding the items in their C representation.
+ */
+
+typedef struct {
+    PyObject_HEAD
+    gpointer data;
+    Py_ssize_t n_items;
+    Py_ssize_t item_size;
+    const gchar *format;
+} PyGIArrayBuffer;
+
+gboolean _pygi_array_buffers_default = FALSE;
+
+PYGLIB_DEFINE_TYPE ("gi.ArrayBuffer", PyGIArrayBuffer_Type, PyGIArrayBuffer);
+
+/* struct module format of the items, NULL if the type can't be exposed */
+const gchar *
+_pygi_array_buffer_format (GITypeTag type_tag)
+{
+    switch (type_tag) {
+        case GI_TYPE_TAG_INT8:
+            return "b";
+        case GI_TYPE_TAG_UINT8:
+            return "B";
+        case GI_TYPE_TAG_INT16:
+            return "h";
+        case GI_TYPE_TAG_UINT16:
+            return "H";
+        case GI_TYPE_TAG_INT32:
+            return "i";
+        case GI_TYPE_TAG_UINT32:
+            return "I";
+        case GI_TYPE_TAG_INT64:
+            return "q";
+        case GI_TYPE_TAG_UINT64:
+            return "Q";
+        case GI_TYPE_TAG_FLOAT:
+            return "f";
+        case GI_TYPE_TAG_DOUBLE:
+            return "d";
+        default:
+            return NULL;
+    }
+}
+
+/* Takes ownership of data */
+PyObject *
+_pygi_array_buffer_new (gpointer     data,
+                        gsize        n_items,
+                        gsize        item_size,
+                        const gchar *format)
+{
+    PyGIArrayBuffer *self;
+
+    self = PyObject_New (PyGIArrayBuffer, &PyGIArrayBuffer_Type);
+    if (self == NULL) {
+        g_free (data);
+        return NULL;
+    }
+
+    self->data = data;
+    self->n_items = n_items;
+    self->item_size = item_size;
+    self->format = format;
+
+    return (PyObject *) self;
+}
+
+static void
+_array_buffer_dealloc (PyGIArrayBuffer *self)
+{
+    g_free (self->data);
+
+    PyObject_Del (self);
+}
+
+static Py_ssize_t
+_array_buffer_length (PyGIArrayBuffer *self)
+{
+    return self->n_items;
+}
+
+static int
+_array_buffer_get_buffer (PyGIArrayBuffer *self, Py_buffer *view, int flags)
+{
+    if (flags & PyBUF_WRITABLE) {
+        PyErr_SetString (PyExc_BufferError, "ArrayBuffer is read-only");
+        view->obj = NULL;
+        return -1;
+    }
+
+    Py_INCREF (self);
+    view->obj = (PyObject *) self;
+    view->buf = self->data;
+    view->len = self->n_items * self->item_size;
+    view->readonly = 1;
+    view->itemsize = self->item_size;
+    view->format = (flags & PyBUF_FORMAT) ? (char *) self->format : NULL;
+    view->ndim = 1;
+    view->shape = (flags & PyBUF_ND) ? &self->n_items : NULL;
+    view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? &view->itemsize : NULL;
+    view->suboffsets = NULL;
+    view->internal = NULL;
+
+    return 0;
+}
+
+static PySequenceMethods _array_buffer_as_sequence = {
+    (lenfunc) _array_buffer_length,
+};
+
+static PyBufferProcs _array_buffer_as_buffer;
+
+void
+_pygi_array_buffer_register_types (PyObject *m)
+{
+    _array_buffer_as_buffer.bf_getbuffer = (getbufferproc) _array_buffer_get_buffer;
+
+    Py_TYPE(&PyGIArrayBuffer_Type) = &PyType_Type;
+    PyGIArrayBuffer_Type.tp_flags = Py_TPFLAGS_DEFAULT;
+#if PY_VERSION_HEX < 0x03000000
+    PyGIArrayBuffer_Type.tp_flags |= Py_TPFLAGS_HAVE_NEWBUFFER;
+#endif
+    PyGIArrayBuffer_Type.tp_dealloc = (destructor) _array_buffer_dealloc;
+    PyGIArrayBuffer_Type.tp_as_sequence = &_array_buffer_as_sequence;
+    PyGIArrayBuffer_Type.tp_as_buffer = &_array_buffer_as_buffer;
+
+    if (PyType_Ready (&PyGIArrayBuffer_Type))
+        return;
+    if (PyModule_AddObject (m, "ArrayBuffer", (PyObject *) &PyGIArrayBuffer_Type))
+        return;
+}
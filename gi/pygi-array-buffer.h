@@ -0,0 +1,47 @@
+/* -*- Mode: C; c-basic-offset: 4 -*-
+ * vim: tabstop=4 shiftwidth=4 expandtab
+ *
+ *   pygi-array-buffer.h: read-only buffers over numeric C arrays.
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 2.1 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library; if not, write to the Free Software
+ * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301
+ * USA
+ */
+
+#ifndef __PYGI_ARRAY_BUFFER_H__
+#define __PYGI_ARRAY_BUFFER_H__
+
+#include <Python.h>
+
+#include <girepository.h>
+
+G_BEGIN_DECLS
+
+extern PyTypeObject PyGIArrayBuffer_Type;
+
+/* default for callables that don't set array_buffers themselves */
+extern gboolean _pygi_array_buffers_default;
+
+const gchar *_pygi_array_buffer_format (GITypeTag type_tag);
+
+PyObject *_pygi_array_buffer_new (gpointer     data,
+                                  gsize        n_items,
+                                  gsize        item_size,
+                                  const gchar *format);
+
+void _pygi_array_buffer_register_types (PyObject *m);
+
+G_END_DECLS
+
+#endif /* __PYGI_ARRAY_BUFFER_H__ */
@@ -19,6 +19,7 @@
  * USA
  */
 
+#include <pyglib.h>
 #include "pygi-info.h"
 #include "pygi-cache.h"
 #include "pygi-marshal-to-py.h"
@@ -120,6 +121,7 @@ _pygi_callable_cache_free (PyGICallableCache *cache)
         _pygi_arg_cache_free (cache->return_cache);
 
     g_slice_free1 (cache->n_args * sizeof (PyGIArgCache *), cache->args_cache);
+    g_free (cache->ffi_arg_types);
     g_slice_free (PyGICallableCache, cache);
 }
 
@@ -429,8 +431,22 @@ _arg_cache_to_py_gtype_setup (PyGIArgCache *arg_cache)
 
 static void
 _arg_cache_from_py_utf8_setup (PyGIArgCache *arg_cache,
-                               GITransfer transfer)
-{
+                               GITransfer transfer,
+                               PyGIDirection direction,
+                               gboolean is_item)
+{
+    /* the callee only reads the string for the duration of the call, and
+     * the arguments tuple keeps the Python string alive. Container items
+     * are only referenced by their container, the invoke state holds them
+     * instead. */
+    if (transfer == GI_TRANSFER_NOTHING && direction == PYGI_DIRECTION_FROM_PYTHON) {
+        if (is_item)
+            arg_cache->from_py_marshaller = _pygi_marshal_from_py_utf8_borrowed_item;
+        else
+            arg_cache->from_py_marshaller = _pygi_marshal_from_py_utf8_borrowed;
+        return;
+    }
+
     arg_cache->from_py_marshaller = _pygi_marshal_from_py_utf8;
     arg_cache->from_py_cleanup = _pygi_marshal_cleanup_from_py_utf8;
 }
@@ -459,6 +475,47 @@ _arg_cache_to_py_filename_setup (PyGIArgCache *arg_cache,
     arg_cache->to_py_cleanup = _pygi_marshal_cleanup_to_py_utf8;
 }
 
+/* Pick the array marshaller specialized for how items are stored so the
+ * per item loop doesn't have to work it out again */
+static PyGIMarshalFromPyFunc
+_array_from_py_marshaller_for_items (PyGISequenceCache *seq_cache)
+{
+    PyGIArgCache *item_cache = seq_cache->item_cache;
+    PyGIMarshalFromPyFunc marshaller = _pygi_marshal_from_py_array;
+
+    if (seq_cache->array_type == GI_ARRAY_TYPE_PTR_ARRAY)
+        return _pygi_marshal_from_py_ptr_array;
+
+    if (item_cache->type_tag == GI_TYPE_TAG_INTERFACE) {
+        GIBaseInfo *interface_info = g_type_info_get_interface (item_cache->type_info);
+        GIInfoType info_type = g_base_info_get_type (interface_info);
+
+        if (info_type == GI_INFO_TYPE_STRUCT || info_type == GI_INFO_TYPE_UNION) {
+            PyGIInterfaceCache *iface_cache = (PyGIInterfaceCache *)item_cache;
+
+            if (iface_cache->g_type == G_TYPE_VALUE) {
+                marshaller = _pygi_marshal_from_py_array_of_gvalues;
+            } else if (iface_cache->g_type == G_TYPE_VARIANT ||
+                       g_type_is_a (iface_cache->g_type, G_TYPE_BOXED)) {
+                /* GVariants are opaque and boxed types are stored as
+                 * pointers, like everything else */
+            } else if (g_strcmp0 (iface_cache->type_name, "Gdk.Atom") == 0) {
+                /* HACK: Gdk.Atom is merely an integer wrapped in a pointer,
+                 * so we must not dereference it; just copy the pointer
+                 * value, and don't attempt to free it. TODO: find out
+                 * if there are other data types with similar behaviour
+                 * and generalize. */
+            } else {
+                marshaller = _pygi_marshal_from_py_array_of_structs;
+            }
+        }
+
+        g_base_info_unref (interface_info);
+    }
+
+    return marshaller;
+}
+
 static gboolean
 _arg_cache_from_py_array_setup (PyGIArgCache *arg_cache,
                                 PyGICallableCache *callable_cache,
@@ -470,7 +527,8 @@ _arg_cache_from_py_array_setup (PyGIArgCache *arg_cache,
     PyGISequenceCache *seq_cache = (PyGISequenceCache *)arg_cache;
     seq_cache->array_type = g_type_info_get_array_type (type_info);
 
-    arg_cache->from_py_marshaller = _pygi_marshal_from_py_array;
+    arg_cache->from_py_marshaller =
+        _array_from_py_marshaller_for_items (seq_cache);
 
     if (seq_cache->len_arg_index >= 0) {
         PyGIArgCache *child_cache = 
@@ -1038,7 +1096,9 @@ _arg_cache_new (GITypeInfo *type_info,
                break;
 
            if (direction == PYGI_DIRECTION_FROM_PYTHON || direction == PYGI_DIRECTION_BIDIRECTIONAL)
-               _arg_cache_from_py_utf8_setup (arg_cache, transfer);
+               /* items of containers are created without a callable cache */
+               _arg_cache_from_py_utf8_setup (arg_cache, transfer, direction,
+                                              callable_cache == NULL);
 
            if (direction == PYGI_DIRECTION_TO_PYTHON || direction == PYGI_DIRECTION_BIDIRECTIONAL)
                _arg_cache_to_py_utf8_setup (arg_cache, transfer);
@@ -1224,6 +1284,8 @@ _arg_name_list_generate (PyGICallableCache *callable_cache)
         g_hash_table_remove_all (callable_cache->arg_name_hash);
     }
 
+    callable_cache->n_arg_names = 0;
+
     for (i=0; i < callable_cache->n_args; i++) {
         PyGIArgCache *arg_cache = NULL;
 
@@ -1237,6 +1299,7 @@ _arg_name_list_generate (PyGICallableCache *callable_cache)
             gpointer arg_name = (gpointer)arg_cache->arg_name;
 
             arg_name_list = g_slist_prepend (arg_name_list, arg_name);
+            callable_cache->n_arg_names++;
             if (arg_name != NULL) {
                 g_hash_table_insert (callable_cache->arg_name_hash, arg_name, arg_name);
             }
@@ -1445,6 +1508,165 @@ arg_err:
     return TRUE;
 }
 
+/* Prepare the libffi call interface for invoking the callable from python.
+ * This mirrors the argument layout used by g_callable_info_invoke() but is
+ * done once per callable instead of on every call. */
+static gboolean
+_invoker_prep (GICallableInfo *callable_info,
+               PyGICallableCache *callable_cache)
+{
+    GITypeInfo *return_info;
+    ffi_type *return_type;
+    gssize n_invoke_args;
+    gssize arg_index = 0;
+    gssize i;
+
+    /* callbacks are invoked from C, never by us */
+    if (callable_cache->function_type == PYGI_FUNCTION_TYPE_CALLBACK)
+        return TRUE;
+
+    if (g_base_info_get_type ( (GIBaseInfo *)callable_info) == GI_INFO_TYPE_FUNCTION) {
+        GIFunctionInfo *function_info = (GIFunctionInfo *)callable_info;
+        const gchar *symbol = g_function_info_get_symbol (function_info);
+
+        callable_cache->throws =
+            (g_function_info_get_flags (function_info) & GI_FUNCTION_THROWS) != 0;
+
+        if (!g_typelib_symbol (g_base_info_get_typelib ( (GIBaseInfo *)callable_info),
+                               symbol,
+                               &callable_cache->function_ptr)) {
+            GError *error = NULL;
+
+            g_set_error (&error,
+                         G_INVOKE_ERROR,
+                         G_INVOKE_ERROR_SYMBOL_NOT_FOUND,
+                         "Could not locate %s: %s", symbol, g_module_error ());
+            pyglib_error_check (&error);
+            return FALSE;
+        }
+    }
+
+    n_invoke_args = callable_cache->n_args;
+    if (callable_cache->throws)
+        n_invoke_args++;
+
+    callable_cache->ffi_arg_types = g_new0 (ffi_type *, n_invoke_args + 1);
+
+    if (callable_cache->function_type == PYGI_FUNCTION_TYPE_METHOD ||
+            callable_cache->function_type == PYGI_FUNCTION_TYPE_VFUNC) {
+        callable_cache->ffi_arg_types[arg_index] = &ffi_type_pointer;
+        arg_index++;
+    }
+
+    for (i = 0; arg_index < callable_cache->n_args; arg_index++, i++) {
+        GIArgInfo *arg_info = g_callable_info_get_arg (callable_info, i);
+
+        if (g_arg_info_get_direction (arg_info) == GI_DIRECTION_IN) {
+            GITypeInfo *type_info = g_arg_info_get_type (arg_info);
+            callable_cache->ffi_arg_types[arg_index] = g_type_info_get_ffi_type (type_info);
+            g_base_info_unref ( (GIBaseInfo *)type_info);
+        } else {
+            callable_cache->ffi_arg_types[arg_index] = &ffi_type_pointer;
+        }
+
+        g_base_info_unref ( (GIBaseInfo *)arg_info);
+    }
+
+    if (callable_cache->throws)
+        callable_cache->ffi_arg_types[arg_index] = &ffi_type_pointer;
+
+    return_info = g_callable_info_get_return_type (callable_info);
+    return_type = g_type_info_get_ffi_type (return_info);
+    g_base_info_unref ( (GIBaseInfo *)return_info);
+
+    if (ffi_prep_cif (&callable_cache->cif,
+                      FFI_DEFAULT_ABI,
+                      n_invoke_args,
+                      return_type,
+                      callable_cache->ffi_arg_types) != FFI_OK) {
+        PyErr_Format (PyExc_RuntimeError,
+                      "Could not prepare the call interface for %s",
+                      callable_cache->name);
+        return FALSE;
+    }
+
+    return TRUE;
+}
+
+static gboolean
+_arg_cache_is_scalar (PyGIArgCache *arg_cache)
+{
+    if (arg_cache->is_pointer)
+        return FALSE;
+
+    switch (arg_cache->type_tag) {
+        case GI_TYPE_TAG_VOID:
+        case GI_TYPE_TAG_BOOLEAN:
+        case GI_TYPE_TAG_INT8:
+        case GI_TYPE_TAG_UINT8:
+        case GI_TYPE_TAG_INT16:
+        case GI_TYPE_TAG_UINT16:
+        case GI_TYPE_TAG_INT32:
+        case GI_TYPE_TAG_UINT32:
+        case GI_TYPE_TAG_INT64:
+        case GI_TYPE_TAG_UINT64:
+        case GI_TYPE_TAG_FLOAT:
+        case GI_TYPE_TAG_DOUBLE:
+        case GI_TYPE_TAG_UNICHAR:
+        case GI_TYPE_TAG_GTYPE:
+            return TRUE;
+        case GI_TYPE_TAG_INTERFACE:
+        {
+            GIBaseInfo *interface_info;
+            GIInfoType info_type;
+
+            interface_info = g_type_info_get_interface (arg_cache->type_info);
+            info_type = g_base_info_get_type (interface_info);
+            g_base_info_unref (interface_info);
+
+            return info_type == GI_INFO_TYPE_ENUM ||
+                   info_type == GI_INFO_TYPE_FLAGS;
+        }
+        default:
+            return FALSE;
+    }
+}
+
+/* A callable is scalar when the instance (if any), every argument and the
+ * return value are plain values that need no cleanup. Batches of such
+ * calls can be marshalled up front and invoked without the GIL, see
+ * pygi_callable_info_invoke_many(). */
+static gboolean
+_callable_cache_is_scalar (PyGICallableCache *callable_cache)
+{
+    gssize i = 0;
+
+    if (callable_cache->function_type != PYGI_FUNCTION_TYPE_FUNCTION &&
+            callable_cache->function_type != PYGI_FUNCTION_TYPE_METHOD)
+        return FALSE;
+
+    if (callable_cache->throws)
+        return FALSE;
+
+    if (!_arg_cache_is_scalar (callable_cache->return_cache))
+        return FALSE;
+
+    /* the instance is borrowed for the duration of the batch */
+    if (callable_cache->function_type == PYGI_FUNCTION_TYPE_METHOD)
+        i++;
+
+    for (; i < callable_cache->n_args; i++) {
+        PyGIArgCache *arg_cache = callable_cache->args_cache[i];
+
+        if (arg_cache->meta_type != PYGI_META_ARG_TYPE_PARENT ||
+                arg_cache->is_caller_allocates ||
+                !_arg_cache_is_scalar (arg_cache))
+            return FALSE;
+    }
+
+    return TRUE;
+}
+
 PyGICallableCache *
 _pygi_callable_cache_new (GICallableInfo *callable_info, gboolean is_ccallback)
 {
@@ -1491,8 +1713,80 @@ _pygi_callable_cache_new (GICallableInfo *callable_info, gboolean is_ccallback)
     if (!_args_cache_generate (callable_info, cache))
         goto err;
 
+    if (!_invoker_prep (callable_info, cache))
+        goto err;
+
+    cache->is_scalar = _callable_cache_is_scalar (cache);
+
     return cache;
 err:
     _pygi_callable_cache_free (cache);
     return NULL;
 }
+
+/* Process wide registry of the callable caches used by the info objects.
+ * Several PyGIBaseInfo objects can wrap the same callable, as
+ * find_by_name(), get_methods() and get_vfuncs() create new ones, so the
+ * caches are keyed by the identity of the callable in its typelib and
+ * shared. They are never freed, like the typelibs they describe. */
+static GHashTable *_callable_cache_registry = NULL;
+static guint64 _callable_cache_builds = 0;
+static guint64 _callable_cache_hits = 0;
+
+static gchar *
+_callable_cache_registry_key (GICallableInfo *callable_info)
+{
+    GIBaseInfo *info = (GIBaseInfo *) callable_info;
+    GIBaseInfo *container = g_base_info_get_container (info);
+
+    return g_strdup_printf ("%d:%s.%s.%s",
+                            g_base_info_get_type (info),
+                            g_base_info_get_namespace (info),
+                            container != NULL ? g_base_info_get_name (container) : "",
+                            g_base_info_get_name (info));
+}
+
+PyGICallableCache *
+_pygi_callable_cache_get (GICallableInfo *callable_info)
+{
+    PyGICallableCache *cache;
+    gchar *key;
+
+    if (_callable_cache_registry == NULL)
+        _callable_cache_registry = g_hash_table_new_full (g_str_hash,
+                                                          g_str_equal,
+                                                          g_free,
+                                                          NULL);
+
+    key = _callable_cache_registry_key (callable_info);
+    cache = g_hash_table_lookup (_callable_cache_registry, key);
+    if (cache != NULL) {
+        _callable_cache_hits++;
+        g_free (key);
+        return cache;
+    }
+
+    cache = _pygi_callable_cache_new (callable_info, FALSE);
+    if (cache == NULL) {
+        g_free (key);
+        return NULL;
+    }
+
+    _callable_cache_builds++;
+    g_hash_table_insert (_callable_cache_registry, key, cache);
+    return cache;
+}
+
+PyObject *
+_wrap_pyg_get_callable_cache_info (PyObject *self)
+{
+    guint size = 0;
+
+    if (_callable_cache_registry != NULL)
+        size = g_hash_table_size (_callable_cache_registry);
+
+    return Py_BuildValue ("{sKsKsI}",
+                          "builds", (unsigned PY_LONG_LONG) _callable_cache_builds,
+                          "hits", (unsigned PY_LONG_LONG) _callable_cache_hits,
+                          "size", size);
+}
@@ -24,6 +24,7 @@
 
 #include <Python.h>
 #include <girepository.h>
+#include <girffi.h>
 
 #include "pygi-invoke-state-struct.h"
 
@@ -87,6 +88,16 @@ typedef enum {
     PYGI_FUNCTION_TYPE_CCALLBACK,
  } PyGIFunctionType;
 
+/*
+ * Whether numeric arrays returned to python become memoryviews instead of
+ * lists, see pygi-array-buffer.c
+ */
+typedef enum {
+    PYGI_ARRAY_BUFFERS_DEFAULT,
+    PYGI_ARRAY_BUFFERS_ENABLED,
+    PYGI_ARRAY_BUFFERS_DISABLED
+} PyGIArrayBuffers;
+
 /*
  * In PyGI IN and OUT arguments mean different things depending on the context
  * of the callable (e.g. is it a callback that is being called from C or a
@@ -176,6 +187,7 @@ struct _PyGICallableCache
     GSList *to_py_args;
     GSList *arg_name_list; /* for keyword arg matching */
     GHashTable *arg_name_hash;
+    gssize n_arg_names; /* length of arg_name_list */
 
     /* counts */
     gssize n_from_py_args;
@@ -184,6 +196,20 @@ struct _PyGICallableCache
 
     gssize n_args;
     gssize n_py_args;
+
+    /* libffi call interface prepared when the cache is built so invoking
+     * the callable is a single ffi_call on the marshalled arguments.
+     * function_ptr is only resolved up front for plain functions; vfuncs
+     * look it up per implementor and ccallbacks carry their own. */
+    ffi_cif cif;
+    ffi_type **ffi_arg_types;
+    gpointer function_ptr;
+    gboolean throws;
+
+    /* only plain values in and out, see _callable_cache_is_scalar() */
+    gboolean is_scalar;
+
+    PyGIArrayBuffers array_buffers;
 };
 
 void _pygi_arg_cache_clear	(PyGIArgCache *cache);
@@ -191,6 +217,9 @@ void _pygi_callable_cache_free	(PyGICallableCache *cache);
 
 PyGICallableCache *_pygi_callable_cache_new (GICallableInfo *callable_info,
                                              gboolean is_ccallback);
+PyGICallableCache *_pygi_callable_cache_get (GICallableInfo *callable_info);
+
+PyObject *_wrap_pyg_get_callable_cache_info (PyObject *self);
 
 G_END_DECLS
 
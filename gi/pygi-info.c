@@ -38,7 +38,7 @@ _base_info_dealloc (PyGIBaseInfo *self)
 
     g_base_info_unref (self->info);
 
-    _pygi_callable_cache_free(self->cache);
+    /* self->cache is shared, see _pygi_callable_cache_get() */
 
     Py_TYPE( (PyObject *) self)->tp_free ( (PyObject *) self);
 }
@@ -89,6 +89,12 @@ _base_info_richcompare (PyGIBaseInfo *self, PyObject *other, int op)
 }
 
 static PyMethodDef _PyGIBaseInfo_methods[];
+#if PY_VERSION_HEX >= 0x03090000
+static PyObject *_callable_info_vectorcall (PyGIBaseInfo *self,
+                                            PyObject *const *args,
+                                            size_t nargsf,
+                                            PyObject *kwnames);
+#endif
 
 PYGLIB_DEFINE_TYPE("gi.BaseInfo", PyGIBaseInfo_Type, PyGIBaseInfo);
 
@@ -169,6 +175,9 @@ static PyMethodDef _PyGIBaseInfo_methods[] = {
     { NULL, NULL, 0 }
 };
 
+/* Number of info objects created so far, reported by gi.profile_imports() */
+static guint64 _pygi_info_count = 0;
+
 PyObject *
 _pygi_info_new (GIBaseInfo *info)
 {
@@ -246,10 +255,22 @@ _pygi_info_new (GIBaseInfo *info)
     }
 
     self->info = g_base_info_ref (info);
+    _pygi_info_count++;
+
+#if PY_VERSION_HEX >= 0x03090000
+    if (type == &PyGIFunctionInfo_Type)
+        self->vectorcall = (vectorcallfunc) _callable_info_vectorcall;
+#endif
 
     return (PyObject *) self;
 }
 
+PyObject *
+_wrap_pyg_get_info_count (PyObject *self)
+{
+    return PyLong_FromUnsignedLongLong (_pygi_info_count);
+}
+
 GIBaseInfo *
 _pygi_object_get_gi_info (PyObject     *object,
                           PyTypeObject *type)
@@ -316,6 +337,20 @@ _wrap_g_callable_info_get_arguments (PyGIBaseInfo *self)
     return infos;
 }
 
+/* Build the callable cache of the info ahead of the first call, see
+ * gi.warmup(). */
+static PyObject *
+_wrap_g_callable_info_build_cache (PyGIBaseInfo *self)
+{
+    if (self->cache == NULL) {
+        self->cache = _pygi_callable_cache_get (self->info);
+        if (self->cache == NULL)
+            return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
 static PyMethodDef _PyGICallableInfo_methods[] = {
     { "invoke", (PyCFunction) _wrap_g_callable_info_invoke, METH_VARARGS | METH_KEYWORDS },
     { "get_arguments", (PyCFunction) _wrap_g_callable_info_get_arguments, METH_NOARGS },
@@ -553,12 +588,361 @@ _pygi_g_type_info_size (GITypeInfo *type_info)
     return size;
 }
 
+static PyObject *
+_wrap_g_function_info_invoke_many (PyGIBaseInfo *self, PyObject *py_items)
+{
+    return _wrap_g_callable_info_invoke_many (self, NULL, py_items);
+}
+
 static PyMethodDef _PyGIFunctionInfo_methods[] = {
     { "is_constructor", (PyCFunction) _wrap_g_function_info_is_constructor, METH_NOARGS },
     { "is_method", (PyCFunction) _wrap_g_function_info_is_method, METH_NOARGS },
+    { "invoke_many", (PyCFunction) _wrap_g_function_info_invoke_many, METH_O },
+    { "build_cache", (PyCFunction) _wrap_g_callable_info_build_cache, METH_NOARGS },
+    { NULL, NULL, 0 }
+};
+
+/* FunctionInfo objects are installed directly as module attributes and
+ * class methods, so calling one goes straight into the invoker without a
+ * python level wrapper function in between. */
+static PyObject *
+_function_info_call (PyGIBaseInfo *self, PyObject *args, PyObject *kwargs)
+{
+    return _wrap_g_callable_info_invoke (self, args, kwargs);
+}
+
+#if PY_VERSION_HEX >= 0x03090000
+static PyObject *
+_callable_info_vectorcall (PyGIBaseInfo *self,
+                           PyObject *const *args,
+                           size_t nargsf,
+                           PyObject *kwnames)
+{
+    if (self->cache == NULL) {
+        self->cache = _pygi_callable_cache_get (self->info);
+        if (self->cache == NULL)
+            return NULL;
+    }
+
+    return pygi_callable_info_vectorcall (self->info, self->cache, args,
+                                          PyVectorcall_NARGS (nargsf), kwnames);
+}
+#endif
+
+/* BoundFunctionInfo
+ *
+ * What a method FunctionInfo returns when looked up on an instance. It
+ * behaves like a bound method but also provides invoke_many() with the
+ * instance filled in. */
+typedef struct {
+    PyObject_HEAD
+    PyGIBaseInfo *py_info;
+    PyObject *py_self;
+#if PY_VERSION_HEX >= 0x03090000
+    vectorcallfunc vectorcall;
+#endif
+} PyGIBoundFunctionInfo;
+
+PYGLIB_DEFINE_TYPE ("gi.BoundFunctionInfo", PyGIBoundFunctionInfo_Type, PyGIBoundFunctionInfo);
+
+#if PY_VERSION_HEX >= 0x03090000
+/* Prepend the instance to the arguments without building a tuple. Callers
+ * passing PY_VECTORCALL_ARGUMENTS_OFFSET let us use the slot before args
+ * for it during the call, see PEP 590. */
+static PyObject *
+_bound_function_info_vectorcall (PyGIBoundFunctionInfo *self,
+                                 PyObject *const *args,
+                                 size_t nargsf,
+                                 PyObject *kwnames)
+{
+    Py_ssize_t n_args = PyVectorcall_NARGS (nargsf);
+    Py_ssize_t n_total = n_args + (kwnames == NULL ? 0 : PyTuple_GET_SIZE (kwnames));
+    PyObject *stack[8];
+    PyObject **new_args;
+    PyObject *result;
+
+    if (nargsf & PY_VECTORCALL_ARGUMENTS_OFFSET) {
+        PyObject *saved;
+
+        new_args = (PyObject **) args - 1;
+        saved = new_args[0];
+        new_args[0] = self->py_self;
+        result = _callable_info_vectorcall (self->py_info, new_args,
+                                            n_args + 1, kwnames);
+        new_args[0] = saved;
+        return result;
+    }
+
+    if (n_total + 1 <= (Py_ssize_t) G_N_ELEMENTS (stack)) {
+        new_args = stack;
+    } else {
+        new_args = PyMem_Malloc ((n_total + 1) * sizeof (PyObject *));
+        if (new_args == NULL)
+            return PyErr_NoMemory ();
+    }
+
+    new_args[0] = self->py_self;
+    memcpy (new_args + 1, args, n_total * sizeof (PyObject *));
+    result = _callable_info_vectorcall (self->py_info, new_args,
+                                        n_args + 1, kwnames);
+
+    if (new_args != stack)
+        PyMem_Free (new_args);
+    return result;
+}
+#endif
+
+static PyObject *
+_bound_function_info_new (PyGIBaseInfo *py_info, PyObject *py_self)
+{
+    PyGIBoundFunctionInfo *self;
+
+    self = PyObject_GC_New (PyGIBoundFunctionInfo, &PyGIBoundFunctionInfo_Type);
+    if (self == NULL)
+        return NULL;
+
+    Py_INCREF (py_info);
+    self->py_info = py_info;
+    Py_INCREF (py_self);
+    self->py_self = py_self;
+#if PY_VERSION_HEX >= 0x03090000
+    self->vectorcall = (vectorcallfunc) _bound_function_info_vectorcall;
+#endif
+
+    PyObject_GC_Track ( (PyObject *) self);
+    return (PyObject *) self;
+}
+
+static void
+_bound_function_info_dealloc (PyGIBoundFunctionInfo *self)
+{
+    PyObject_GC_UnTrack ( (PyObject *) self);
+
+    Py_CLEAR (self->py_info);
+    Py_CLEAR (self->py_self);
+
+    PyObject_GC_Del (self);
+}
+
+static int
+_bound_function_info_traverse (PyGIBoundFunctionInfo *self,
+                               visitproc              visit,
+                               void                  *arg)
+{
+    Py_VISIT (self->py_info);
+    Py_VISIT (self->py_self);
+    return 0;
+}
+
+static PyObject *
+_bound_function_info_repr (PyGIBoundFunctionInfo *self)
+{
+    return PYGLIB_PyUnicode_FromFormat ("<bound method %s of %s object at 0x%p>",
+                                        g_base_info_get_name (self->py_info->info),
+                                        Py_TYPE (self->py_self)->tp_name,
+                                        (void *) self->py_self);
+}
+
+/* Like bound methods, two bound infos are equal if they bind the same
+ * instance to equal infos, so that e.g. disconnect_by_func() finds handlers
+ * connected with another lookup of the same method. */
+static PyObject *
+_bound_function_info_richcompare (PyGIBoundFunctionInfo *self, PyObject *other, int op)
+{
+    gboolean equal;
+    PyObject *res;
+
+    if ( (op != Py_EQ && op != Py_NE) ||
+            !PyObject_TypeCheck (other, &PyGIBoundFunctionInfo_Type)) {
+        Py_INCREF (Py_NotImplemented);
+        return Py_NotImplemented;
+    }
+
+    equal = self->py_self == ( (PyGIBoundFunctionInfo *) other)->py_self &&
+            g_base_info_equal (self->py_info->info,
+                               ( (PyGIBoundFunctionInfo *) other)->py_info->info);
+
+    if (op == Py_NE)
+        equal = !equal;
+    res = equal ? Py_True : Py_False;
+    Py_INCREF (res);
+    return res;
+}
+
+static long
+_bound_function_info_hash (PyGIBoundFunctionInfo *self)
+{
+    GIBaseInfo *info = self->py_info->info;
+    long hash;
+
+    /* equal infos describe the same callable, so they have the same
+     * namespace and name */
+    hash = (long) (g_str_hash (g_base_info_get_namespace (info)) * 31 +
+                   g_str_hash (g_base_info_get_name (info)));
+    hash ^= (long) self->py_self;
+    if (hash == -1)
+        hash = -2;
+    return hash;
+}
+
+static PyObject *
+_bound_function_info_call (PyGIBoundFunctionInfo *self, PyObject *args, PyObject *kwargs)
+{
+    Py_ssize_t n_args = PyTuple_GET_SIZE (args);
+    PyObject *py_args;
+    PyObject *result;
+    Py_ssize_t i;
+
+    py_args = PyTuple_New (n_args + 1);
+    if (py_args == NULL)
+        return NULL;
+
+    Py_INCREF (self->py_self);
+    PyTuple_SET_ITEM (py_args, 0, self->py_self);
+    for (i = 0; i < n_args; i++) {
+        PyObject *py_arg = PyTuple_GET_ITEM (args, i);
+        Py_INCREF (py_arg);
+        PyTuple_SET_ITEM (py_args, i + 1, py_arg);
+    }
+
+    result = _wrap_g_callable_info_invoke (self->py_info, py_args, kwargs);
+
+    Py_DECREF (py_args);
+    return result;
+}
+
+static PyObject *
+_bound_function_info_invoke_many (PyGIBoundFunctionInfo *self, PyObject *py_items)
+{
+    return _wrap_g_callable_info_invoke_many (self->py_info, self->py_self, py_items);
+}
+
+static PyObject *
+_bound_function_info_get_self (PyGIBoundFunctionInfo *self, void *closure)
+{
+    Py_INCREF (self->py_self);
+    return self->py_self;
+}
+
+static PyObject *
+_bound_function_info_get_func (PyGIBoundFunctionInfo *self, void *closure)
+{
+    Py_INCREF (self->py_info);
+    return (PyObject *) self->py_info;
+}
+
+static PyObject *
+_bound_function_info_get_name (PyGIBoundFunctionInfo *self, void *closure)
+{
+    return _wrap_g_base_info_get_name (self->py_info);
+}
+
+static PyObject *
+_bound_function_info_get_module (PyGIBoundFunctionInfo *self, void *closure)
+{
+    return _wrap_g_base_info_get_namespace (self->py_info);
+}
+
+static PyMethodDef _PyGIBoundFunctionInfo_methods[] = {
+    { "invoke_many", (PyCFunction) _bound_function_info_invoke_many, METH_O },
     { NULL, NULL, 0 }
 };
 
+static PyGetSetDef _PyGIBoundFunctionInfo_getsets[] = {
+    { "__self__", (getter) _bound_function_info_get_self, (setter) 0 },
+    { "__func__", (getter) _bound_function_info_get_func, (setter) 0 },
+    { "__info__", (getter) _bound_function_info_get_func, (setter) 0 },
+    { "__name__", (getter) _bound_function_info_get_name, (setter) 0 },
+    { "__module__", (getter) _bound_function_info_get_module, (setter) 0 },
+    { NULL, NULL, NULL }
+};
+
+static PyObject *
+_function_info_descr_get (PyGIBaseInfo *self, PyObject *obj, PyObject *type)
+{
+    GIFunctionInfoFlags flags;
+
+    flags = g_function_info_get_flags ( (GIFunctionInfo*) self->info);
+
+    /* Only instance methods bind, everything else behaves like a
+     * staticmethod */
+    if (obj == NULL || obj == Py_None || !(flags & GI_FUNCTION_IS_METHOD)) {
+        Py_INCREF (self);
+        return (PyObject *) self;
+    }
+
+    return _bound_function_info_new (self, obj);
+}
+
+static PyObject *
+_function_info_get_info (PyGIBaseInfo *self, void *closure)
+{
+    Py_INCREF (self);
+    return (PyObject *) self;
+}
+
+static PyObject *
+_function_info_get_module (PyGIBaseInfo *self, void *closure)
+{
+    return _wrap_g_base_info_get_namespace (self);
+}
+
+/* array_buffers: True or False to force returning numeric arrays as
+ * memoryviews or lists for this function, None to follow
+ * gi.set_array_buffers() */
+static PyObject *
+_function_info_get_array_buffers (PyGIBaseInfo *self, void *closure)
+{
+    /* the cache is shared with the other infos of the callable, which may
+     * have set the value */
+    if (self->cache == NULL) {
+        self->cache = _pygi_callable_cache_get (self->info);
+        if (self->cache == NULL)
+            return NULL;
+    }
+
+    switch (self->cache->array_buffers) {
+        case PYGI_ARRAY_BUFFERS_ENABLED:
+            Py_RETURN_TRUE;
+        case PYGI_ARRAY_BUFFERS_DISABLED:
+            Py_RETURN_FALSE;
+        default:
+            Py_RETURN_NONE;
+    }
+}
+
+static int
+_function_info_set_array_buffers (PyGIBaseInfo *self, PyObject *value, void *closure)
+{
+    PyGIArrayBuffers array_buffers = PYGI_ARRAY_BUFFERS_DEFAULT;
+
+    if (value != NULL && value != Py_None) {
+        int enabled = PyObject_IsTrue (value);
+        if (enabled < 0)
+            return -1;
+
+        array_buffers = enabled ? PYGI_ARRAY_BUFFERS_ENABLED : PYGI_ARRAY_BUFFERS_DISABLED;
+    }
+
+    if (self->cache == NULL) {
+        self->cache = _pygi_callable_cache_get (self->info);
+        if (self->cache == NULL)
+            return -1;
+    }
+
+    self->cache->array_buffers = array_buffers;
+    return 0;
+}
+
+static PyGetSetDef _PyGIFunctionInfo_getsets[] = {
+    { "array_buffers", (getter) _function_info_get_array_buffers,
+      (setter) _function_info_set_array_buffers },
+    { "__info__", (getter) _function_info_get_info, (setter) 0 },
+    { "__name__", (getter) _wrap_g_base_info_get_name, (setter) 0 },
+    { "__module__", (getter) _function_info_get_module, (setter) 0 },
+    { NULL, NULL, NULL }
+};
+
 
 /* RegisteredTypeInfo */
 PYGLIB_DEFINE_TYPE ("gi.RegisteredTypeInfo", PyGIRegisteredTypeInfo_Type, PyGIBaseInfo);
@@ -573,8 +957,21 @@ _wrap_g_registered_type_info_get_g_type (PyGIBaseInfo *self)
     return pyg_type_wrapper_new (type);
 }
 
+static PyObject *
+_wrap_g_registered_type_info_get_type_name (PyGIBaseInfo *self)
+{
+    const gchar *type_name;
+
+    type_name = g_registered_type_info_get_type_name ( (GIRegisteredTypeInfo *) self->info);
+    if (type_name == NULL)
+        Py_RETURN_NONE;
+
+    return PYGLIB_PyUnicode_FromString (type_name);
+}
+
 static PyMethodDef _PyGIRegisteredTypeInfo_methods[] = {
     { "get_g_type", (PyCFunction) _wrap_g_registered_type_info_get_g_type, METH_NOARGS },
+    { "get_type_name", (PyCFunction) _wrap_g_registered_type_info_get_type_name, METH_NOARGS },
     { NULL, NULL, 0 }
 };
 
@@ -798,6 +1195,259 @@ _get_vfuncs (PyGIBaseInfo *self, GIInfoType info_type)
     return infos;
 }
 
+static PyObject *
+_find_method (PyGIBaseInfo *self, GIInfoType info_type, PyObject *args)
+{
+    const gchar *name;
+    GIBaseInfo *info;
+    PyObject *py_info;
+
+    if (!PyArg_ParseTuple (args, "s:find_method", &name)) {
+        return NULL;
+    }
+
+    switch (info_type) {
+        case GI_INFO_TYPE_STRUCT:
+            info = (GIBaseInfo *) g_struct_info_find_method ( (GIStructInfo *) self->info, name);
+            break;
+        case GI_INFO_TYPE_UNION:
+            info = (GIBaseInfo *) g_union_info_find_method ( (GIUnionInfo *) self->info, name);
+            break;
+        case GI_INFO_TYPE_OBJECT:
+            info = (GIBaseInfo *) g_object_info_find_method ( (GIObjectInfo *) self->info, name);
+            break;
+        case GI_INFO_TYPE_INTERFACE:
+            info = (GIBaseInfo *) g_interface_info_find_method ( (GIInterfaceInfo *) self->info, name);
+            break;
+        default:
+            g_assert_not_reached();
+    }
+
+    if (info == NULL) {
+        Py_RETURN_NONE;
+    }
+
+    py_info = _pygi_info_new (info);
+
+    g_base_info_unref (info);
+
+    return py_info;
+}
+
+static PyObject *
+_find_vfunc (PyGIBaseInfo *self, GIInfoType info_type, PyObject *args)
+{
+    const gchar *name;
+    GIBaseInfo *info;
+    PyObject *py_info;
+
+    if (!PyArg_ParseTuple (args, "s:find_vfunc", &name)) {
+        return NULL;
+    }
+
+    switch (info_type) {
+        case GI_INFO_TYPE_INTERFACE:
+            info = (GIBaseInfo *) g_interface_info_find_vfunc ( (GIInterfaceInfo *) self->info, name);
+            break;
+        case GI_INFO_TYPE_OBJECT:
+            info = (GIBaseInfo *) g_object_info_find_vfunc ( (GIObjectInfo *) self->info, name);
+            break;
+        default:
+            g_assert_not_reached();
+    }
+
+    if (info == NULL) {
+        Py_RETURN_NONE;
+    }
+
+    py_info = _pygi_info_new (info);
+
+    g_base_info_unref (info);
+
+    return py_info;
+}
+
+typedef GIBaseInfo *(*PyGIChildInfoFunc) (GIBaseInfo *info, gint n);
+
+/* Python attribute name of a child info, fields use underscores instead of
+ * dashes. The result must be freed with g_free(). */
+static gchar *
+_get_child_attribute_name (GIBaseInfo *child, const gchar *prefix, gboolean is_field)
+{
+    gchar *name;
+
+    name = g_strconcat (prefix, g_base_info_get_name (child), NULL);
+    if (is_field)
+        g_strdelimit (name, "-", '_');
+
+    return name;
+}
+
+/* Append the attribute names of the children of info to names, without
+ * creating python objects for the child infos. */
+static gboolean
+_append_child_names (PyObject          *names,
+                     GIBaseInfo        *info,
+                     gint               n_infos,
+                     PyGIChildInfoFunc  get_child,
+                     const gchar       *prefix,
+                     gboolean           is_field,
+                     gboolean           skip_constructors)
+{
+    gint i;
+
+    for (i = 0; i < n_infos; i++) {
+        GIBaseInfo *child;
+        gchar *name;
+        PyObject *py_name;
+
+        child = get_child (info, i);
+        g_assert (child != NULL);
+
+        if (skip_constructors &&
+                g_function_info_get_flags ( (GIFunctionInfo *) child) & GI_FUNCTION_IS_CONSTRUCTOR) {
+            g_base_info_unref (child);
+            continue;
+        }
+
+        name = _get_child_attribute_name (child, prefix, is_field);
+        g_base_info_unref (child);
+
+        py_name = PYGLIB_PyUnicode_FromString (name);
+        g_free (name);
+        if (py_name == NULL)
+            return FALSE;
+
+        if (PyList_Append (names, py_name) < 0) {
+            Py_DECREF (py_name);
+            return FALSE;
+        }
+        Py_DECREF (py_name);
+    }
+
+    return TRUE;
+}
+
+/* The names of the class attributes the members of a registered type are
+ * exposed as: methods (except for interface constructors), constants,
+ * fields and, for objects, the vfuncs prefixed with "do_". */
+static PyObject *
+_get_member_names (PyGIBaseInfo *self, GIInfoType info_type)
+{
+    GIBaseInfo *info = self->info;
+    PyObject *names;
+    gboolean success;
+
+    names = PyList_New (0);
+    if (names == NULL) {
+        return NULL;
+    }
+
+    switch (info_type) {
+        case GI_INFO_TYPE_STRUCT:
+            success =
+                _append_child_names (names, info,
+                                     g_struct_info_get_n_methods ( (GIStructInfo *) info),
+                                     (PyGIChildInfoFunc) g_struct_info_get_method,
+                                     "", FALSE, FALSE) &&
+                _append_child_names (names, info,
+                                     g_struct_info_get_n_fields ( (GIStructInfo *) info),
+                                     (PyGIChildInfoFunc) g_struct_info_get_field,
+                                     "", TRUE, FALSE);
+            break;
+        case GI_INFO_TYPE_UNION:
+            success =
+                _append_child_names (names, info,
+                                     g_union_info_get_n_methods ( (GIUnionInfo *) info),
+                                     (PyGIChildInfoFunc) g_union_info_get_method,
+                                     "", FALSE, FALSE) &&
+                _append_child_names (names, info,
+                                     g_union_info_get_n_fields ( (GIUnionInfo *) info),
+                                     (PyGIChildInfoFunc) g_union_info_get_field,
+                                     "", TRUE, FALSE);
+            break;
+        case GI_INFO_TYPE_OBJECT:
+            success =
+                _append_child_names (names, info,
+                                     g_object_info_get_n_methods ( (GIObjectInfo *) info),
+                                     (PyGIChildInfoFunc) g_object_info_get_method,
+                                     "", FALSE, FALSE) &&
+                _append_child_names (names, info,
+                                     g_object_info_get_n_constants ( (GIObjectInfo *) info),
+                                     (PyGIChildInfoFunc) g_object_info_get_constant,
+                                     "", FALSE, FALSE) &&
+                _append_child_names (names, info,
+                                     g_object_info_get_n_fields ( (GIObjectInfo *) info),
+                                     (PyGIChildInfoFunc) g_object_info_get_field,
+                                     "", TRUE, FALSE) &&
+                _append_child_names (names, info,
+                                     g_object_info_get_n_vfuncs ( (GIObjectInfo *) info),
+                                     (PyGIChildInfoFunc) g_object_info_get_vfunc,
+                                     "do_", FALSE, FALSE);
+            break;
+        case GI_INFO_TYPE_INTERFACE:
+            success =
+                _append_child_names (names, info,
+                                     g_interface_info_get_n_methods ( (GIInterfaceInfo *) info),
+                                     (PyGIChildInfoFunc) g_interface_info_get_method,
+                                     "", FALSE, TRUE) &&
+                _append_child_names (names, info,
+                                     g_interface_info_get_n_constants ( (GIInterfaceInfo *) info),
+                                     (PyGIChildInfoFunc) g_interface_info_get_constant,
+                                     "", FALSE, FALSE);
+            break;
+        default:
+            g_assert_not_reached();
+    }
+
+    if (!success) {
+        Py_DECREF (names);
+        return NULL;
+    }
+
+    return names;
+}
+
+/* Find a child info by its attribute name, see _get_child_attribute_name() */
+static PyObject *
+_find_child (PyGIBaseInfo      *self,
+             PyObject          *args,
+             const gchar       *format,
+             gint               n_infos,
+             PyGIChildInfoFunc  get_child,
+             gboolean           is_field)
+{
+    const gchar *name;
+    gint i;
+
+    if (!PyArg_ParseTuple (args, format, &name)) {
+        return NULL;
+    }
+
+    for (i = 0; i < n_infos; i++) {
+        GIBaseInfo *child;
+        gchar *child_name;
+        gboolean found;
+
+        child = get_child (self->info, i);
+        g_assert (child != NULL);
+
+        child_name = _get_child_attribute_name (child, "", is_field);
+        found = strcmp (child_name, name) == 0;
+        g_free (child_name);
+
+        if (found) {
+            PyObject *py_info = _pygi_info_new (child);
+            g_base_info_unref (child);
+            return py_info;
+        }
+
+        g_base_info_unref (child);
+    }
+
+    Py_RETURN_NONE;
+}
+
 static PyObject *
 _wrap_g_struct_info_get_fields (PyGIBaseInfo *self)
 {
@@ -810,9 +1460,32 @@ _wrap_g_struct_info_get_methods (PyGIBaseInfo *self)
     return _get_methods (self, GI_INFO_TYPE_STRUCT);
 }
 
+static PyObject *
+_wrap_g_struct_info_find_method (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_method (self, GI_INFO_TYPE_STRUCT, args);
+}
+
+static PyObject *
+_wrap_g_struct_info_find_field (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_child (self, args, "s:find_field",
+                        g_struct_info_get_n_fields ( (GIStructInfo *) self->info),
+                        (PyGIChildInfoFunc) g_struct_info_get_field, TRUE);
+}
+
+static PyObject *
+_wrap_g_struct_info_get_member_names (PyGIBaseInfo *self)
+{
+    return _get_member_names (self, GI_INFO_TYPE_STRUCT);
+}
+
 static PyMethodDef _PyGIStructInfo_methods[] = {
     { "get_fields", (PyCFunction) _wrap_g_struct_info_get_fields, METH_NOARGS },
     { "get_methods", (PyCFunction) _wrap_g_struct_info_get_methods, METH_NOARGS },
+    { "find_method", (PyCFunction) _wrap_g_struct_info_find_method, METH_VARARGS },
+    { "find_field", (PyCFunction) _wrap_g_struct_info_find_field, METH_VARARGS },
+    { "get_member_names", (PyCFunction) _wrap_g_struct_info_get_member_names, METH_NOARGS },
     { NULL, NULL, 0 }
 };
 
@@ -1069,6 +1742,40 @@ _wrap_g_object_info_get_vfuncs (PyGIBaseInfo *self)
     return _get_vfuncs (self, GI_INFO_TYPE_OBJECT);
 }
 
+static PyObject *
+_wrap_g_object_info_find_method (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_method (self, GI_INFO_TYPE_OBJECT, args);
+}
+
+static PyObject *
+_wrap_g_object_info_find_vfunc (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_vfunc (self, GI_INFO_TYPE_OBJECT, args);
+}
+
+static PyObject *
+_wrap_g_object_info_find_field (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_child (self, args, "s:find_field",
+                        g_object_info_get_n_fields ( (GIObjectInfo *) self->info),
+                        (PyGIChildInfoFunc) g_object_info_get_field, TRUE);
+}
+
+static PyObject *
+_wrap_g_object_info_find_constant (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_child (self, args, "s:find_constant",
+                        g_object_info_get_n_constants ( (GIObjectInfo *) self->info),
+                        (PyGIChildInfoFunc) g_object_info_get_constant, FALSE);
+}
+
+static PyObject *
+_wrap_g_object_info_get_member_names (PyGIBaseInfo *self)
+{
+    return _get_member_names (self, GI_INFO_TYPE_OBJECT);
+}
+
 static PyMethodDef _PyGIObjectInfo_methods[] = {
     { "get_parent", (PyCFunction) _wrap_g_object_info_get_parent, METH_NOARGS },
     { "get_methods", (PyCFunction) _wrap_g_object_info_get_methods, METH_NOARGS },
@@ -1076,6 +1783,11 @@ static PyMethodDef _PyGIObjectInfo_methods[] = {
     { "get_interfaces", (PyCFunction) _wrap_g_object_info_get_interfaces, METH_NOARGS },
     { "get_constants", (PyCFunction) _wrap_g_object_info_get_constants, METH_NOARGS },
     { "get_vfuncs", (PyCFunction) _wrap_g_object_info_get_vfuncs, METH_NOARGS },
+    { "find_method", (PyCFunction) _wrap_g_object_info_find_method, METH_VARARGS },
+    { "find_vfunc", (PyCFunction) _wrap_g_object_info_find_vfunc, METH_VARARGS },
+    { "find_field", (PyCFunction) _wrap_g_object_info_find_field, METH_VARARGS },
+    { "find_constant", (PyCFunction) _wrap_g_object_info_find_constant, METH_VARARGS },
+    { "get_member_names", (PyCFunction) _wrap_g_object_info_get_member_names, METH_NOARGS },
     { NULL, NULL, 0 }
 };
 
@@ -1131,10 +1843,40 @@ _wrap_g_interface_info_get_vfuncs (PyGIBaseInfo *self)
     return _get_vfuncs (self, GI_INFO_TYPE_INTERFACE);
 }
 
+static PyObject *
+_wrap_g_interface_info_find_method (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_method (self, GI_INFO_TYPE_INTERFACE, args);
+}
+
+static PyObject *
+_wrap_g_interface_info_find_vfunc (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_vfunc (self, GI_INFO_TYPE_INTERFACE, args);
+}
+
+static PyObject *
+_wrap_g_interface_info_find_constant (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_child (self, args, "s:find_constant",
+                        g_interface_info_get_n_constants ( (GIInterfaceInfo *) self->info),
+                        (PyGIChildInfoFunc) g_interface_info_get_constant, FALSE);
+}
+
+static PyObject *
+_wrap_g_interface_info_get_member_names (PyGIBaseInfo *self)
+{
+    return _get_member_names (self, GI_INFO_TYPE_INTERFACE);
+}
+
 static PyMethodDef _PyGIInterfaceInfo_methods[] = {
     { "get_methods", (PyCFunction) _wrap_g_interface_info_get_methods, METH_NOARGS },
     { "get_constants", (PyCFunction) _wrap_g_interface_info_get_constants, METH_NOARGS },
     { "get_vfuncs", (PyCFunction) _wrap_g_interface_info_get_vfuncs, METH_NOARGS },
+    { "find_method", (PyCFunction) _wrap_g_interface_info_find_method, METH_VARARGS },
+    { "find_vfunc", (PyCFunction) _wrap_g_interface_info_find_vfunc, METH_VARARGS },
+    { "find_constant", (PyCFunction) _wrap_g_interface_info_find_constant, METH_VARARGS },
+    { "get_member_names", (PyCFunction) _wrap_g_interface_info_get_member_names, METH_NOARGS },
     { NULL, NULL, 0 }
 };
 
@@ -1490,8 +2232,21 @@ _wrap_g_vfunc_info_get_invoker (PyGIBaseInfo *self)
     return result;
 }
 
+/* Return a callable invoking the vfunc implementation of the class
+ * py_gtype, which is passed as the implementor on each call. */
+static PyObject *
+_wrap_g_vfunc_info_bind (PyGIBaseInfo *self, PyObject *py_gtype)
+{
+    if (pyg_type_from_object (py_gtype) == 0)
+        return NULL;
+
+    return _bound_function_info_new (self, py_gtype);
+}
+
 static PyMethodDef _PyGIVFuncInfo_methods[] = {
     { "get_invoker", (PyCFunction) _wrap_g_vfunc_info_get_invoker, METH_NOARGS },
+    { "bind", (PyCFunction) _wrap_g_vfunc_info_bind, METH_O },
+    { "build_cache", (PyCFunction) _wrap_g_callable_info_build_cache, METH_NOARGS },
     { NULL, NULL, 0 }
 };
 
@@ -1571,9 +2326,32 @@ _wrap_g_union_info_get_methods (PyGIBaseInfo *self)
     return infos;
 }
 
+static PyObject *
+_wrap_g_union_info_find_method (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_method (self, GI_INFO_TYPE_UNION, args);
+}
+
+static PyObject *
+_wrap_g_union_info_find_field (PyGIBaseInfo *self, PyObject *args)
+{
+    return _find_child (self, args, "s:find_field",
+                        g_union_info_get_n_fields ( (GIUnionInfo *) self->info),
+                        (PyGIChildInfoFunc) g_union_info_get_field, TRUE);
+}
+
+static PyObject *
+_wrap_g_union_info_get_member_names (PyGIBaseInfo *self)
+{
+    return _get_member_names (self, GI_INFO_TYPE_UNION);
+}
+
 static PyMethodDef _PyGIUnionInfo_methods[] = {
     { "get_fields", (PyCFunction) _wrap_g_union_info_get_fields, METH_NOARGS },
     { "get_methods", (PyCFunction) _wrap_g_union_info_get_methods, METH_NOARGS },
+    { "find_method", (PyCFunction) _wrap_g_union_info_find_method, METH_VARARGS },
+    { "find_field", (PyCFunction) _wrap_g_union_info_find_field, METH_VARARGS },
+    { "get_member_names", (PyCFunction) _wrap_g_union_info_get_member_names, METH_NOARGS },
     { NULL, NULL, 0 }
 };
 
@@ -1609,7 +2387,7 @@ _pygi_info_register_types (PyObject *m)
 {
 #define _PyGI_REGISTER_TYPE(m, type, cname, base) \
     Py_TYPE(&type) = &PyType_Type; \
-    type.tp_flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE); \
+    type.tp_flags |= (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE); \
     type.tp_weaklistoffset = offsetof(PyGIBaseInfo, inst_weakreflist); \
     type.tp_methods = _PyGI##cname##_methods; \
     type.tp_base = &base; \
@@ -1642,8 +2420,35 @@ _pygi_info_register_types (PyObject *m)
                          PyGIBaseInfo_Type);
     _PyGI_REGISTER_TYPE (m, PyGICallbackInfo_Type, CallbackInfo,
                          PyGIBaseInfo_Type);
+    PyGIFunctionInfo_Type.tp_call = (ternaryfunc) _function_info_call;
+    PyGIFunctionInfo_Type.tp_descr_get = (descrgetfunc) _function_info_descr_get;
+    PyGIFunctionInfo_Type.tp_getset = _PyGIFunctionInfo_getsets;
+#if PY_VERSION_HEX >= 0x03090000
+    PyGIFunctionInfo_Type.tp_vectorcall_offset = offsetof (PyGIBaseInfo, vectorcall);
+    PyGIFunctionInfo_Type.tp_flags = Py_TPFLAGS_HAVE_VECTORCALL;
+#endif
     _PyGI_REGISTER_TYPE (m, PyGIFunctionInfo_Type, FunctionInfo, 
                          PyGICallableInfo_Type);
+
+    Py_TYPE(&PyGIBoundFunctionInfo_Type) = &PyType_Type;
+    PyGIBoundFunctionInfo_Type.tp_dealloc = (destructor) _bound_function_info_dealloc;
+    PyGIBoundFunctionInfo_Type.tp_repr = (reprfunc) _bound_function_info_repr;
+    PyGIBoundFunctionInfo_Type.tp_call = (ternaryfunc) _bound_function_info_call;
+    PyGIBoundFunctionInfo_Type.tp_richcompare = (richcmpfunc) _bound_function_info_richcompare;
+    PyGIBoundFunctionInfo_Type.tp_hash = (hashfunc) _bound_function_info_hash;
+    PyGIBoundFunctionInfo_Type.tp_flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC);
+#if PY_VERSION_HEX >= 0x03090000
+    PyGIBoundFunctionInfo_Type.tp_vectorcall_offset = offsetof (PyGIBoundFunctionInfo, vectorcall);
+    PyGIBoundFunctionInfo_Type.tp_flags |= Py_TPFLAGS_HAVE_VECTORCALL;
+#endif
+    PyGIBoundFunctionInfo_Type.tp_traverse = (traverseproc) _bound_function_info_traverse;
+    PyGIBoundFunctionInfo_Type.tp_methods = _PyGIBoundFunctionInfo_methods;
+    PyGIBoundFunctionInfo_Type.tp_getset = _PyGIBoundFunctionInfo_getsets;
+    if (PyType_Ready(&PyGIBoundFunctionInfo_Type))
+        return;
+    if (PyModule_AddObject(m, "BoundFunctionInfo", (PyObject *)&PyGIBoundFunctionInfo_Type))
+        return;
+
     _PyGI_REGISTER_TYPE (m, PyGIRegisteredTypeInfo_Type, RegisteredTypeInfo, 
                          PyGIBaseInfo_Type);
     _PyGI_REGISTER_TYPE (m, PyGIStructInfo_Type, StructInfo, 
@@ -37,6 +37,7 @@ extern PyTypeObject PyGIBaseInfo_Type;
 extern PyTypeObject PyGICallableInfo_Type;
 extern PyTypeObject PyGICallbackInfo_Type;
 extern PyTypeObject PyGIFunctionInfo_Type;
+extern PyTypeObject PyGIBoundFunctionInfo_Type;
 extern PyTypeObject PyGIRegisteredTypeInfo_Type;
 extern PyTypeObject PyGIStructInfo_Type;
 extern PyTypeObject PyGIEnumInfo_Type;
@@ -58,6 +59,7 @@ extern PyTypeObject PyGITypeInfo_Type;
 #define PyGIBaseInfo_GET_GI_INFO(object) g_base_info_ref(((PyGIBaseInfo *)object)->info)
 
 PyObject* _pygi_info_new (GIBaseInfo *info);
+PyObject* _wrap_pyg_get_info_count (PyObject *self);
 GIBaseInfo* _pygi_object_get_gi_info (PyObject     *object,
                                       PyTypeObject *type);
 
@@ -10,6 +10,9 @@ G_BEGIN_DECLS
 typedef struct _PyGIInvokeState
 {
     PyObject *py_in_args;
+    /* the python arguments, the items of py_in_args or, for vectorcalls,
+     * the argument vector of the caller */
+    PyObject *const *py_in_items;
     gssize n_py_in_args;
     gssize current_arg;
 
@@ -34,7 +37,27 @@ typedef struct _PyGIInvokeState
 
     GIArgument return_arg;
 
+    /* Pointers to the C arguments in the order the callable expects them,
+     * handed directly to ffi_call. If the callable throws, the last slot
+     * points at error_location which in turn points at error.
+     */
+    gpointer *ffi_args;
+    gpointer function_ptr;
+
     GError *error;
+    GError **error_location;
+
+    /* heap block backing the argument arrays, NULL if they live on the
+     * stack of the invoker */
+    gpointer arena;
+
+    /* Py_buffer views whose memory is passed to C without copying, they
+     * are released once the call is done with them */
+    GSList *held_buffers;
+
+    /* python objects whose data is passed to C without copying while
+     * nothing else keeps them alive, released once the call is done */
+    GSList *held_objects;
 
     gboolean failed;
 
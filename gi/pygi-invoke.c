@@ -26,64 +26,31 @@
 #include "pygi-invoke.h"
 #include "pygi-marshal-cleanup.h"
 
-static inline gboolean
-_invoke_callable (PyGIInvokeState *state,
-                  PyGICallableCache *cache,
-                  GICallableInfo *callable_info,
-                  GCallback function_ptr)
+/* Must be safe to call without holding the GIL */
+static inline void
+_invoke_ffi_call (PyGIInvokeState *state,
+                  PyGICallableCache *cache)
 {
-    GError *error;
-    gint retval;
+    GIFFIReturnValue ffi_return_value;
 
-    error = NULL;
+    ffi_call (&cache->cif,
+              FFI_FN (state->function_ptr),
+              &ffi_return_value,
+              state->ffi_args);
 
-    pyg_begin_allow_threads;
+    gi_type_info_extract_ffi_return_value (cache->return_cache->type_info,
+                                           &ffi_return_value,
+                                           &state->return_arg);
+}
 
-    /* FIXME: use this for now but we can streamline the calls */
-    if (cache->function_type == PYGI_FUNCTION_TYPE_VFUNC)
-        retval = g_vfunc_info_invoke ( callable_info,
-                                       state->implementor_gtype,
-                                       state->in_args,
-                                       cache->n_from_py_args,
-                                       state->out_args,
-                                       cache->n_to_py_args,
-                                      &state->return_arg,
-                                      &error);
-    else if (g_base_info_get_type (callable_info) == GI_INFO_TYPE_CALLBACK)
-        retval = g_callable_info_invoke (callable_info,
-                                         function_ptr,
-                                         state->in_args,
-                                         cache->n_from_py_args,
-                                         state->out_args,
-                                         cache->n_to_py_args,
-                                         &state->return_arg,
-                                         FALSE,
-                                         FALSE,
-                                         &error);
-    else
-        retval = g_function_info_invoke ( callable_info,
-                                          state->in_args,
-                                          cache->n_from_py_args,
-                                          state->out_args,
-                                          cache->n_to_py_args,
-                                         &state->return_arg,
-                                         &error);
+static inline gboolean
+_invoke_callable (PyGIInvokeState *state,
+                  PyGICallableCache *cache)
+{
+    pyg_begin_allow_threads;
+    _invoke_ffi_call (state, cache);
     pyg_end_allow_threads;
 
-    if (!retval) {
-        g_assert (error != NULL);
-        pyglib_error_check (&error);
-
-        /* It is unclear if the error occured before or after the C
-         * function was invoked so for now assume success
-         * We eventually should marshal directly to FFI so we no longer
-         * have to use the reference implementation
-         */
-        pygi_marshal_cleanup_args_from_py_marshal_success (state, cache);
-
-        return FALSE;
-    }
-
     if (state->error != NULL) {
         if (pyglib_error_check (&(state->error))) {
             /* even though we errored out, the call itself was successful,
@@ -96,6 +63,39 @@ _invoke_callable (PyGIInvokeState *state,
     return TRUE;
 }
 
+static inline gboolean
+_invoke_resolve_function (PyGIInvokeState *state,
+                          PyGICallableCache *cache,
+                          GICallableInfo *callable_info,
+                          GCallback function_ptr)
+{
+    if (cache->function_type == PYGI_FUNCTION_TYPE_VFUNC) {
+        GError *error = NULL;
+
+        state->function_ptr = g_vfunc_info_get_address ( (GIVFuncInfo *)callable_info,
+                                                         state->implementor_gtype,
+                                                        &error);
+        if (error != NULL) {
+            pyglib_error_check (&error);
+            return FALSE;
+        }
+
+        if (state->function_ptr == NULL) {
+            PyErr_Format (PyExc_NotImplementedError,
+                          "%s does not implement %s",
+                          g_type_name (state->implementor_gtype),
+                          cache->name);
+            return FALSE;
+        }
+    } else if (cache->function_type == PYGI_FUNCTION_TYPE_CCALLBACK) {
+        state->function_ptr = function_ptr;
+    } else {
+        state->function_ptr = cache->function_ptr;
+    }
+
+    return TRUE;
+}
+
 static gboolean
 _check_for_unexpected_kwargs (const gchar *function_name,
                               GHashTable  *arg_name_hash,
@@ -141,6 +141,7 @@ _check_for_unexpected_kwargs (const gchar *function_name,
  *                 of this list is the number of required arguments for the
  *                 function. If an argument has no name, NULL is put in its
  *                 position in the list.
+ * @n_expected_args: the length of @arg_name_list.
  * @py_args: the tuple of positional arguments. A referece is stolen, and this
              tuple will be either decreffed or returned as is.
  * @py_kwargs: the dict of keyword arguments to be merged with py_args.
@@ -152,12 +153,12 @@ static PyObject *
 _py_args_combine_and_check_length (const gchar *function_name,
                                    GSList      *arg_name_list,
                                    GHashTable  *arg_name_hash,
+                                   gssize       n_expected_args,
                                    PyObject    *py_args,
                                    PyObject    *py_kwargs)
 {
     PyObject *combined_py_args = NULL;
     Py_ssize_t n_py_args, n_py_kwargs, i;
-    guint n_expected_args;
     GSList *l;
 
     n_py_args = PyTuple_GET_SIZE (py_args);
@@ -166,14 +167,13 @@ _py_args_combine_and_check_length (const gchar *function_name,
     else
         n_py_kwargs = PyDict_Size (py_kwargs);
 
-    n_expected_args = g_slist_length (arg_name_list);
     if (n_py_kwargs == 0 && n_py_args == n_expected_args) {
         return py_args;
     }
 
     if (n_expected_args < n_py_args) {
         PyErr_Format (PyExc_TypeError,
-                      "%.200s() takes exactly %d %sargument%s (%zd given)",
+                      "%.200s() takes exactly %zd %sargument%s (%zd given)",
                       function_name,
                       n_expected_args,
                       n_py_kwargs > 0 ? "non-keyword " : "",
@@ -220,7 +220,7 @@ _py_args_combine_and_check_length (const gchar *function_name,
 
         } else if (kw_arg_item == NULL && py_arg_item == NULL) {
             PyErr_Format (PyExc_TypeError,
-                          "%.200s() takes exactly %d %sargument%s (%zd given)",
+                          "%.200s() takes exactly %zd %sargument%s (%zd given)",
                           function_name,
                           n_expected_args,
                           n_py_kwargs > 0 ? "non-keyword " : "",
@@ -244,11 +244,163 @@ _py_args_combine_and_check_length (const gchar *function_name,
     return combined_py_args;
 }
 
+/* Layout of the per-invocation argument arrays:
+ *
+ *   args[n_args] | ffi_args[n_args + 1] | in_args[n_from_py_args] |
+ *   out_values[n_to_py_args] | out_args[n_to_py_args]
+ *
+ * They are carved out of one block of GIArgument slots (a pointer always
+ * fits in a GIArgument). Small callables get the block from the stack of
+ * pygi_callable_info_invoke(), larger ones from a per-thread free list, so
+ * the common case does not touch the allocator at all. A state keeps its
+ * block until _invoke_state_release() so batched calls reuse it.
+ */
+#define INVOKE_ARENA_STACK_SLOTS 48
+#define INVOKE_ARENA_MAX_FREE_BLOCKS 8
+
+typedef struct _PyGIInvokeArena PyGIInvokeArena;
+struct _PyGIInvokeArena {
+    PyGIInvokeArena *next;
+    gssize n_slots;
+    GIArgument slots[1];
+};
+
+typedef struct {
+    PyGIInvokeArena *free_blocks;
+    guint n_free_blocks;
+} PyGIInvokeArenaPool;
+
+static void
+_invoke_arena_pool_free (PyGIInvokeArenaPool *pool)
+{
+    while (pool->free_blocks != NULL) {
+        PyGIInvokeArena *arena = pool->free_blocks;
+        pool->free_blocks = arena->next;
+        g_free (arena);
+    }
+    g_slice_free (PyGIInvokeArenaPool, pool);
+}
+
+static GPrivate _invoke_arena_pool = G_PRIVATE_INIT ((GDestroyNotify)_invoke_arena_pool_free);
+
+static inline gssize
+_invoke_arena_n_slots (PyGICallableCache *cache)
+{
+    return cache->n_args + (cache->n_args + 1) +
+           cache->n_from_py_args + 2 * cache->n_to_py_args;
+}
+
+static PyGIInvokeArena *
+_invoke_arena_acquire (gssize n_slots)
+{
+    PyGIInvokeArenaPool *pool = g_private_get (&_invoke_arena_pool);
+    PyGIInvokeArena *arena;
+    PyGIInvokeArena **link;
+
+    if (pool != NULL) {
+        for (link = &pool->free_blocks; *link != NULL; link = &(*link)->next) {
+            arena = *link;
+            if (arena->n_slots >= n_slots) {
+                *link = arena->next;
+                pool->n_free_blocks--;
+                return arena;
+            }
+        }
+    }
+
+    arena = g_try_malloc (G_STRUCT_OFFSET (PyGIInvokeArena, slots) +
+                          n_slots * sizeof (GIArgument));
+    if (arena != NULL)
+        arena->n_slots = n_slots;
+
+    return arena;
+}
+
+static void
+_invoke_arena_release (PyGIInvokeArena *arena)
+{
+    PyGIInvokeArenaPool *pool = g_private_get (&_invoke_arena_pool);
+
+    if (pool == NULL) {
+        pool = g_slice_new0 (PyGIInvokeArenaPool);
+        g_private_set (&_invoke_arena_pool, pool);
+    }
+
+    if (pool->n_free_blocks >= INVOKE_ARENA_MAX_FREE_BLOCKS) {
+        g_free (arena);
+        return;
+    }
+
+    arena->next = pool->free_blocks;
+    pool->free_blocks = arena;
+    pool->n_free_blocks++;
+}
+
+/* slots is either caller provided storage for _invoke_arena_n_slots()
+ * arguments or NULL to use the state's heap block */
+static inline gboolean
+_invoke_state_arena_init (PyGIInvokeState *state,
+                          PyGICallableCache *cache,
+                          GIArgument *slots)
+{
+    gssize n_slots = _invoke_arena_n_slots (cache);
+
+    if (slots == NULL) {
+        if (state->arena == NULL) {
+            state->arena = _invoke_arena_acquire (n_slots);
+            if (state->arena == NULL) {
+                PyErr_NoMemory ();
+                return FALSE;
+            }
+        }
+        slots = ((PyGIInvokeArena *)state->arena)->slots;
+    }
+
+    memset (slots, 0, n_slots * sizeof (GIArgument));
+
+    state->args = (GIArgument **)slots;
+    slots += cache->n_args;
+    state->ffi_args = (gpointer *)slots;
+    slots += cache->n_args + 1;
+    state->in_args = slots;
+    slots += cache->n_from_py_args;
+    state->out_values = slots;
+    slots += cache->n_to_py_args;
+    state->out_args = slots;
+
+    return TRUE;
+}
+
+/* The part of the state setup shared by tuple calls and vectorcalls, the
+ * python arguments are already in the order of the callable. */
+static inline gboolean
+_invoke_state_init_from_items (PyGIInvokeState *state,
+                               PyGICallableCache *cache,
+                               PyObject *const *py_items,
+                               gssize n_py_items,
+                               GIArgument *slots)
+{
+    state->py_in_items = py_items;
+    state->n_py_in_args = n_py_items;
+
+    if (!_invoke_state_arena_init (state, cache, slots))
+        return FALSE;
+
+    state->error = NULL;
+    if (cache->throws) {
+        state->error_location = &state->error;
+        state->ffi_args[cache->n_args] = &state->error_location;
+    }
+
+    return TRUE;
+}
+
 static inline gboolean
 _invoke_state_init_from_callable_cache (PyGIInvokeState *state,
                                         PyGICallableCache *cache,
                                         PyObject *py_args,
-                                        PyObject *kwargs)
+                                        PyObject *kwargs,
+                                        GIArgument *slots)
 {
     state->implementor_gtype = 0;
 
@@ -301,52 +453,38 @@ _invoke_state_init_from_callable_cache (PyGIInvokeState *state,
     state->py_in_args = _py_args_combine_and_check_length (cache->name,
                                                            cache->arg_name_list,
                                                            cache->arg_name_hash,
+                                                           cache->n_arg_names,
                                                            state->py_in_args,
                                                            kwargs);
 
     if (state->py_in_args == NULL) {
         return FALSE;
     }
-    state->n_py_in_args = PyTuple_Size (state->py_in_args);
 
-    state->args = g_slice_alloc0 (cache->n_args * sizeof (GIArgument *));
-    if (state->args == NULL && cache->n_args != 0) {
-        PyErr_NoMemory();
-        return FALSE;
-    }
-
-    state->in_args = g_slice_alloc0 (cache->n_from_py_args * sizeof(GIArgument));
-    if (state->in_args == NULL && cache->n_from_py_args != 0) {
-        PyErr_NoMemory ();
-        return FALSE;
-    }
-
-    state->out_values = g_slice_alloc0 (cache->n_to_py_args * sizeof(GIArgument));
-    if (state->out_values == NULL && cache->n_to_py_args != 0) {
-        PyErr_NoMemory ();
-        return FALSE;
-    }
-
-    state->out_args = g_slice_alloc0 (cache->n_to_py_args * sizeof(GIArgument));
-    if (state->out_args == NULL && cache->n_to_py_args != 0) {
-        PyErr_NoMemory ();
-        return FALSE;
-    }
-
-    state->error = NULL;
-
-    return TRUE;
+    return _invoke_state_init_from_items (state, cache,
+                                          ((PyTupleObject *) state->py_in_args)->ob_item,
+                                          PyTuple_GET_SIZE (state->py_in_args),
+                                          slots);
 }
 
 static inline void
 _invoke_state_clear (PyGIInvokeState *state, PyGICallableCache *cache)
 {
-    g_slice_free1 (cache->n_args * sizeof(GIArgument *), state->args);
-    g_slice_free1 (cache->n_from_py_args * sizeof(GIArgument), state->in_args);
-    g_slice_free1 (cache->n_to_py_args * sizeof(GIArgument), state->out_args);
-    g_slice_free1 (cache->n_to_py_args * sizeof(GIArgument), state->out_values);
+    if (state->held_buffers != NULL)
+        pygi_marshal_cleanup_release_buffers (state);
+    if (state->held_objects != NULL)
+        pygi_marshal_cleanup_release_objects (state);
 
-    Py_XDECREF (state->py_in_args);
+    Py_CLEAR (state->py_in_args);
+}
+
+static inline void
+_invoke_state_release (PyGIInvokeState *state)
+{
+    if (state->arena != NULL) {
+        _invoke_arena_release (state->arena);
+        state->arena = NULL;
+    }
 }
 
 static gboolean _caller_alloc (PyGIInvokeState *state,
@@ -414,6 +552,7 @@ _invoke_marshal_in_args (PyGIInvokeState *state, PyGICallableCache *cache)
         switch (arg_cache->direction) {
             case PYGI_DIRECTION_FROM_PYTHON:
                 state->args[i] = &(state->in_args[in_count]);
+                state->ffi_args[i] = &(state->in_args[in_count]);
                 in_count++;
 
                 if (arg_cache->meta_type == PYGI_META_ARG_TYPE_CLOSURE) {
@@ -438,9 +577,7 @@ _invoke_marshal_in_args (PyGIInvokeState *state, PyGICallableCache *cache)
                     return FALSE;
                 }
 
-                py_arg =
-                    PyTuple_GET_ITEM (state->py_in_args,
-                                      arg_cache->py_arg_index);
+                py_arg = state->py_in_items[arg_cache->py_arg_index];
 
                 break;
             case PYGI_DIRECTION_BIDIRECTIONAL:
@@ -449,6 +586,7 @@ _invoke_marshal_in_args (PyGIInvokeState *state, PyGICallableCache *cache)
                     state->out_values[out_count] = state->in_args[in_count];
 
                 state->in_args[in_count].v_pointer = &state->out_values[out_count];
+                state->ffi_args[i] = &(state->in_args[in_count]);
                 in_count++;
 
                 if (arg_cache->meta_type != PYGI_META_ARG_TYPE_CHILD) {
@@ -464,11 +602,12 @@ _invoke_marshal_in_args (PyGIInvokeState *state, PyGICallableCache *cache)
                         return FALSE;
                     }
 
-                    py_arg =
-                        PyTuple_GET_ITEM (state->py_in_args,
-                                          arg_cache->py_arg_index);
+                    py_arg = state->py_in_items[arg_cache->py_arg_index];
                 }
             case PYGI_DIRECTION_TO_PYTHON:
+                if (arg_cache->direction == PYGI_DIRECTION_TO_PYTHON)
+                    state->ffi_args[i] = &(state->out_args[out_count]);
+
                 if (arg_cache->is_caller_allocates) {
                     if (!_caller_alloc (state, arg_cache, i, out_count)) {
                         PyErr_Format (PyExc_TypeError,
@@ -629,45 +768,377 @@ _invoke_marshal_out_args (PyGIInvokeState *state, PyGICallableCache *cache)
     return py_out;
 }
 
-PyObject *
-pygi_callable_info_invoke (GIBaseInfo *info, PyObject *py_args,
-                           PyObject *kwargs, PyGICallableCache *cache,
-                           GCallback function_ptr, gpointer user_data)
+/* Call the function once the python arguments are set up in state */
+static PyObject *
+_invoke_initialized_state (PyGIInvokeState *state, GIBaseInfo *info,
+                           PyGICallableCache *cache, GCallback function_ptr,
+                           gpointer user_data)
 {
-    PyGIInvokeState state = { 0, };
     PyObject *ret = NULL;
 
-    if (!_invoke_state_init_from_callable_cache (&state, cache, py_args, kwargs))
-        goto err;
-
     if (cache->function_type == PYGI_FUNCTION_TYPE_CCALLBACK)
-        state.user_data = user_data;
+        state->user_data = user_data;
+
+    if (!_invoke_resolve_function (state, cache, info, function_ptr))
+        goto err;
 
-    if (!_invoke_marshal_in_args (&state, cache))
+    if (!_invoke_marshal_in_args (state, cache))
         goto err;
 
-    if (!_invoke_callable (&state, cache, info, function_ptr))
+    if (!_invoke_callable (state, cache))
         goto err;
 
-    pygi_marshal_cleanup_args_from_py_marshal_success (&state, cache);
+    pygi_marshal_cleanup_args_from_py_marshal_success (state, cache);
 
-    ret = _invoke_marshal_out_args (&state, cache);
+    ret = _invoke_marshal_out_args (state, cache);
     if (ret)
-        pygi_marshal_cleanup_args_to_py_marshal_success (&state, cache);
+        pygi_marshal_cleanup_args_to_py_marshal_success (state, cache);
 err:
-    _invoke_state_clear (&state, cache);
+    _invoke_state_clear (state, cache);
     return ret;
 }
 
+static PyObject *
+_invoke_with_state (PyGIInvokeState *state, GIBaseInfo *info,
+                    PyObject *py_args, PyObject *kwargs,
+                    PyGICallableCache *cache, GCallback function_ptr,
+                    gpointer user_data, GIArgument *slots)
+{
+    if (!_invoke_state_init_from_callable_cache (state, cache, py_args, kwargs,
+                                                 slots)) {
+        _invoke_state_clear (state, cache);
+        return NULL;
+    }
+
+    return _invoke_initialized_state (state, info, cache, function_ptr,
+                                      user_data);
+}
+
+PyObject *
+pygi_callable_info_invoke (GIBaseInfo *info, PyObject *py_args,
+                           PyObject *kwargs, PyGICallableCache *cache,
+                           GCallback function_ptr, gpointer user_data)
+{
+    PyGIInvokeState state = { 0, };
+    GIArgument stack_slots[INVOKE_ARENA_STACK_SLOTS];
+    PyObject *ret;
+
+    ret = _invoke_with_state (&state, info, py_args, kwargs, cache,
+                              function_ptr, user_data,
+                              _invoke_arena_n_slots (cache) <= INVOKE_ARENA_STACK_SLOTS ?
+                                  stack_slots : NULL);
+    _invoke_state_release (&state);
+    return ret;
+}
+
+#if PY_VERSION_HEX >= 0x03090000
+static PyObject *
+_invoke_vectorcall_args (PyObject *const *py_args, Py_ssize_t n_py_args,
+                         PyObject *kwnames, PyObject **kwargs)
+{
+    PyObject *py_args_tuple;
+    Py_ssize_t i;
+
+    py_args_tuple = PyTuple_New (n_py_args);
+    if (py_args_tuple == NULL)
+        return NULL;
+
+    for (i = 0; i < n_py_args; i++) {
+        Py_INCREF (py_args[i]);
+        PyTuple_SET_ITEM (py_args_tuple, i, py_args[i]);
+    }
+
+    *kwargs = NULL;
+    if (kwnames == NULL || PyTuple_GET_SIZE (kwnames) == 0)
+        return py_args_tuple;
+
+    *kwargs = PyDict_New ();
+    if (*kwargs == NULL) {
+        Py_DECREF (py_args_tuple);
+        return NULL;
+    }
+
+    for (i = 0; i < PyTuple_GET_SIZE (kwnames); i++) {
+        if (PyDict_SetItem (*kwargs, PyTuple_GET_ITEM (kwnames, i),
+                            py_args[n_py_args + i]) < 0) {
+            Py_DECREF (py_args_tuple);
+            Py_CLEAR (*kwargs);
+            return NULL;
+        }
+    }
+
+    return py_args_tuple;
+}
+
+/* Vectorcall entry of FunctionInfo. Functions and methods called with the
+ * exact number of positional arguments are marshalled straight from the
+ * argument vector of the caller, other calls go through the argument
+ * tuple and keyword dict as with tp_call. */
+PyObject *
+pygi_callable_info_vectorcall (GIBaseInfo *info, PyGICallableCache *cache,
+                               PyObject *const *py_args, Py_ssize_t n_py_args,
+                               PyObject *kwnames)
+{
+    PyGIInvokeState state = { 0, };
+    GIArgument stack_slots[INVOKE_ARENA_STACK_SLOTS];
+    PyObject *ret;
+
+    if ((kwnames != NULL && PyTuple_GET_SIZE (kwnames) > 0) ||
+            n_py_args != cache->n_arg_names ||
+            (cache->function_type != PYGI_FUNCTION_TYPE_FUNCTION &&
+             cache->function_type != PYGI_FUNCTION_TYPE_METHOD)) {
+        PyObject *py_args_tuple, *kwargs;
+
+        py_args_tuple = _invoke_vectorcall_args (py_args, n_py_args,
+                                                 kwnames, &kwargs);
+        if (py_args_tuple == NULL)
+            return NULL;
+
+        ret = pygi_callable_info_invoke (info, py_args_tuple, kwargs, cache,
+                                         NULL, NULL);
+        Py_DECREF (py_args_tuple);
+        Py_XDECREF (kwargs);
+        return ret;
+    }
+
+    if (_invoke_state_init_from_items (&state, cache, py_args, n_py_args,
+                                       _invoke_arena_n_slots (cache) <= INVOKE_ARENA_STACK_SLOTS ?
+                                           stack_slots : NULL)) {
+        ret = _invoke_initialized_state (&state, info, cache, NULL, NULL);
+    } else {
+        _invoke_state_clear (&state, cache);
+        ret = NULL;
+    }
+
+    _invoke_state_release (&state);
+    return ret;
+}
+#endif
+
+/* Number of scalar calls marshalled before the GIL is dropped for them */
+#define INVOKE_MANY_CHUNK_SIZE 256
+
+static PyObject *
+_invoke_many_item_args (PyObject *py_bound_arg, PyObject *py_item)
+{
+    PyObject *py_args;
+    Py_ssize_t n_items, i;
+
+    if (!PyTuple_Check (py_item) && !PyList_Check (py_item)) {
+        PyErr_Format (PyExc_TypeError,
+                      "expected a tuple of arguments, got %s",
+                      Py_TYPE (py_item)->tp_name);
+        return NULL;
+    }
+
+    if (py_bound_arg == NULL)
+        return PySequence_Tuple (py_item);
+
+    n_items = PySequence_Fast_GET_SIZE (py_item);
+    py_args = PyTuple_New (n_items + 1);
+    if (py_args == NULL)
+        return NULL;
+
+    Py_INCREF (py_bound_arg);
+    PyTuple_SET_ITEM (py_args, 0, py_bound_arg);
+    for (i = 0; i < n_items; i++) {
+        PyObject *py_arg = PySequence_Fast_GET_ITEM (py_item, i);
+        Py_INCREF (py_arg);
+        PyTuple_SET_ITEM (py_args, i + 1, py_arg);
+    }
+
+    return py_args;
+}
+
+/* One state and one argument block for the whole batch, each call goes
+ * through the regular invoke path. */
+static gboolean
+_invoke_many_generic (GIBaseInfo *info, PyGICallableCache *cache,
+                      PyObject *py_bound_arg, PyObject *py_items,
+                      PyObject *py_results)
+{
+    PyGIInvokeState state = { 0, };
+    GIArgument stack_slots[INVOKE_ARENA_STACK_SLOTS];
+    GIArgument *slots = NULL;
+    gboolean success = FALSE;
+    Py_ssize_t i;
+
+    if (_invoke_arena_n_slots (cache) <= INVOKE_ARENA_STACK_SLOTS)
+        slots = stack_slots;
+
+    for (i = 0; i < PySequence_Fast_GET_SIZE (py_items); i++) {
+        PyObject *py_args;
+        PyObject *py_ret;
+
+        py_args = _invoke_many_item_args (py_bound_arg,
+                                          PySequence_Fast_GET_ITEM (py_items, i));
+        if (py_args == NULL) {
+            _PyGI_ERROR_PREFIX ("item %zd: ", i);
+            goto out;
+        }
+
+        py_ret = _invoke_with_state (&state, info, py_args, NULL, cache,
+                                     NULL, NULL, slots);
+        Py_DECREF (py_args);
+        if (py_ret == NULL) {
+            _PyGI_ERROR_PREFIX ("item %zd: ", i);
+            goto out;
+        }
+
+        PyList_SET_ITEM (py_results, i, py_ret);
+    }
+
+    success = TRUE;
+out:
+    _invoke_state_release (&state);
+    return success;
+}
+
+/* Scalar callables (see _callable_cache_is_scalar()) need nothing from
+ * python once their arguments are marshalled, so a chunk of calls is
+ * marshalled first, then run back to back with the GIL released once. */
+static gboolean
+_invoke_many_scalar (GIBaseInfo *info, PyGICallableCache *cache,
+                     PyObject *py_bound_arg, PyObject *py_items,
+                     PyObject *py_results)
+{
+    Py_ssize_t n_items = PySequence_Fast_GET_SIZE (py_items);
+    gssize n_slots = _invoke_arena_n_slots (cache);
+    Py_ssize_t chunk_size = MIN (n_items, INVOKE_MANY_CHUNK_SIZE);
+    PyGIInvokeState *states;
+    GIArgument *slots;
+    gboolean success = FALSE;
+    Py_ssize_t start = 0;
+    Py_ssize_t n_marshalled = 0;
+    Py_ssize_t i;
+
+    states = g_try_new0 (PyGIInvokeState, chunk_size);
+    slots = g_try_new (GIArgument, n_slots * chunk_size);
+    if (states == NULL || slots == NULL) {
+        PyErr_NoMemory ();
+        goto out;
+    }
+
+    for (start = 0; start < n_items; start += chunk_size) {
+        Py_ssize_t n_chunk = MIN (chunk_size, n_items - start);
+
+        for (n_marshalled = 0; n_marshalled < n_chunk; n_marshalled++) {
+            PyGIInvokeState *state = &states[n_marshalled];
+            Py_ssize_t index = start + n_marshalled;
+            PyObject *py_args;
+            gboolean marshalled;
+
+            py_args = _invoke_many_item_args (py_bound_arg,
+                                              PySequence_Fast_GET_ITEM (py_items, index));
+            if (py_args == NULL) {
+                _PyGI_ERROR_PREFIX ("item %zd: ", index);
+                goto out;
+            }
+
+            marshalled =
+                _invoke_state_init_from_callable_cache (state, cache, py_args, NULL,
+                                                        slots + n_marshalled * n_slots) &&
+                _invoke_resolve_function (state, cache, info, NULL) &&
+                _invoke_marshal_in_args (state, cache);
+            Py_DECREF (py_args);
+
+            if (!marshalled) {
+                _invoke_state_clear (state, cache);
+                _PyGI_ERROR_PREFIX ("item %zd: ", index);
+                goto out;
+            }
+        }
+
+        pyg_begin_allow_threads;
+        for (i = 0; i < n_chunk; i++)
+            _invoke_ffi_call (&states[i], cache);
+        pyg_end_allow_threads;
+
+        for (i = 0; i < n_chunk; i++) {
+            PyGIInvokeState *state = &states[i];
+            PyObject *py_ret;
+
+            pygi_marshal_cleanup_args_from_py_marshal_success (state, cache);
+            py_ret = _invoke_marshal_out_args (state, cache);
+            if (py_ret == NULL) {
+                _PyGI_ERROR_PREFIX ("item %zd: ", start + i);
+                goto out;
+            }
+            pygi_marshal_cleanup_args_to_py_marshal_success (state, cache);
+            _invoke_state_clear (state, cache);
+
+            PyList_SET_ITEM (py_results, start + i, py_ret);
+        }
+        n_marshalled = 0;
+    }
+
+    success = TRUE;
+out:
+    if (states != NULL) {
+        for (i = 0; i < n_marshalled; i++)
+            _invoke_state_clear (&states[i], cache);
+    }
+    g_free (states);
+    g_free (slots);
+    return success;
+}
+
+PyObject *
+pygi_callable_info_invoke_many (GIBaseInfo *info, PyGICallableCache *cache,
+                                PyObject *py_bound_arg, PyObject *py_items)
+{
+    PyObject *py_seq;
+    PyObject *py_results;
+    gboolean success;
+
+    /* take a snapshot, a list could lose items while the GIL is released */
+    py_seq = PySequence_Tuple (py_items);
+    if (py_seq == NULL)
+        return NULL;
+
+    py_results = PyList_New (PySequence_Fast_GET_SIZE (py_seq));
+    if (py_results == NULL) {
+        Py_DECREF (py_seq);
+        return NULL;
+    }
+
+    if (cache->is_scalar && PySequence_Fast_GET_SIZE (py_seq) > 0)
+        success = _invoke_many_scalar (info, cache, py_bound_arg, py_seq, py_results);
+    else
+        success = _invoke_many_generic (info, cache, py_bound_arg, py_seq, py_results);
+
+    Py_DECREF (py_seq);
+    if (!success) {
+        Py_DECREF (py_results);
+        return NULL;
+    }
+
+    return py_results;
+}
+
 PyObject *
 _wrap_g_callable_info_invoke (PyGIBaseInfo *self, PyObject *py_args,
                               PyObject *kwargs)
 {
     if (self->cache == NULL) {
-        self->cache = _pygi_callable_cache_new (self->info, FALSE);
+        self->cache = _pygi_callable_cache_get (self->info);
         if (self->cache == NULL)
             return NULL;
     }
 
     return pygi_callable_info_invoke (self->info, py_args, kwargs, self->cache, NULL, NULL);
 }
+
+PyObject *
+_wrap_g_callable_info_invoke_many (PyGIBaseInfo *self, PyObject *py_bound_arg,
+                                   PyObject *py_items)
+{
+    if (self->cache == NULL) {
+        self->cache = _pygi_callable_cache_get (self->info);
+        if (self->cache == NULL)
+            return NULL;
+    }
+
+    return pygi_callable_info_invoke_many (self->info, self->cache,
+                                           py_bound_arg, py_items);
+}
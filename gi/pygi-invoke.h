@@ -35,6 +35,15 @@ PyObject *pygi_callable_info_invoke (GIBaseInfo *info, PyObject *py_args,
                                      GCallback function_ptr, gpointer user_data);
 PyObject *_wrap_g_callable_info_invoke (PyGIBaseInfo *self, PyObject *py_args,
                                         PyObject *kwargs);
+#if PY_VERSION_HEX >= 0x03090000
+PyObject *pygi_callable_info_vectorcall (GIBaseInfo *info, PyGICallableCache *cache,
+                                         PyObject *const *py_args, Py_ssize_t n_py_args,
+                                         PyObject *kwnames);
+#endif
+PyObject *pygi_callable_info_invoke_many (GIBaseInfo *info, PyGICallableCache *cache,
+                                          PyObject *py_bound_arg, PyObject *py_items);
+PyObject *_wrap_g_callable_info_invoke_many (PyGIBaseInfo *self, PyObject *py_bound_arg,
+                                             PyObject *py_items);
 
 G_END_DECLS
 
@@ -228,8 +228,7 @@ _pygi_marshal_cleanup_from_py_interface_struct_gvalue (PyGIInvokeState *state,
                                                        gboolean         was_processed)
 {
     if (was_processed) {
-        PyObject *py_arg = PyTuple_GET_ITEM (state->py_in_args,
-                                             arg_cache->py_arg_index);
+        PyObject *py_arg = state->py_in_items[arg_cache->py_arg_index];
         GType py_object_type =
             pyg_type_from_object_strict ( (PyObject *) py_arg->ob_type, FALSE);
 
@@ -295,12 +294,64 @@ _wrap_c_array (PyGIInvokeState   *state,
     return array_;
 }
 
+/* Release the buffer view held for data if it was passed to C without
+ * copying, returns FALSE if data is not backed by a held view */
+gboolean
+pygi_marshal_cleanup_release_buffer (PyGIInvokeState *state,
+                                     gpointer         data)
+{
+    GSList *item;
+
+    for (item = state->held_buffers; item != NULL; item = item->next) {
+        Py_buffer *view = item->data;
+
+        if (view->buf == data) {
+            state->held_buffers = g_slist_delete_link (state->held_buffers, item);
+            PyBuffer_Release (view);
+            g_slice_free (Py_buffer, view);
+            return TRUE;
+        }
+    }
+
+    return FALSE;
+}
+
+void
+pygi_marshal_cleanup_release_buffers (PyGIInvokeState *state)
+{
+    while (state->held_buffers != NULL) {
+        Py_buffer *view = state->held_buffers->data;
+
+        state->held_buffers = g_slist_delete_link (state->held_buffers,
+                                                   state->held_buffers);
+        PyBuffer_Release (view);
+        g_slice_free (Py_buffer, view);
+    }
+}
+
+void
+pygi_marshal_cleanup_release_objects (PyGIInvokeState *state)
+{
+    while (state->held_objects != NULL) {
+        PyObject *py_obj = state->held_objects->data;
+
+        state->held_objects = g_slist_delete_link (state->held_objects,
+                                                   state->held_objects);
+        Py_DECREF (py_obj);
+    }
+}
+
 void
 _pygi_marshal_cleanup_from_py_array (PyGIInvokeState *state,
                                      PyGIArgCache    *arg_cache,
                                      gpointer         data,
                                      gboolean         was_processed)
 {
+    /* borrowed from a python buffer, nothing of ours to free */
+    if (state->held_buffers != NULL &&
+            pygi_marshal_cleanup_release_buffer (state, data))
+        return;
+
     if (was_processed) {
         GArray *array_ = NULL;
         GPtrArray *ptr_array_ = NULL;
@@ -40,6 +40,11 @@ void pygi_marshal_cleanup_args_to_py_parameter_fail  (PyGIInvokeState   *state,
                                                       PyGICallableCache *cache,
                                                       gssize failed_to_py_arg_index);
 
+gboolean pygi_marshal_cleanup_release_buffer (PyGIInvokeState *state,
+                                              gpointer         data);
+void pygi_marshal_cleanup_release_buffers    (PyGIInvokeState *state);
+void pygi_marshal_cleanup_release_objects    (PyGIInvokeState *state);
+
 void _pygi_marshal_cleanup_from_py_utf8                      (PyGIInvokeState *state,
                                                               PyGIArgCache    *arg_cache,
                                                               gpointer         data,
@@ -694,6 +694,102 @@ _pygi_marshal_from_py_utf8 (PyGIInvokeState   *state,
     return TRUE;
 }
 
+/* Keep a view on py_obj until the invoke state is cleared, see
+ * pygi_marshal_cleanup_release_buffers() */
+static gboolean
+_pygi_marshal_hold_buffer (PyGIInvokeState *state,
+                           PyObject        *py_obj,
+                           Py_buffer       *view)
+{
+    Py_buffer *held_view;
+
+    if (view == NULL) {
+        held_view = g_slice_new (Py_buffer);
+        if (PyObject_GetBuffer (py_obj, held_view, PyBUF_SIMPLE) < 0) {
+            g_slice_free (Py_buffer, held_view);
+            return FALSE;
+        }
+    } else {
+        held_view = g_slice_dup (Py_buffer, view);
+    }
+
+    state->held_buffers = g_slist_prepend (state->held_buffers, held_view);
+    return TRUE;
+}
+
+/* transfer none utf8 from python: point the callee at the UTF-8 the
+ * interpreter already has instead of duplicating it. Nothing to clean up,
+ * py_arg stays referenced by the arguments of the call. */
+gboolean
+_pygi_marshal_from_py_utf8_borrowed (PyGIInvokeState   *state,
+                                     PyGICallableCache *callable_cache,
+                                     PyGIArgCache      *arg_cache,
+                                     PyObject          *py_arg,
+                                     GIArgument        *arg)
+{
+    if (py_arg == Py_None) {
+        arg->v_pointer = NULL;
+        return TRUE;
+    }
+
+    if (PyUnicode_Check (py_arg)) {
+#if PY_VERSION_HEX >= 0x03030000
+        const char *string_ = PyUnicode_AsUTF8 (py_arg);
+        if (string_ == NULL)
+            return FALSE;
+
+        arg->v_string = (gchar *)string_;
+#else
+        /* no cached UTF-8 to borrow, keep the encoded copy alive instead */
+        PyObject *pystr_obj = PyUnicode_AsUTF8String (py_arg);
+        gboolean held;
+
+        if (!pystr_obj)
+            return FALSE;
+
+        arg->v_string = PYGLIB_PyBytes_AsString (pystr_obj);
+        held = _pygi_marshal_hold_buffer (state, pystr_obj, NULL);
+        Py_DECREF (pystr_obj);
+        if (!held)
+            return FALSE;
+#endif
+        return TRUE;
+    }
+#if PY_VERSION_HEX < 0x03000000
+    else if (PyString_Check (py_arg)) {
+        arg->v_string = PyString_AsString (py_arg);
+        return TRUE;
+    }
+#endif
+
+    PyErr_Format (PyExc_TypeError, "Must be string, not %s",
+                  py_arg->ob_type->tp_name);
+    return FALSE;
+}
+
+/* transfer none utf8 items of containers: only the python container refers
+ * to the item, and it can be modified while the GIL is released around the
+ * call, so the borrowed string keeps its object alive until the call is
+ * done, see pygi_marshal_cleanup_release_objects() */
+gboolean
+_pygi_marshal_from_py_utf8_borrowed_item (PyGIInvokeState   *state,
+                                          PyGICallableCache *callable_cache,
+                                          PyGIArgCache      *arg_cache,
+                                          PyObject          *py_arg,
+                                          GIArgument        *arg)
+{
+    if (!_pygi_marshal_from_py_utf8_borrowed (state, callable_cache,
+                                              arg_cache, py_arg, arg))
+        return FALSE;
+
+    if (py_arg != Py_None) {
+        Py_INCREF (py_arg);
+        state->held_objects = g_slist_prepend (state->held_objects, py_arg);
+    }
+
+    return TRUE;
+}
+
 gboolean
 _pygi_marshal_from_py_filename (PyGIInvokeState   *state,
                                 PyGICallableCache *callable_cache,
@@ -736,20 +832,211 @@ _pygi_marshal_from_py_filename (PyGIInvokeState   *state,
     return TRUE;
 }
 
-gboolean
-_pygi_marshal_from_py_array (PyGIInvokeState   *state,
-                             PyGICallableCache *callable_cache,
-                             PyGIArgCache      *arg_cache,
-                             PyObject          *py_arg,
-                             GIArgument        *arg)
+static void
+_set_array_length_arg (PyGIInvokeState   *state,
+                       PyGICallableCache *callable_cache,
+                       PyGISequenceCache *sequence_cache,
+                       Py_ssize_t         length)
+{
+    PyGIArgCache *child_cache;
+
+    if (sequence_cache->len_arg_index < 0)
+        return;
+
+    /* we have an child arg to handle */
+    child_cache = callable_cache->args_cache[sequence_cache->len_arg_index];
+
+    if (child_cache->direction == PYGI_DIRECTION_BIDIRECTIONAL) {
+        gint *len_arg = (gint *)state->in_args[child_cache->c_arg_index].v_pointer;
+        /* if we are not setup yet just set the in arg */
+        if (len_arg == NULL)
+            state->in_args[child_cache->c_arg_index].v_long = length;
+        else
+            *len_arg = length;
+    } else {
+        state->in_args[child_cache->c_arg_index].v_long = length;
+    }
+}
+
+/* Check whether the elements of a buffer can be used as is for items of
+ * type_tag, formats follow the struct module syntax */
+static gboolean
+_buffer_matches_item_type (Py_buffer *view,
+                           GITypeTag  type_tag,
+                           gssize     item_size)
+{
+    const char *format = view->format != NULL ? view->format : "B";
+
+    if (view->ndim != 1 || view->itemsize != item_size)
+        return FALSE;
+
+    /* native byte order only */
+    if (*format == '@' || *format == '=')
+        format++;
+#if G_BYTE_ORDER == G_LITTLE_ENDIAN
+    else if (*format == '<')
+        format++;
+#else
+    else if (*format == '>' || *format == '!')
+        format++;
+#endif
+
+    if (format[0] == '\0' || format[1] != '\0')
+        return FALSE;
+
+    switch (type_tag) {
+        case GI_TYPE_TAG_INT8:
+        case GI_TYPE_TAG_INT16:
+        case GI_TYPE_TAG_INT32:
+        case GI_TYPE_TAG_INT64:
+            return strchr ("bhilq", format[0]) != NULL;
+        case GI_TYPE_TAG_UINT8:
+        case GI_TYPE_TAG_UINT16:
+        case GI_TYPE_TAG_UINT32:
+        case GI_TYPE_TAG_UINT64:
+            return strchr ("BHILQ", format[0]) != NULL;
+        case GI_TYPE_TAG_FLOAT:
+            return format[0] == 'f';
+        case GI_TYPE_TAG_DOUBLE:
+            return format[0] == 'd';
+        default:
+            return FALSE;
+    }
+}
+
+/* Numeric C arrays can be filled straight from objects exporting the
+ * buffer protocol (bytearray, array.array, memoryview, numpy arrays...).
+ * transfer none input arrays are passed without copying and the view is
+ * held until the array gets cleaned up, everything else is a single memcpy.
+ *
+ * Returns FALSE without an exception set if py_arg can't be used this way
+ * so the caller can fall back to marshalling item by item. */
+static gboolean
+_pygi_marshal_from_py_array_buffer (PyGIInvokeState   *state,
+                                    PyGICallableCache *callable_cache,
+                                    PyGIArgCache      *arg_cache,
+                                    PyObject          *py_arg,
+                                    GIArgument        *arg)
+{
+    PyGISequenceCache *sequence_cache = (PyGISequenceCache *)arg_cache;
+    PyGIArgCache *item_cache = sequence_cache->item_cache;
+    Py_buffer view;
+    Py_ssize_t length;
+
+    if (sequence_cache->array_type != GI_ARRAY_TYPE_C ||
+            item_cache->is_pointer ||
+            !PyObject_CheckBuffer (py_arg))
+        return FALSE;
+
+    if (PyObject_GetBuffer (py_arg, &view, PyBUF_ND | PyBUF_FORMAT) < 0) {
+        PyErr_Clear ();
+        return FALSE;
+    }
+
+    if (!_buffer_matches_item_type (&view, item_cache->type_tag,
+                                    sequence_cache->item_size)) {
+        PyBuffer_Release (&view);
+        return FALSE;
+    }
+
+    length = view.len / view.itemsize;
+
+    if (sequence_cache->fixed_size >= 0 &&
+        sequence_cache->fixed_size != length) {
+        PyErr_Format (PyExc_ValueError, "Must contain %zd items, not %zd",
+                      sequence_cache->fixed_size, length);
+        PyBuffer_Release (&view);
+        return TRUE;
+    }
+
+    if (length > 0 &&
+            arg_cache->transfer == GI_TRANSFER_NOTHING &&
+            arg_cache->direction == PYGI_DIRECTION_FROM_PYTHON &&
+            !sequence_cache->is_zero_terminated) {
+        _pygi_marshal_hold_buffer (state, py_arg, &view);
+        arg->v_pointer = view.buf;
+    } else {
+        GArray *array_ = g_array_sized_new (sequence_cache->is_zero_terminated,
+                                            FALSE,
+                                            sequence_cache->item_size,
+                                            length);
+        g_array_append_vals (array_, view.buf, length);
+        PyBuffer_Release (&view);
+        arg->v_pointer = g_array_free (array_, FALSE);
+    }
+
+    _set_array_length_arg (state, callable_cache, sequence_cache, length);
+
+    return TRUE;
+}
+
+/* Exact lists and tuples are read directly instead of through the sequence
+ * protocol. Marshalling an item can run python code which modifies the
+ * list, so its size is checked again on every access, and a reference is
+ * returned for all sequences as PySequence_GetItem() does. */
+static inline PyObject *
+_pygi_sequence_get_item (PyObject *py_seq, gboolean is_list_or_tuple, Py_ssize_t index)
+{
+    if (is_list_or_tuple) {
+        PyObject *py_item;
+
+        if (index >= PySequence_Fast_GET_SIZE (py_seq)) {
+            PyErr_SetString (PyExc_RuntimeError,
+                             "sequence changed size during marshalling");
+            return NULL;
+        }
+        py_item = PySequence_Fast_GET_ITEM (py_seq, index);
+        Py_INCREF (py_item);
+        return py_item;
+    }
+
+    return PySequence_GetItem (py_seq, index);
+}
+
+/* Length of py_seq as a sequence or -1 with an exception set */
+static inline Py_ssize_t
+_pygi_sequence_length (PyObject *py_seq, gboolean is_list_or_tuple)
+{
+    if (is_list_or_tuple)
+        return PySequence_Fast_GET_SIZE (py_seq);
+
+    if (!PySequence_Check (py_seq)) {
+        PyErr_Format (PyExc_TypeError, "Must be sequence, not %s",
+                      py_seq->ob_type->tp_name);
+        return -1;
+    }
+
+    return PySequence_Length (py_seq);
+}
+
+/* Stores one marshalled item into the array being built, the variant is
+ * picked once per array by _arg_cache_from_py_array_setup(). */
+typedef enum {
+    PYGI_ARRAY_ITEM_PTR_ARRAY,  /* GPtrArray of pointers */
+    PYGI_ARRAY_ITEM_VALUE,      /* the GIArgument itself: scalars, strings,
+                                   objects, boxed, GVariant, Gdk.Atom... */
+    PYGI_ARRAY_ITEM_STRUCT,     /* structs and unions copied in place */
+    PYGI_ARRAY_ITEM_GVALUE      /* GValues copied in place */
+} PyGIArrayItemKind;
+
+/* Instantiated once per item kind below, kind is a constant in each of
+ * them so the per item switch folds away. */
+static inline gboolean
+_pygi_marshal_from_py_array_real (PyGIInvokeState   *state,
+                                  PyGICallableCache *callable_cache,
+                                  PyGIArgCache      *arg_cache,
+                                  PyObject          *py_arg,
+                                  GIArgument        *arg,
+                                  PyGIArrayItemKind  kind)
 {
     PyGIMarshalFromPyFunc from_py_marshaller;
     int i;
     Py_ssize_t length;
+    gboolean is_list_or_tuple;
     gssize item_size;
-    gboolean is_ptr_array;
     GArray *array_ = NULL;
     PyGISequenceCache *sequence_cache = (PyGISequenceCache *)arg_cache;
+    PyGIArgCache *item_arg_cache = sequence_cache->item_cache;
 
 
     if (py_arg == Py_None) {
@@ -757,13 +1044,13 @@ _pygi_marshal_from_py_array (PyGIInvokeState   *state,
         return TRUE;
     }
 
-    if (!PySequence_Check (py_arg)) {
-        PyErr_Format (PyExc_TypeError, "Must be sequence, not %s",
-                      py_arg->ob_type->tp_name);
-        return FALSE;
-    }
+    if (kind == PYGI_ARRAY_ITEM_VALUE &&
+            _pygi_marshal_from_py_array_buffer (state, callable_cache, arg_cache,
+                                                py_arg, arg))
+        return !PyErr_Occurred ();
 
-    length = PySequence_Length (py_arg);
+    is_list_or_tuple = PyList_CheckExact (py_arg) || PyTuple_CheckExact (py_arg);
+    length = _pygi_sequence_length (py_arg, is_list_or_tuple);
     if (length < 0)
         return FALSE;
 
@@ -776,9 +1063,8 @@ _pygi_marshal_from_py_array (PyGIInvokeState   *state,
     }
 
     item_size = sequence_cache->item_size;
-    is_ptr_array = (sequence_cache->array_type == GI_ARRAY_TYPE_PTR_ARRAY);
-    if (is_ptr_array) {
-        array_ = (GArray *)g_ptr_array_new ();
+    if (kind == PYGI_ARRAY_ITEM_PTR_ARRAY) {
+        array_ = (GArray *)g_ptr_array_sized_new (length);
     } else {
         array_ = g_array_sized_new (sequence_cache->is_zero_terminated,
                                     FALSE,
@@ -791,7 +1077,8 @@ _pygi_marshal_from_py_array (PyGIInvokeState   *state,
         return FALSE;
     }
 
-    if (sequence_cache->item_cache->type_tag == GI_TYPE_TAG_UINT8 &&
+    if (kind == PYGI_ARRAY_ITEM_VALUE &&
+        item_arg_cache->type_tag == GI_TYPE_TAG_UINT8 &&
         PYGLIB_PyBytes_Check (py_arg)) {
         memcpy(array_->data, PYGLIB_PyBytes_AsString (py_arg), length);
         if (sequence_cache->is_zero_terminated) {
@@ -802,103 +1089,83 @@ _pygi_marshal_from_py_array (PyGIInvokeState   *state,
         goto array_success;
     }
 
-    from_py_marshaller = sequence_cache->item_cache->from_py_marshaller;
+    from_py_marshaller = item_arg_cache->from_py_marshaller;
     for (i = 0; i < length; i++) {
         GIArgument item;
-        PyObject *py_item = PySequence_GetItem (py_arg, i);
+        gboolean success;
+        PyObject *py_item = _pygi_sequence_get_item (py_arg, is_list_or_tuple, i);
         if (py_item == NULL)
             goto err;
 
-        if (!from_py_marshaller ( state,
-                                  callable_cache,
-                                  sequence_cache->item_cache,
-                                  py_item,
-                                 &item))
+        success = from_py_marshaller ( state,
+                                       callable_cache,
+                                       item_arg_cache,
+                                       py_item,
+                                      &item);
+        Py_DECREF (py_item);
+        if (!success)
             goto err;
 
-        /* FIXME: it is much more efficent to have seperate marshaller
-         *        for ptr arrays than doing the evaluation
-         *        and casting each loop iteration
-         */
-        if (is_ptr_array) {
-            g_ptr_array_add((GPtrArray *)array_, item.v_pointer);
-        } else if (sequence_cache->item_cache->type_tag == GI_TYPE_TAG_INTERFACE) {
-            PyGIInterfaceCache *item_iface_cache = (PyGIInterfaceCache *) sequence_cache->item_cache;
-            GIBaseInfo *base_info = (GIBaseInfo *) item_iface_cache->interface_info;
-            GIInfoType info_type = g_base_info_get_type (base_info);
-
-            switch (info_type) {
-                case GI_INFO_TYPE_UNION:
-                case GI_INFO_TYPE_STRUCT:
-                {
-                    PyGIArgCache *item_arg_cache = (PyGIArgCache *)item_iface_cache;
-                    PyGIMarshalCleanupFunc from_py_cleanup = item_arg_cache->from_py_cleanup;
-                    gboolean is_boxed = g_type_is_a (item_iface_cache->g_type, G_TYPE_BOXED);
-                    gboolean is_gvalue = item_iface_cache->g_type == G_TYPE_VALUE;
-                    gboolean is_gvariant = item_iface_cache->g_type == G_TYPE_VARIANT;
-                    
-                    if (is_gvariant) {
-                        /* Item size will always be that of a pointer,
-                         * since GVariants are opaque hence always passed by ref */
-                        g_assert (item_size == sizeof (item.v_pointer));
-                        g_array_insert_val (array_, i, item.v_pointer);
-                    } else if (is_gvalue) {
-                        GValue* dest = (GValue*) (array_->data + (i * item_size));
-                        memset (dest, 0, item_size);
-                        if (item.v_pointer != NULL) {
-                            g_value_init (dest, G_VALUE_TYPE ((GValue*) item.v_pointer));
-                            g_value_copy ((GValue*) item.v_pointer, dest);
-                        }
-
-                        if (from_py_cleanup) {
-                            from_py_cleanup (state, item_arg_cache, item.v_pointer, TRUE);
-                            /* we freed the original copy already, the new one is a 
-                             * struct in an array. _pygi_marshal_cleanup_from_py_array()
-                             * must not free it again */
-                            item_arg_cache->from_py_cleanup = NULL;
-                        }
-                    } else if (!is_boxed) {
-                        /* HACK: Gdk.Atom is merely an integer wrapped in a pointer,
-                         * so we must not dereference it; just copy the pointer
-                         * value, and don't attempt to free it. TODO: find out
-                         * if there are other data types with similar behaviour
-                         * and generalize. */
-                        if (g_strcmp0 (item_iface_cache->type_name, "Gdk.Atom") == 0) {
-                            g_assert (item_size == sizeof (item.v_pointer));
-                            memcpy (array_->data + (i * item_size), &item.v_pointer, item_size);
-                        } else {
-                            memcpy (array_->data + (i * item_size), item.v_pointer, item_size);
-
-                            if (from_py_cleanup)
-                                from_py_cleanup (state, item_arg_cache, item.v_pointer, TRUE);
-                        }
-                    } else {
-                        g_array_insert_val (array_, i, item);
-                    }
-                    break;
+        switch (kind) {
+            case PYGI_ARRAY_ITEM_PTR_ARRAY:
+                g_ptr_array_add ((GPtrArray *)array_, item.v_pointer);
+                break;
+            case PYGI_ARRAY_ITEM_VALUE:
+                g_array_insert_val (array_, i, item);
+                break;
+            case PYGI_ARRAY_ITEM_STRUCT:
+            {
+                PyGIMarshalCleanupFunc from_py_cleanup = item_arg_cache->from_py_cleanup;
+
+                /* arrays are always sized up front */
+                g_array_set_size (array_, i + 1);
+                memcpy (array_->data + (i * item_size), item.v_pointer, item_size);
+
+                if (from_py_cleanup)
+                    from_py_cleanup (state, item_arg_cache, item.v_pointer, TRUE);
+                break;
+            }
+            case PYGI_ARRAY_ITEM_GVALUE:
+            {
+                PyGIMarshalCleanupFunc from_py_cleanup = item_arg_cache->from_py_cleanup;
+                GValue *dest;
+
+                g_array_set_size (array_, i + 1);
+                dest = (GValue*) (array_->data + (i * item_size));
+                memset (dest, 0, item_size);
+                if (item.v_pointer != NULL) {
+                    g_value_init (dest, G_VALUE_TYPE ((GValue*) item.v_pointer));
+                    g_value_copy ((GValue*) item.v_pointer, dest);
                 }
-                default:
-                    g_array_insert_val (array_, i, item);
+
+                if (from_py_cleanup) {
+                    from_py_cleanup (state, item_arg_cache, item.v_pointer, TRUE);
+                    /* we freed the original copy already, the new one is a 
+                     * struct in an array. _pygi_marshal_cleanup_from_py_array()
+                     * must not free it again */
+                    item_arg_cache->from_py_cleanup = NULL;
+                }
+                break;
             }
-        } else {
-            g_array_insert_val (array_, i, item);
         }
         continue;
 err:
-        if (sequence_cache->item_cache->from_py_cleanup != NULL) {
+        /* structs and GValues were cleaned up as they were copied */
+        if ((kind == PYGI_ARRAY_ITEM_PTR_ARRAY || kind == PYGI_ARRAY_ITEM_VALUE) &&
+                item_arg_cache->from_py_cleanup != NULL) {
             gsize j;
             PyGIMarshalCleanupFunc cleanup_func =
-                sequence_cache->item_cache->from_py_cleanup;
+                item_arg_cache->from_py_cleanup;
 
             for(j = 0; j < i; j++) {
                 cleanup_func (state,
-                              sequence_cache->item_cache,
+                              item_arg_cache,
                               g_array_index (array_, gpointer, j),
                               TRUE);
             }
         }
 
-        if (is_ptr_array)
+        if (kind == PYGI_ARRAY_ITEM_PTR_ARRAY)
             g_ptr_array_free ( ( GPtrArray *)array_, TRUE);
         else
             g_array_free (array_, TRUE);
@@ -907,22 +1174,7 @@ err:
     }
 
 array_success:
-    if (sequence_cache->len_arg_index >= 0) {
-        /* we have an child arg to handle */
-        PyGIArgCache *child_cache =
-            callable_cache->args_cache[sequence_cache->len_arg_index];
-
-        if (child_cache->direction == PYGI_DIRECTION_BIDIRECTIONAL) {
-            gint *len_arg = (gint *)state->in_args[child_cache->c_arg_index].v_pointer;
-            /* if we are not setup yet just set the in arg */
-            if (len_arg == NULL)
-                state->in_args[child_cache->c_arg_index].v_long = length;
-            else
-                *len_arg = length;
-        } else {
-            state->in_args[child_cache->c_arg_index].v_long = length;
-        }
-    }
+    _set_array_length_arg (state, callable_cache, sequence_cache, length);
 
     if (sequence_cache->array_type == GI_ARRAY_TYPE_C) {
         arg->v_pointer = array_->data;
@@ -934,6 +1186,50 @@ array_success:
     return TRUE;
 }
 
+gboolean
+_pygi_marshal_from_py_ptr_array (PyGIInvokeState   *state,
+                                 PyGICallableCache *callable_cache,
+                                 PyGIArgCache      *arg_cache,
+                                 PyObject          *py_arg,
+                                 GIArgument        *arg)
+{
+    return _pygi_marshal_from_py_array_real (state, callable_cache, arg_cache,
+                                             py_arg, arg, PYGI_ARRAY_ITEM_PTR_ARRAY);
+}
+
+gboolean
+_pygi_marshal_from_py_array (PyGIInvokeState   *state,
+                             PyGICallableCache *callable_cache,
+                             PyGIArgCache      *arg_cache,
+                             PyObject          *py_arg,
+                             GIArgument        *arg)
+{
+    return _pygi_marshal_from_py_array_real (state, callable_cache, arg_cache,
+                                             py_arg, arg, PYGI_ARRAY_ITEM_VALUE);
+}
+
+gboolean
+_pygi_marshal_from_py_array_of_structs (PyGIInvokeState   *state,
+                                        PyGICallableCache *callable_cache,
+                                        PyGIArgCache      *arg_cache,
+                                        PyObject          *py_arg,
+                                        GIArgument        *arg)
+{
+    return _pygi_marshal_from_py_array_real (state, callable_cache, arg_cache,
+                                             py_arg, arg, PYGI_ARRAY_ITEM_STRUCT);
+}
+
+gboolean
+_pygi_marshal_from_py_array_of_gvalues (PyGIInvokeState   *state,
+                                        PyGICallableCache *callable_cache,
+                                        PyGIArgCache      *arg_cache,
+                                        PyObject          *py_arg,
+                                        GIArgument        *arg)
+{
+    return _pygi_marshal_from_py_array_real (state, callable_cache, arg_cache,
+                                             py_arg, arg, PYGI_ARRAY_ITEM_GVALUE);
+}
+
 gboolean
 _pygi_marshal_from_py_glist (PyGIInvokeState   *state,
                              PyGICallableCache *callable_cache,
@@ -944,6 +1240,7 @@ _pygi_marshal_from_py_glist (PyGIInvokeState   *state,
     PyGIMarshalFromPyFunc from_py_marshaller;
     int i;
     Py_ssize_t length;
+    gboolean is_list_or_tuple;
     GList *list_ = NULL;
     PyGISequenceCache *sequence_cache = (PyGISequenceCache *)arg_cache;
 
@@ -953,13 +1250,8 @@ _pygi_marshal_from_py_glist (PyGIInvokeState   *state,
         return TRUE;
     }
 
-    if (!PySequence_Check (py_arg)) {
-        PyErr_Format (PyExc_TypeError, "Must be sequence, not %s",
-                      py_arg->ob_type->tp_name);
-        return FALSE;
-    }
-
-    length = PySequence_Length (py_arg);
+    is_list_or_tuple = PyList_CheckExact (py_arg) || PyTuple_CheckExact (py_arg);
+    length = _pygi_sequence_length (py_arg, is_list_or_tuple);
     if (length < 0)
         return FALSE;
 
@@ -974,15 +1266,18 @@ _pygi_marshal_from_py_glist (PyGIInvokeState   *state,
     from_py_marshaller = sequence_cache->item_cache->from_py_marshaller;
     for (i = 0; i < length; i++) {
         GIArgument item;
-        PyObject *py_item = PySequence_GetItem (py_arg, i);
+        gboolean success;
+        PyObject *py_item = _pygi_sequence_get_item (py_arg, is_list_or_tuple, i);
         if (py_item == NULL)
             goto err;
 
-        if (!from_py_marshaller ( state,
-                                  callable_cache,
-                                  sequence_cache->item_cache,
-                                  py_item,
-                                 &item))
+        success = from_py_marshaller ( state,
+                                       callable_cache,
+                                       sequence_cache->item_cache,
+                                       py_item,
+                                      &item);
+        Py_DECREF (py_item);
+        if (!success)
             goto err;
 
         list_ = g_list_prepend (list_, item.v_pointer);
@@ -1012,6 +1307,7 @@ _pygi_marshal_from_py_gslist (PyGIInvokeState   *state,
     PyGIMarshalFromPyFunc from_py_marshaller;
     int i;
     Py_ssize_t length;
+    gboolean is_list_or_tuple;
     GSList *list_ = NULL;
     PyGISequenceCache *sequence_cache = (PyGISequenceCache *)arg_cache;
 
@@ -1020,13 +1316,8 @@ _pygi_marshal_from_py_gslist (PyGIInvokeState   *state,
         return TRUE;
     }
 
-    if (!PySequence_Check (py_arg)) {
-        PyErr_Format (PyExc_TypeError, "Must be sequence, not %s",
-                      py_arg->ob_type->tp_name);
-        return FALSE;
-    }
-
-    length = PySequence_Length (py_arg);
+    is_list_or_tuple = PyList_CheckExact (py_arg) || PyTuple_CheckExact (py_arg);
+    length = _pygi_sequence_length (py_arg, is_list_or_tuple);
     if (length < 0)
         return FALSE;
 
@@ -1041,15 +1332,18 @@ _pygi_marshal_from_py_gslist (PyGIInvokeState   *state,
     from_py_marshaller = sequence_cache->item_cache->from_py_marshaller;
     for (i = 0; i < length; i++) {
         GIArgument item;
-        PyObject *py_item = PySequence_GetItem (py_arg, i);
+        gboolean success;
+        PyObject *py_item = _pygi_sequence_get_item (py_arg, is_list_or_tuple, i);
         if (py_item == NULL)
             goto err;
 
-        if (!from_py_marshaller ( state,
-                             callable_cache,
-                             sequence_cache->item_cache,
-                             py_item,
-                            &item))
+        success = from_py_marshaller ( state,
+                                  callable_cache,
+                                  sequence_cache->item_cache,
+                                  py_item,
+                                 &item);
+        Py_DECREF (py_item);
+        if (!success)
             goto err;
 
         list_ = g_slist_prepend (list_, item.v_pointer);
@@ -1224,9 +1518,7 @@ _pygi_marshal_from_py_interface_callback (PyGIInvokeState   *state,
     if (callback_cache->user_data_index > 0) {
         user_data_cache = callable_cache->args_cache[callback_cache->user_data_index];
         if (user_data_cache->py_arg_index < state->n_py_in_args) {
-            py_user_data = PyTuple_GetItem (state->py_in_args, user_data_cache->py_arg_index);
-            if (!py_user_data)
-                return FALSE;
+            py_user_data = state->py_in_items[user_data_cache->py_arg_index];
         } else {
             py_user_data = Py_None;
             Py_INCREF (Py_None);
@@ -221,7 +221,7 @@ _pygi_marshal_to_py_utf8 (PyGIInvokeState   *state,
         return py_obj;
      }
 
-    py_obj = PYGLIB_PyUnicode_FromString (arg->v_string);
+    py_obj = _pygi_string_cache_get (arg->v_string);
     return py_obj;
 }
 
@@ -254,6 +254,63 @@ _pygi_marshal_to_py_filename (PyGIInvokeState   *state,
     return py_obj;
 }
 
+/* Hand the items of a numeric array to python as one read-only memoryview.
+ * Arrays we own are adopted as they are, others are copied once. */
+static PyObject *
+_pygi_marshal_to_py_array_buffer (PyGIArgCache *arg_cache,
+                                  GIArgument   *arg,
+                                  GArray       *array_,
+                                  const gchar  *format)
+{
+    PyGISequenceCache *seq_cache = (PyGISequenceCache *)arg_cache;
+    gsize item_size = seq_cache->item_size;
+    gsize len = 0;
+    gpointer data = NULL;
+    PyObject *py_buffer;
+    PyObject *py_obj;
+
+    if (array_ != NULL) {
+        item_size = g_array_get_element_size (array_);
+        len = array_->len;
+    }
+
+    if (arg->v_pointer == NULL) {
+        if (seq_cache->array_type == GI_ARRAY_TYPE_C)
+            g_array_free (array_, FALSE);
+    } else if (arg_cache->transfer == GI_TRANSFER_NOTHING) {
+        data = g_memdup (array_->data, len * item_size);
+        if (seq_cache->array_type == GI_ARRAY_TYPE_C)
+            g_array_free (array_, FALSE);
+    } else {
+        /* the buffer owns the memory now, make sure the array cleanup
+         * doesn't free it */
+        data = g_array_free (array_, FALSE);
+        arg->v_pointer = NULL;
+    }
+
+    py_buffer = _pygi_array_buffer_new (data, len, item_size, format);
+    if (py_buffer == NULL)
+        return NULL;
+
+    py_obj = PyMemoryView_FromObject (py_buffer);
+    Py_DECREF (py_buffer);
+
+    return py_obj;
+}
+
+static gboolean
+_array_buffers_enabled (PyGICallableCache *callable_cache)
+{
+    switch (callable_cache->array_buffers) {
+        case PYGI_ARRAY_BUFFERS_ENABLED:
+            return TRUE;
+        case PYGI_ARRAY_BUFFERS_DISABLED:
+            return FALSE;
+        default:
+            return _pygi_array_buffers_default;
+    }
+}
+
 PyObject *
 _pygi_marshal_to_py_array (PyGIInvokeState   *state,
                            PyGICallableCache *callable_cache,
@@ -307,6 +364,17 @@ _pygi_marshal_to_py_array (PyGIInvokeState   *state,
         array_ = arg->v_pointer;
     }
 
+    /* uint8 arrays already come out as bytes */
+    if (seq_cache->array_type != GI_ARRAY_TYPE_PTR_ARRAY &&
+            seq_cache->item_cache->type_tag != GI_TYPE_TAG_UINT8 &&
+            !seq_cache->item_cache->is_pointer &&
+            _array_buffers_enabled (callable_cache)) {
+        const gchar *format = _pygi_array_buffer_format (seq_cache->item_cache->type_tag);
+
+        if (format != NULL)
+            return _pygi_marshal_to_py_array_buffer (arg_cache, arg, array_, format);
+    }
+
     if (seq_cache->item_cache->type_tag == GI_TYPE_TAG_UINT8) {
         if (arg->v_pointer == NULL) {
             py_obj = PYGLIB_PyBytes_FromString ("");
@@ -27,6 +27,8 @@
 #include "pygi-foreign.h"
 #include "pygi-closure.h"
 #include "pygi-ccallback.h"
+#include "pygi-array-buffer.h"
+#include "pygi-string-cache.h"
 #include "pygi-callbacks.h"
 #include "pygi-property.h"
 #include "pygi-signal-closure.h"
@@ -46,36 +46,157 @@ _pygi_lookup_signal_from_g_type (GType g_type,
     GIBaseInfo *info;
     gssize n_infos;
     gssize i;
-    GType parent;
 
     repository = g_irepository_get_default();
     info = g_irepository_find_by_gtype (repository, g_type);
-    if (info != NULL) {
-        n_infos = g_object_info_get_n_signals ( (GIObjectInfo *) info);
-        for (i = 0; i < n_infos; i++) {
-            GISignalInfo *signal_info;
+    if (info == NULL)
+        return NULL;
 
-            signal_info = g_object_info_get_signal ( (GIObjectInfo *) info, i);
-            g_assert (info != NULL);
+    n_infos = g_object_info_get_n_signals ( (GIObjectInfo *) info);
+    for (i = 0; i < n_infos; i++) {
+        GISignalInfo *signal_info;
 
-            if (strcmp (signal_name, g_base_info_get_name (signal_info)) == 0) {
-                g_base_info_unref (info);
-                return signal_info;
-            }
+        signal_info = g_object_info_get_signal ( (GIObjectInfo *) info, i);
+        g_assert (info != NULL);
 
-            g_base_info_unref (signal_info);
+        if (strcmp (signal_name, g_base_info_get_name (signal_info)) == 0) {
+            g_base_info_unref (info);
+            return signal_info;
         }
 
-        g_base_info_unref (info);
+        g_base_info_unref (signal_info);
     }
 
-    parent = g_type_parent (g_type);
-    if (parent > 0)
-        return _pygi_lookup_signal_from_g_type (parent, signal_name);
-
+    g_base_info_unref (info);
     return NULL;
 }
 
+/* Describe how to convert the arguments of signal_info, so emissions don't
+ * have to query the introspection data again. */
+static PyGISignalCache *
+_pygi_signal_cache_new (GISignalInfo *signal_info)
+{
+    PyGISignalCache *cache;
+    gint i;
+
+    cache = g_new0 (PyGISignalCache, 1);
+    cache->signal_info = g_base_info_ref (signal_info);
+    cache->n_args = g_callable_info_get_n_args ( (GICallableInfo *) signal_info);
+    cache->args = g_new0 (PyGISignalArgCache, cache->n_args);
+
+    for (i = 0; i < cache->n_args; i++) {
+        PyGISignalArgCache *arg_cache = &cache->args[i];
+        GIArgInfo *arg_info;
+
+        arg_info = g_callable_info_get_arg ( (GICallableInfo *) signal_info, i);
+        arg_cache->type_info = g_arg_info_get_type (arg_info);
+        arg_cache->transfer = g_arg_info_get_ownership_transfer (arg_info);
+        arg_cache->is_array =
+            g_type_info_get_tag (arg_cache->type_info) == GI_TYPE_TAG_ARRAY;
+        g_base_info_unref (arg_info);
+    }
+
+    return cache;
+}
+
+/* Signal caches, kept per GType in a table mapping signal names to the
+ * cache of the type or parent type defining the signal. GTypes are never
+ * unregistered, so the tables and caches are kept for the life of the
+ * process.
+ *
+ * Signals without introspection data, such as the __gsignals__ of python
+ * classes, are recorded in a second table along with the number of loaded
+ * namespaces at the time of the lookup: the typelib defining the type may
+ * only be loaded later, in which case they are looked up again. */
+static GQuark _pygi_signal_cache_quark = 0;
+static GQuark _pygi_signal_miss_quark = 0;
+
+static guint
+_pygi_repository_generation (void)
+{
+    gchar **namespaces;
+    guint n_namespaces;
+
+    namespaces = g_irepository_get_loaded_namespaces (g_irepository_get_default ());
+    n_namespaces = g_strv_length (namespaces);
+    g_strfreev (namespaces);
+
+    return n_namespaces;
+}
+
+static GHashTable *
+_pygi_signal_table_get (GType g_type, GQuark quark)
+{
+    GHashTable *table;
+
+    table = g_type_get_qdata (g_type, quark);
+    if (table == NULL) {
+        table = g_hash_table_new_full (g_str_hash, g_str_equal, g_free, NULL);
+        g_type_set_qdata (g_type, quark, table);
+    }
+
+    return table;
+}
+
+static PyGISignalCache *
+_pygi_signal_cache_lookup (GType g_type,
+                           const gchar *signal_name,
+                           guint generation)
+{
+    GHashTable *signal_caches;
+    GHashTable *signal_misses;
+    PyGISignalCache *cache = NULL;
+    GISignalInfo *signal_info;
+    gpointer miss_generation;
+    GType parent;
+
+    signal_caches = _pygi_signal_table_get (g_type, _pygi_signal_cache_quark);
+    cache = g_hash_table_lookup (signal_caches, signal_name);
+    if (cache != NULL)
+        return cache;
+
+    signal_misses = _pygi_signal_table_get (g_type, _pygi_signal_miss_quark);
+    if (g_hash_table_lookup_extended (signal_misses, signal_name,
+                                      NULL, &miss_generation) &&
+            GPOINTER_TO_UINT (miss_generation) == generation)
+        return NULL;
+
+    signal_info = _pygi_lookup_signal_from_g_type (g_type, signal_name);
+    if (signal_info != NULL) {
+        cache = _pygi_signal_cache_new (signal_info);
+        g_base_info_unref (signal_info);
+    } else {
+        parent = g_type_parent (g_type);
+        if (parent > 0)
+            cache = _pygi_signal_cache_lookup (parent, signal_name, generation);
+    }
+
+    if (cache != NULL) {
+        g_hash_table_remove (signal_misses, signal_name);
+        g_hash_table_insert (signal_caches, g_strdup (signal_name), cache);
+    } else {
+        g_hash_table_insert (signal_misses, g_strdup (signal_name),
+                             GUINT_TO_POINTER (generation));
+    }
+
+    return cache;
+}
+
+static PyGISignalCache *
+_pygi_signal_cache_get (GType g_type,
+                        const gchar *signal_name)
+{
+    if (_pygi_signal_cache_quark == 0) {
+        _pygi_signal_cache_quark =
+            g_quark_from_static_string ("PyGI::signal-cache");
+        _pygi_signal_miss_quark =
+            g_quark_from_static_string ("PyGI::signal-miss");
+    }
+
+    return _pygi_signal_cache_lookup (g_type, signal_name,
+                                      _pygi_repository_generation ());
+}
+
 static void
 pygi_signal_closure_invalidate(gpointer data,
                                GClosure *closure)
@@ -93,8 +214,8 @@ pygi_signal_closure_invalidate(gpointer data,
     pc->extra_args = NULL;
     pc->swap_data = NULL;
 
-    g_base_info_unref (((PyGISignalClosure *) pc)->signal_info);
-    ((PyGISignalClosure *) pc)->signal_info = NULL;
+    /* the signal cache is shared, see _pygi_signal_cache_get() */
+    ((PyGISignalClosure *) pc)->cache = NULL;
 }
 
 static void
@@ -109,17 +230,15 @@ pygi_signal_closure_marshal(GClosure *closure,
     PyGClosure *pc = (PyGClosure *)closure;
     PyObject *params, *ret = NULL;
     guint i;
-    GISignalInfo *signal_info;
-    gint n_sig_info_args;
+    PyGISignalCache *cache;
     gint sig_info_highest_arg;
 
     state = PyGILState_Ensure();
 
-    signal_info = ((PyGISignalClosure *)closure)->signal_info;
-    n_sig_info_args = g_callable_info_get_n_args(signal_info);
+    cache = ((PyGISignalClosure *)closure)->cache;
     /* the first argument to a signal callback is instance,
        but instance is not counted in the introspection data */
-    sig_info_highest_arg = n_sig_info_args + 1;
+    sig_info_highest_arg = cache->n_args + 1;
     g_assert_cmpint(sig_info_highest_arg, ==, n_param_values);
 
     /* construct Python tuple for the parameter values */
@@ -140,25 +259,22 @@ pygi_signal_closure_marshal(GClosure *closure,
             PyTuple_SetItem(params, i, item);
 
         } else if (i < sig_info_highest_arg) {
-            GIArgInfo arg_info;
-            GITypeInfo type_info;
-            GITransfer transfer;
+            PyGISignalArgCache *arg_cache = &cache->args[i - 1];
             GIArgument arg = { 0, };
             PyObject *item = NULL;
             gboolean free_array = FALSE;
 
-            g_callable_info_load_arg(signal_info, i - 1, &arg_info);
-            g_arg_info_load_type(&arg_info, &type_info);
-            transfer = g_arg_info_get_ownership_transfer(&arg_info);
+            arg = _pygi_argument_from_g_value(&param_values[i],
+                                              arg_cache->type_info);
 
-            arg = _pygi_argument_from_g_value(&param_values[i], &type_info);
-            
-            if (g_type_info_get_tag (&type_info) == GI_TYPE_TAG_ARRAY) {
+            if (arg_cache->is_array) {
                 arg.v_pointer = _pygi_argument_to_array (&arg, NULL,
-                                                         &type_info, &free_array);
+                                                         arg_cache->type_info,
+                                                         &free_array);
             }
-            
-            item = _pygi_argument_to_object (&arg, &type_info, transfer);
+
+            item = _pygi_argument_to_object (&arg, arg_cache->type_info,
+                                             arg_cache->transfer);
             
             if (free_array) {
                 g_array_free (arg.v_pointer, FALSE);
@@ -212,7 +328,7 @@ pygi_signal_closure_new_real (PyGObject *instance,
     GClosure *closure = NULL;
     PyGISignalClosure *pygi_closure = NULL;
     GType g_type;
-    GISignalInfo *signal_info = NULL;
+    PyGISignalCache *cache;
     char *signal_name = g_strdup (sig_name);
 
     g_return_val_if_fail(callback != NULL, NULL);
@@ -220,9 +336,9 @@ pygi_signal_closure_new_real (PyGObject *instance,
     canonicalize_key(signal_name);
 
     g_type = pyg_type_from_object ((PyObject *)instance);
-    signal_info = _pygi_lookup_signal_from_g_type (g_type, signal_name);
+    cache = _pygi_signal_cache_get (g_type, signal_name);
 
-    if (signal_info == NULL)
+    if (cache == NULL)
         goto out;
 
     closure = g_closure_new_simple(sizeof(PyGISignalClosure), NULL);
@@ -231,7 +347,7 @@ pygi_signal_closure_new_real (PyGObject *instance,
 
     pygi_closure = (PyGISignalClosure *)closure;
 
-    pygi_closure->signal_info = signal_info;
+    pygi_closure->cache = cache;
     Py_INCREF(callback);
     pygi_closure->pyg_closure.callback = callback;
 
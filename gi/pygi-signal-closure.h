@@ -29,10 +29,24 @@
 G_BEGIN_DECLS
 
 /* Private */
+typedef struct _PyGISignalArgCache
+{
+    GITypeInfo *type_info;
+    GITransfer transfer;
+    gboolean is_array;
+} PyGISignalArgCache;
+
+typedef struct _PyGISignalCache
+{
+    GISignalInfo *signal_info;
+    gint n_args;
+    PyGISignalArgCache *args;
+} PyGISignalCache;
+
 typedef struct _PyGISignalClosure
 {
     PyGClosure pyg_closure;
-    GISignalInfo *signal_info;
+    PyGISignalCache *cache;
 } PyGISignalClosure;
 
 GClosure * pygi_signal_closure_new_real (PyGObject *instance,
@@ -0,0 +1,132 @@
+/* -*- Mode: C; c-basic-offset: 4 -*-
+ * vim: tabstop=4 shiftwidth=4 expandtab
+ *
+ *   pygi-string-cache.c: bounded cache of python strings returned from C.
+ *
+ * This library is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU Lesser General Public
+ * License as published by the Free Software Foundation; either
+ * version 2.1 of the License, or (at your option) any later version.
+ *
+ * This library is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+ * Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public
+ * License along with this library; if not, write to the Free Software
+ * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301
+ * USA
+ */
+
+#include "pygi-private.h"
+
+#include <string.h>
+#include <pyglib-python-compat.h>
+
+/* C APIs tend to hand out the same short strings over and over (type and
+ * icon names, property nicks, tree model columns...). When enabled with
+ * gi.set_string_cache_size() the python strings created for them are kept
+ * in a least recently used cache keyed by content, so repeated returns
+ * share one str instead of allocating a new one each time.
+ *
+ * Only touched with the GIL held.
+ */
+
+/* longer strings are rarely repeated and expensive to hash */
+#define STRING_CACHE_MAX_LENGTH 128
+
+typedef struct {
+    gchar *string;
+    PyObject *py_str;
+} PyGIStringCacheEntry;
+
+static GHashTable *_string_cache_index = NULL; /* string -> link in _string_cache_lru */
+static GQueue _string_cache_lru = G_QUEUE_INIT; /* most recently used first */
+static guint _string_cache_max_size = 0;
+static guint64 _string_cache_hits = 0;
+static guint64 _string_cache_misses = 0;
+
+static void
+_string_cache_evict_tail (void)
+{
+    PyGIStringCacheEntry *entry = g_queue_pop_tail (&_string_cache_lru);
+
+    g_hash_table_remove (_string_cache_index, entry->string);
+    Py_DECREF (entry->py_str);
+    g_free (entry->string);
+    g_slice_free (PyGIStringCacheEntry, entry);
+}
+
+PyObject *
+_pygi_string_cache_get (const gchar *string)
+{
+    PyGIStringCacheEntry *entry;
+    PyObject *py_str;
+    GList *link;
+
+    if (_string_cache_max_size == 0 ||
+            strlen (string) > STRING_CACHE_MAX_LENGTH)
+        return PYGLIB_PyUnicode_FromString (string);
+
+    link = g_hash_table_lookup (_string_cache_index, string);
+    if (link != NULL) {
+        _string_cache_hits++;
+
+        g_queue_unlink (&_string_cache_lru, link);
+        g_queue_push_head_link (&_string_cache_lru, link);
+
+        entry = link->data;
+        Py_INCREF (entry->py_str);
+        return entry->py_str;
+    }
+
+    _string_cache_misses++;
+
+    py_str = PYGLIB_PyUnicode_FromString (string);
+    if (py_str == NULL)
+        return NULL;
+
+    entry = g_slice_new (PyGIStringCacheEntry);
+    entry->string = g_strdup (string);
+    Py_INCREF (py_str);
+    entry->py_str = py_str;
+
+    g_queue_push_head (&_string_cache_lru, entry);
+    g_hash_table_insert (_string_cache_index, entry->string,
+                         _string_cache_lru.head);
+
+    if (_string_cache_lru.length > _string_cache_max_size)
+        _string_cache_evict_tail ();
+
+    return py_str;
+}
+
+PyObject *
+_wrap_pyg_set_string_cache_size (PyObject *self, PyObject *args)
+{
+    guint max_size;
+
+    if (!PyArg_ParseTuple (args, "I:set_string_cache_size", &max_size))
+        return NULL;
+
+    _string_cache_max_size = max_size;
+
+    if (_string_cache_index == NULL && max_size > 0)
+        _string_cache_index = g_hash_table_new (g_str_hash, g_str_equal);
+
+    while (_string_cache_lru.length > max_size)
+        _string_cache_evict_tail ();
+
+    Py_RETURN_NONE;
+}
+
+PyObject *
+_wrap_pyg_get_string_cache_info (PyObject *self)
+{
+    return Py_BuildValue ("{sKsKsIsI}",
+                          "hits", (unsigned PY_LONG_LONG) _string_cache_hits,
+                          "misses", (unsigned PY_LONG_LONG) _string_cache_misses,
+                          "size", _string_cache_lru.length,
+                          "max_size", _string_cache_max_size);
+}
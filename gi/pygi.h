@@ -42,6 +42,9 @@ typedef struct {
     GIBaseInfo *info;
     PyObject *inst_weakreflist;
     PyGICallableCache *cache;
+#if PY_VERSION_HEX >= 0x03090000
+    vectorcallfunc vectorcall;
+#endif
 } PyGIBaseInfo;
 
 typedef struct {
@@ -0,0 +1,185 @@
+# -*- Mode: Python; py-indent-offset: 4 -*-
+# vim: tabstop=4 shiftwidth=4 expandtab
+#
+#   snapshot.py: pregenerated wrapper metadata for namespaces.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301
+# USA
+
+"""Snapshots of the wrapper metadata of a namespace.
+
+A snapshot is a Python module holding everything gi.cache would compute for
+a namespace: the enum and flags values, the parents and interfaces of the
+objects, the member names of the classes and their method resolution
+orders. It is created with
+
+    python -m gi.snapshot Gtk-3.0 -o gtk_snapshot.py
+
+Importing the snapshot module registers it, and the following import of
+gi.repository.Gtk uses its data instead of querying the typelib. This suits
+frozen or embedded deployments, where the snapshot can be shipped along with
+the typelibs. The snapshot is only used if the SHA-1 checksum of the typelib
+file still matches the one it was created from.
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import optparse
+import pprint
+import sys
+import warnings
+
+import gi
+from . import cache
+from ._gi import \
+    Repository, \
+    CallbackInfo, \
+    EnumInfo, \
+    ObjectInfo, \
+    RegisteredTypeInfo
+from .types import \
+    GObjectMeta, \
+    MetaClassHelper
+
+repository = Repository.get_default()
+
+# namespace -> (version, checksum, data)
+_snapshots = {}
+
+
+def get_checksum(namespace):
+    """Return the SHA-1 checksum of the typelib file of namespace, which
+    must be loaded."""
+    with open(repository.get_typelib_path(namespace), 'rb') as typelib:
+        return hashlib.sha1(typelib.read()).hexdigest()
+
+
+def register(namespace, version, checksum, data):
+    """Register the data of a snapshot of namespace, to be used when the
+    namespace is imported. Called by the snapshot modules."""
+    _snapshots[namespace] = (version, checksum, data)
+
+
+def load(namespace, version):
+    """Preload the cache with the snapshot registered for namespace, which
+    must be loaded, if it matches the typelib. Returns whether it did."""
+    snapshot = _snapshots.pop(namespace, None)
+    if snapshot is None:
+        return False
+
+    snapshot_version, checksum, data = snapshot
+    if snapshot_version != version:
+        warnings.warn('Ignoring the snapshot of %s-%s, version %s is loaded' %
+                      (namespace, snapshot_version, version), RuntimeWarning)
+        return False
+
+    if get_checksum(namespace) != checksum:
+        warnings.warn('Ignoring the snapshot of %s-%s, the typelib changed' %
+                      (namespace, version), RuntimeWarning)
+        return False
+
+    cache.preload(namespace, data)
+    return True
+
+
+def _collect(namespace):
+    from .module import _get_bases_names, _get_enum_values
+
+    dynamic_module = __import__('gi.repository', fromlist=[namespace])
+    introspection_module = getattr(dynamic_module, namespace)._introspection_module
+
+    data = cache.record(namespace)
+    try:
+        for info in repository.get_infos(namespace):
+            if isinstance(info, EnumInfo):
+                _get_enum_values(info)
+                continue
+            if isinstance(info, CallbackInfo) or \
+                    not isinstance(info, RegisteredTypeInfo):
+                continue
+            if isinstance(info, ObjectInfo):
+                _get_bases_names(info)
+
+            try:
+                wrapper = getattr(introspection_module, info.get_name())
+            except (TypeError, NotImplementedError):
+                # not wrappable
+                continue
+
+            if isinstance(wrapper, MetaClassHelper):
+                wrapper._member_names()
+            if isinstance(wrapper, GObjectMeta):
+                # the wrapper may be an override subclassing the class with
+                # the info
+                for cls in wrapper.__mro__:
+                    if '__info__' in cls.__dict__:
+                        type(cls).mro(cls)
+                        break
+    finally:
+        cache.stop_recording(namespace)
+
+    return data
+
+
+def create(namespace, version=None):
+    """Return the source of a snapshot module for namespace."""
+    if version is not None:
+        gi.require_version(namespace, version)
+    data = _collect(namespace)
+    version = repository.get_version(namespace)
+
+    values = {
+        'namespace': namespace,
+        'version': version,
+        'checksum': get_checksum(namespace),
+        'data': pprint.pformat(data),
+    }
+
+    return ('# Snapshot of the %(namespace)s-%(version)s wrapper metadata, generated by\n'
+            '# python -m gi.snapshot. Import it before gi.repository.%(namespace)s.\n'
+            '\n'
+            'from gi.snapshot import register\n'
+            '\n'
+            'register(%(namespace)r, %(version)r, %(checksum)r,\n'
+            '%(data)s)\n') % values
+
+
+def main(argv=None):
+    parser = optparse.OptionParser(
+        usage='%prog NAMESPACE[-VERSION] [-o FILE]',
+        description='Write a snapshot module of the wrapper metadata of a '
+                    'namespace.')
+    parser.add_option('-o', '--output', dest='output', metavar='FILE',
+                      help='write the module to FILE instead of stdout')
+    options, args = parser.parse_args(argv)
+    if len(args) != 1:
+        parser.error('expected a single namespace')
+
+    namespace, version = args[0], None
+    if '-' in namespace:
+        namespace, version = namespace.split('-', 1)
+
+    source = create(namespace, version)
+    if options.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(options.output, 'w') as output:
+            output.write(source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -23,13 +23,15 @@
 from __future__ import absolute_import
 
 import sys
+import weakref
 from . import _gobject
+from . import cache
+from . import profiler
 
 from ._gi import \
     InterfaceInfo, \
     ObjectInfo, \
     StructInfo, \
-    VFuncInfo, \
     register_interface_info, \
     hook_up_vfunc_implementation
 
@@ -41,30 +43,22 @@ if sys.version_info > (3, 0):
         return hasattr(obj, '__call__')
 
 
-def Function(info):
-
-    def function(*args, **kwargs):
-        return info.invoke(*args, **kwargs)
-    function.__info__ = info
-    function.__name__ = info.get_name()
-    function.__module__ = info.get_namespace()
-
-    return function
-
-
 class NativeVFunc(object):
 
     def __init__(self, info):
         self._info = info
+        # GType -> VFuncInfo bound to it. GTypes are never unregistered, and
+        # unlike classes they can be looked up without creating a weak
+        # reference on each access.
+        self._bound = {}
 
     def __get__(self, instance, klass):
-        def native_vfunc(*args, **kwargs):
-            return self._info.invoke(klass.__gtype__, *args, **kwargs)
-        native_vfunc.__info__ = self._info
-        native_vfunc.__name__ = self._info.get_name()
-        native_vfunc.__module__ = self._info.get_namespace()
-
-        return native_vfunc
+        gtype = klass.__gtype__
+        try:
+            return self._bound[gtype]
+        except KeyError:
+            native_vfunc = self._bound[gtype] = self._info.bind(gtype)
+            return native_vfunc
 
 
 def Constructor(info):
@@ -82,37 +76,58 @@ def Constructor(info):
     return constructor
 
 
-class MetaClassHelper(object):
+class _LazyMember(object):
+    """Placeholder for a member of the introspection info of a class,
+    replaced by the actual member in the class dict on first lookup.
 
-    def _setup_constructors(cls):
-        for method_info in cls.__info__.get_methods():
-            if method_info.is_constructor():
-                name = method_info.get_name()
-                constructor = classmethod(Constructor(method_info))
-                setattr(cls, name, constructor)
-
-    def _setup_methods(cls):
-        for method_info in cls.__info__.get_methods():
-            name = method_info.get_name()
-            function = Function(method_info)
-            if method_info.is_method():
-                method = function
-            elif method_info.is_constructor():
-                continue
-            else:
-                method = staticmethod(function)
-            setattr(cls, name, method)
+    Being in the class dict, it is found by super() and shadows the members
+    of the bases like the actual member would."""
+
+    __slots__ = ('klass', 'name')
 
-    def _setup_fields(cls):
-        for field_info in cls.__info__.get_fields():
-            name = field_info.get_name().replace('-', '_')
-            setattr(cls, name, property(field_info.get_value, field_info.set_value))
+    def __init__(self, klass, name):
+        self.klass = klass
+        self.name = name
 
-    def _setup_constants(cls):
-        for constant_info in cls.__info__.get_constants():
-            name = constant_info.get_name()
-            value = constant_info.get_value()
-            setattr(cls, name, value)
+    def __get__(self, instance, owner):
+        klass = self.klass
+        value = type(klass)._resolve_member(klass, self.name)
+        if value is None:
+            raise AttributeError("type object '%s' has no attribute '%s'" %
+                                 (klass.__name__, self.name))
+
+        setattr(klass, self.name, value)
+        profiler.add_member()
+
+        if hasattr(value, '__get__'):
+            return value.__get__(instance, owner)
+        return value
+
+
+class MetaClassHelper(object):
+
+    def _member_names(cls):
+        info = cls.__info__
+        return cache.lookup(info.get_namespace(), 'members', info.get_name(),
+                            lambda: sorted(set(info.get_member_names())))
+
+    def _get_static_member(cls, name):
+        info = cls.__info__
+        if hasattr(info, 'find_field'):
+            field_info = info.find_field(name)
+            if field_info is not None:
+                return property(field_info.get_value, field_info.set_value)
+        if hasattr(info, 'find_constant'):
+            constant_info = info.find_constant(name)
+            if constant_info is not None:
+                return constant_info.get_value()
+        return None
+
+    def _setup_lazy_members(cls):
+        # The members are only created when looked up, see _LazyMember.
+        for name in cls._member_names():
+            if name not in cls.__dict__:
+                setattr(cls, name, _LazyMember(cls, name))
 
     def _setup_vfuncs(cls):
         for vfunc_name, py_vfunc in cls.__dict__.items():
@@ -121,24 +136,22 @@ class MetaClassHelper(object):
 
             # If a method name starts with "do_" assume it is a vfunc, and search
             # in the base classes for a method with the same name to override.
-            # Recursion is necessary as overriden methods in most immediate parent
-            # classes may shadow vfuncs from classes higher in the hierarchy.
+            # The most immediate parent class providing it wins, as overriden
+            # methods may shadow vfuncs from classes higher in the hierarchy.
+            name = vfunc_name[len("do_"):]
             vfunc_info = None
             for base in cls.__mro__:
-                method = getattr(base, vfunc_name, None)
-                if method is not None and hasattr(method, '__info__') and \
-                        isinstance(method.__info__, VFuncInfo):
-                    vfunc_info = method.__info__
-                    break
+                if isinstance(base.__dict__.get('__info__'), ObjectInfo):
+                    vfunc_info = _get_vfunc_index(base).get(name)
+                    if vfunc_info is not None:
+                        break
 
             # If we did not find a matching method name in the bases, we might
-            # be overriding an interface virtual method. Since interfaces do not
-            # provide implementations, there will be no method attribute installed
-            # on the object. Instead we have to search through
-            # InterfaceInfo.get_vfuncs(). Note that the infos returned by
-            # get_vfuncs() use the C vfunc name (ie. there is no "do_" prefix).
+            # be overriding an interface virtual method. Note that the infos
+            # returned by get_vfuncs() use the C vfunc name (ie. there is no
+            # "do_" prefix).
             if vfunc_info is None:
-                vfunc_info = find_vfunc_info_in_interface(cls.__bases__, vfunc_name[len("do_"):])
+                vfunc_info = find_vfunc_info_in_interface(cls.__bases__, name)
 
             if vfunc_info is not None:
                 assert vfunc_name == ('do_' + vfunc_info.get_name())
@@ -160,87 +173,167 @@ class MetaClassHelper(object):
                 hook_up_vfunc_implementation(vfunc_info, cls.__gtype__,
                                              py_vfunc)
 
-    def _setup_native_vfuncs(cls):
-        # Only InterfaceInfo and ObjectInfo have the get_vfuncs() method.
-        # We skip InterfaceInfo because interfaces have no implementations for vfuncs.
-        # Also check if __info__ in __dict__, not hasattr('__info__', ...)
-        # because we do not want to accidentally retrieve __info__ from a base class.
-        class_info = cls.__dict__.get('__info__')
-        if class_info is None or not isinstance(class_info, ObjectInfo):
-            return
 
-        for vfunc_info in class_info.get_vfuncs():
-            name = 'do_%s' % vfunc_info.get_name()
-            value = NativeVFunc(vfunc_info)
-            setattr(cls, name, value)
+# Indexes of the vfuncs of the wrapper classes, to avoid scanning the
+# get_vfuncs() of all the bases for each vfunc implemented in Python.
+_vfunc_indexes = weakref.WeakKeyDictionary()
+_vfunc_owners = weakref.WeakKeyDictionary()
+
+
+def _is_wrapped_interface(klass):
+    # All wrapped interfaces inherit from GInterface.
+    # This can be seen in IntrospectionModule.__getattr__() in module.py.
+    # We also skip GInterface, because it is not wrapped and has no __info__ attr.
+    return klass is not _gobject.GInterface and \
+        issubclass(klass, _gobject.GInterface) and \
+        isinstance(klass.__info__, InterfaceInfo)
+
+
+def _get_vfunc_index(klass):
+    """Map the vfunc names of the info of klass to their VFuncInfo. For
+    interfaces, this includes the vfuncs of the interfaces they derive
+    from."""
+    index = _vfunc_indexes.get(klass)
+    if index is None:
+        index = dict((vfunc_info.get_name(), vfunc_info)
+                     for vfunc_info in klass.__info__.get_vfuncs())
+        if _is_wrapped_interface(klass):
+            for base in klass.__bases__:
+                if _is_wrapped_interface(base):
+                    for name, vfunc_info in _get_vfunc_index(base).items():
+                        index.setdefault(name, vfunc_info)
+        _vfunc_indexes[klass] = index
+    return index
+
+
+def _get_vfunc_owners(klass):
+    """Map vfunc names to a list of (class, VFuncInfo) for the different
+    vfuncs with that name provided by klass and its bases, in depth first
+    order."""
+    owners = _vfunc_owners.get(klass)
+    if owners is not None:
+        return owners
+
+    owners = {}
+    info = getattr(klass, '__info__', None)
+    if info is not None and hasattr(info, 'get_vfuncs'):
+        for vfunc_info in info.get_vfuncs():
+            owners[vfunc_info.get_name()] = [(klass, vfunc_info)]
+
+    for base in klass.__bases__:
+        for name, base_owners in _get_vfunc_owners(base).items():
+            name_owners = owners.setdefault(name, [])
+            for owner, vfunc_info in base_owners:
+                for _, known_info in name_owners:
+                    if known_info == vfunc_info:
+                        break
+                else:
+                    name_owners.append((owner, vfunc_info))
+
+    _vfunc_owners[klass] = owners
+    return owners
 
 
 def find_vfunc_info_in_interface(bases, vfunc_name):
+    # We do not need to search regular classes here, only wrapped interfaces.
     for base in bases:
-        # All wrapped interfaces inherit from GInterface.
-        # This can be seen in IntrospectionModule.__getattr__() in module.py.
-        # We do not need to search regular classes here, only wrapped interfaces.
-        # We also skip GInterface, because it is not wrapped and has no __info__ attr.
-        if base is _gobject.GInterface or\
-                not issubclass(base, _gobject.GInterface) or\
-                not isinstance(base.__info__, InterfaceInfo):
-            continue
-
-        for vfunc in base.__info__.get_vfuncs():
-            if vfunc.get_name() == vfunc_name:
+        if _is_wrapped_interface(base):
+            vfunc = _get_vfunc_index(base).get(vfunc_name)
+            if vfunc is not None:
                 return vfunc
 
-        vfunc = find_vfunc_info_in_interface(base.__bases__, vfunc_name)
-        if vfunc is not None:
-            return vfunc
-
     return None
 
 
 def find_vfunc_conflict_in_bases(vfunc, bases):
+    vfunc_name = vfunc.get_name()
     for klass in bases:
-        if not hasattr(klass, '__info__') or \
-                not hasattr(klass.__info__, 'get_vfuncs'):
-            continue
-        vfuncs = klass.__info__.get_vfuncs()
-        vfunc_name = vfunc.get_name()
-        for v in vfuncs:
-            if v.get_name() == vfunc_name and v != vfunc:
-                return klass
-
-        aklass = find_vfunc_conflict_in_bases(vfunc, klass.__bases__)
-        if aklass is not None:
-            return aklass
+        for owner, vfunc_info in _get_vfunc_owners(klass).get(vfunc_name, ()):
+            if vfunc_info != vfunc:
+                return owner
     return None
 
 
 class GObjectMeta(_gobject.GObjectMeta, MetaClassHelper):
 
     def __init__(cls, name, bases, dict_):
-        super(GObjectMeta, cls).__init__(name, bases, dict_)
-        is_gi_defined = False
-        if cls.__module__ == 'gi.repository.' + cls.__info__.get_namespace():
-            is_gi_defined = True
-
-        is_python_defined = False
-        if not is_gi_defined and cls.__module__ != GObjectMeta.__module__:
-            is_python_defined = True
-
-        if is_python_defined:
-            cls._setup_vfuncs()
-        elif is_gi_defined:
-            cls._setup_methods()
-            cls._setup_constants()
-            cls._setup_native_vfuncs()
-
-            if isinstance(cls.__info__, ObjectInfo):
-                cls._setup_fields()
-                cls._setup_constructors()
-            elif isinstance(cls.__info__, InterfaceInfo):
-                register_interface_info(cls.__info__.get_g_type())
+        with profiler.measure('class', cls.__module__, name):
+            super(GObjectMeta, cls).__init__(name, bases, dict_)
+            is_gi_defined = False
+            if cls.__module__ == 'gi.repository.' + cls.__info__.get_namespace():
+                is_gi_defined = True
+
+            is_python_defined = False
+            if not is_gi_defined and cls.__module__ != GObjectMeta.__module__:
+                is_python_defined = True
+
+            if is_python_defined:
+                cls._setup_vfuncs()
+            elif is_gi_defined:
+                if isinstance(cls.__info__, (ObjectInfo, InterfaceInfo)):
+                    cls._setup_lazy_members()
+                if isinstance(cls.__info__, InterfaceInfo):
+                    register_interface_info(cls.__info__.get_g_type())
+
+    def _resolve_member(cls, name):
+        info = cls.__dict__['__info__']
+        method_info = info.find_method(name)
+        if method_info is not None and method_info.is_constructor():
+            if isinstance(info, ObjectInfo):
+                return classmethod(Constructor(method_info))
+            # interfaces don't expose their constructors
+            method_info = None
+
+        member = cls._get_static_member(name)
+        if member is not None:
+            return member
+
+        if isinstance(info, ObjectInfo) and name.startswith('do_'):
+            vfunc_info = info.find_vfunc(name[len('do_'):])
+            if vfunc_info is not None:
+                return NativeVFunc(vfunc_info)
+
+        # FunctionInfo objects are callable descriptors: methods bind to the
+        # instance and everything else behaves like a staticmethod.
+        return method_info
 
     def mro(cls):
-        return mro(cls)
+        # Only the wrappers created by IntrospectionModule have a stable
+        # hierarchy, which depends on the typelibs and overrides only.
+        info = cls.__dict__.get('__info__')
+        if info is None or cls.__module__ != 'gi.repository.' + info.get_namespace():
+            return mro(cls)
+
+        # mapping the cached names back to the classes only pays off when
+        # they are actually cached
+        if not cache.is_used(info.get_namespace()):
+            return mro(cls)
+
+        names = cache.lookup(info.get_namespace(), 'mro', info.get_name(),
+                             lambda: [_get_qualified_name(C) for C in mro(cls)])
+        result = _mro_from_names(cls, names)
+        if result is None:
+            result = mro(cls)
+        return result
+
+
+def _get_qualified_name(C):
+    return '%s.%s' % (C.__module__, C.__name__)
+
+
+def _mro_from_names(C, names):
+    """Map the qualified names of a cached mro of C back to the classes, or
+    return None if they don't match the current bases of C."""
+    classes = {_get_qualified_name(C): C}
+    for base in C.__bases__:
+        for klass in base.__mro__:
+            if classes.setdefault(_get_qualified_name(klass), klass) is not klass:
+                return None
+
+    if len(names) != len(classes) or set(names) != set(classes):
+        return None
+
+    return [classes[name] for name in names]
 
 
 def mro(C):
@@ -249,33 +342,49 @@ def mro(C):
     Based on http://www.python.org/download/releases/2.3/mro/
     Modified to consider that interfaces don't create the diamond problem
     """
-    # TODO: If this turns out being too slow, consider using generators
-    bases = []
-    bases_of_subclasses = [[C]]
-
+    # The bases already have their mro computed, use it instead of
+    # recursing into the whole hierarchy again.
+    sequences = [[C]]
     if C.__bases__:
-        bases_of_subclasses += list(map(mro, C.__bases__)) + [list(C.__bases__)]
-
-    while bases_of_subclasses:
-        for subclass_bases in bases_of_subclasses:
-            candidate = subclass_bases[0]
-            not_head = [s for s in bases_of_subclasses if candidate in s[1:]]
-            if not_head and _gobject.GInterface not in candidate.__bases__:
-                candidate = None  # conflict, reject candidate
-            else:
+        sequences.extend(base.__mro__ for base in C.__bases__)
+        sequences.append(C.__bases__)
+
+    # Instead of scanning all the sequences for each candidate, keep the
+    # position of the head of each sequence and how many times each class
+    # appears after those.
+    heads = [0] * len(sequences)
+    tail_counts = {}
+    for sequence in sequences:
+        for klass in sequence[1:]:
+            tail_counts[klass] = tail_counts.get(klass, 0) + 1
+
+    bases = []
+    while True:
+        candidate = None
+        exhausted = True
+        for i, sequence in enumerate(sequences):
+            if heads[i] == len(sequence):
+                continue
+            exhausted = False
+            head = sequence[heads[i]]
+            if not tail_counts.get(head) or _gobject.GInterface in head.__bases__:
+                candidate = head
                 break
 
+        if exhausted:
+            break
+
         if candidate is None:
             raise TypeError('Cannot create a consistent method resolution '
                             'order (MRO)')
 
         bases.append(candidate)
 
-        for subclass_bases in bases_of_subclasses[:]:  # remove candidate
-            if subclass_bases and subclass_bases[0] == candidate:
-                del subclass_bases[0]
-                if not subclass_bases:
-                    bases_of_subclasses.remove(subclass_bases)
+        for i, sequence in enumerate(sequences):  # remove candidate
+            if heads[i] < len(sequence) and sequence[heads[i]] is candidate:
+                heads[i] += 1
+                if heads[i] < len(sequence):
+                    tail_counts[sequence[heads[i]]] -= 1
 
     return bases
 
@@ -283,20 +392,27 @@ def mro(C):
 class StructMeta(type, MetaClassHelper):
 
     def __init__(cls, name, bases, dict_):
-        super(StructMeta, cls).__init__(name, bases, dict_)
+        with profiler.measure('class', cls.__module__, name):
+            super(StructMeta, cls).__init__(name, bases, dict_)
 
-        # Avoid touching anything else than the base class.
-        g_type = cls.__info__.get_g_type()
-        if g_type != _gobject.TYPE_INVALID and g_type.pytype is not None:
-            return
+            # Avoid touching anything else than the base class.
+            g_type = cls.__info__.get_g_type()
+            if g_type != _gobject.TYPE_INVALID and g_type.pytype is not None:
+                return
 
-        cls._setup_fields()
-        cls._setup_methods()
-        cls._setup_constructors()
+            cls._setup_lazy_members()
 
-        for method_info in cls.__info__.get_methods():
-            if method_info.is_constructor() and \
-                    method_info.get_name() == 'new' and \
+            method_info = cls.__info__.find_method('new')
+            if method_info is not None and method_info.is_constructor() and \
                     not method_info.get_arguments():
                 cls.__new__ = staticmethod(Constructor(method_info))
-                break
+
+    def _resolve_member(cls, name):
+        info = cls.__dict__['__info__']
+        method_info = info.find_method(name)
+        if method_info is not None:
+            if method_info.is_constructor():
+                return classmethod(Constructor(method_info))
+            return method_info
+
+        return cls._get_static_member(name)
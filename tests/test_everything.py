@@ -674,6 +674,34 @@ class TestSignals(unittest.TestCase):
         obj.connect('sig-with-obj', callback)
         obj.emit_sig_with_obj()
 
+    def test_connect_same_signal_twice(self):
+        obj = Everything.TestObj()
+        values = []
+
+        def callback(obj, obj_param):
+            values.append(obj_param.props.int)
+
+        # the second connect() uses the signal info cached for the GType
+        obj.connect('sig-with-obj', callback)
+        obj.connect('sig_with_obj', callback)
+        obj.emit_sig_with_obj()
+        self.assertEqual(values, [3, 3])
+
+    def test_subclass_signal_args(self):
+        class SubObj(Everything.TestObj):
+            pass
+
+        obj = SubObj()
+        values = []
+
+        def callback(obj, obj_param):
+            values.append(obj_param.props.int)
+
+        # the arguments are converted with the cache of Everything.TestObj
+        obj.connect('sig-with-obj', callback)
+        obj.emit_sig_with_obj()
+        self.assertEqual(values, [3])
+
 
 class TestPango(unittest.TestCase):
     def test_cairo_font_options(self):
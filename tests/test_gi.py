@@ -5,11 +5,13 @@
 import sys
 
 import unittest
+import array
 import tempfile
 import shutil
 import os
 import locale
 import subprocess
+import warnings
 from io import StringIO, BytesIO
 
 import gi
@@ -634,6 +636,28 @@ class TestUtf8(unittest.TestCase):
     def test_utf8_none_return(self):
         self.assertEqual(CONSTANT_UTF8, GIMarshallingTests.utf8_none_return())
 
+    def test_utf8_return_string_cache(self):
+        gi.set_string_cache_size(2)
+        try:
+            before = gi.get_string_cache_info()
+            first = GIMarshallingTests.utf8_none_return()
+            second = GIMarshallingTests.utf8_full_return()
+            self.assertEqual(CONSTANT_UTF8, first)
+            self.assertEqual(CONSTANT_UTF8, second)
+            self.assertTrue(first is second)
+
+            info = gi.get_string_cache_info()
+            self.assertEqual(info['hits'] - before['hits'], 1)
+            self.assertEqual(info['misses'] - before['misses'], 1)
+            self.assertEqual(info['size'], 1)
+            self.assertEqual(info['max_size'], 2)
+        finally:
+            gi.set_string_cache_size(0)
+
+        self.assertEqual(gi.get_string_cache_info()['size'], 0)
+        self.assertFalse(GIMarshallingTests.utf8_none_return() is
+                         GIMarshallingTests.utf8_none_return())
+
     def test_utf8_full_return(self):
         self.assertEqual(CONSTANT_UTF8, GIMarshallingTests.utf8_full_return())
 
@@ -645,6 +669,13 @@ class TestUtf8(unittest.TestCase):
         self.assertRaises(TypeError, GIMarshallingTests.utf8_none_in, CONSTANT_NUMBER)
         self.assertRaises(TypeError, GIMarshallingTests.utf8_none_in, None)
 
+    def test_utf8_none_in_borrowed(self):
+        # transfer none strings are passed to C without being copied
+        self.assertEqual(CONSTANT_UTF8,
+                         GLib.Variant.new_string(CONSTANT_UTF8).get_string())
+        string_ = 'borrowed ' * 64
+        self.assertEqual(string_, GLib.Variant.new_string(string_).get_string())
+
     def test_utf8_none_out(self):
         self.assertEqual(CONSTANT_UTF8, GIMarshallingTests.utf8_none_out())
 
@@ -689,8 +720,43 @@ class TestArray(unittest.TestCase):
     def test_array_return(self):
         self.assertEqual([-1, 0, 1, 2], GIMarshallingTests.array_return())
 
+    def test_array_return_buffer(self):
+        func = GIMarshallingTests.array_return
+        self.assertEqual(func.array_buffers, None)
+        func.array_buffers = True
+        try:
+            # the setting is shared by all the infos of the function
+            other = gi.Repository.get_default().find_by_name('GIMarshallingTests',
+                                                             'array_return')
+            self.assertEqual(other.array_buffers, True)
+
+            ret = func()
+            self.assertTrue(isinstance(ret, memoryview))
+            self.assertTrue(ret.readonly)
+            self.assertEqual(array.array('i', ret.tobytes()).tolist(), [-1, 0, 1, 2])
+        finally:
+            func.array_buffers = None
+        self.assertEqual([-1, 0, 1, 2], func())
+
+        gi.set_array_buffers(True)
+        try:
+            ret = GIMarshallingTests.array_fixed_int_return()
+            self.assertEqual(array.array('i', ret.tobytes()).tolist(), [-1, 0, 1, 2])
+
+            ret = GIMarshallingTests.garray_int_none_return()
+            self.assertEqual(array.array('i', ret.tobytes()).tolist(), [-1, 0, 1, 2])
+
+            # opting out per function wins over the global default
+            GIMarshallingTests.array_fixed_int_return.array_buffers = False
+            self.assertEqual([-1, 0, 1, 2], GIMarshallingTests.array_fixed_int_return())
+        finally:
+            GIMarshallingTests.array_fixed_int_return.array_buffers = None
+            gi.set_array_buffers(False)
+
     def test_array_in(self):
         GIMarshallingTests.array_in(Sequence([-1, 0, 1, 2]))
+        GIMarshallingTests.array_in([-1, 0, 1, 2])
+        GIMarshallingTests.array_in((-1, 0, 1, 2))
 
     def test_array_in_len_zero_terminated(self):
         GIMarshallingTests.array_in_len_zero_terminated(Sequence([-1, 0, 1, 2]))
@@ -699,6 +765,19 @@ class TestArray(unittest.TestCase):
         GIMarshallingTests.array_uint8_in(Sequence([97, 98, 99, 100]))
         GIMarshallingTests.array_uint8_in(_bytes("abcd"))
 
+    def test_array_in_buffer(self):
+        GIMarshallingTests.array_in(array.array('i', [-1, 0, 1, 2]))
+        GIMarshallingTests.array_in(memoryview(array.array('i', [-1, 0, 1, 2])))
+        GIMarshallingTests.array_in_len_zero_terminated(array.array('i', [-1, 0, 1, 2]))
+        GIMarshallingTests.array_fixed_int_in(array.array('i', [-1, 0, 1, 2]))
+        GIMarshallingTests.array_uint8_in(bytearray(_bytes("abcd")))
+
+        # element type mismatch falls back to marshalling item by item
+        GIMarshallingTests.array_in(array.array('h', [-1, 0, 1, 2]))
+
+        self.assertRaises(ValueError, GIMarshallingTests.array_fixed_int_in,
+                          array.array('i', [-1, 0, 1]))
+
     def test_array_out(self):
         self.assertEqual([-1, 0, 1, 2], GIMarshallingTests.array_out())
 
@@ -746,6 +825,49 @@ class TestArray(unittest.TestCase):
 
         GIMarshallingTests.array_simple_struct_in([struct1, struct2, struct3])
 
+    def test_array_simple_struct_in_sequence(self):
+        structs = []
+        for i in range(1, 4):
+            struct = GIMarshallingTests.SimpleStruct()
+            struct.long_ = i
+            structs.append(struct)
+
+        GIMarshallingTests.array_simple_struct_in(Sequence(structs))
+        GIMarshallingTests.array_simple_struct_in(tuple(structs))
+
+    def test_array_in_item_error(self):
+        self.assertRaises(TypeError, GIMarshallingTests.array_in, [-1, '0', 1, 2])
+        self.assertRaises(TypeError, GIMarshallingTests.array_in, Sequence([-1, 0, 1, None]))
+        GIMarshallingTests.array_in([-1, 0, 1, 2])
+
+    def test_array_struct_in_item_error(self):
+        struct1 = GIMarshallingTests.BoxedStruct()
+        struct1.long_ = 1
+        struct3 = GIMarshallingTests.BoxedStruct()
+        struct3.long_ = 3
+
+        self.assertRaises(TypeError, GIMarshallingTests.array_struct_in,
+                          [struct1, 'foo', struct3])
+
+        struct2 = GIMarshallingTests.BoxedStruct()
+        struct2.long_ = 2
+        GIMarshallingTests.array_struct_in([struct1, struct2, struct3])
+        self.assertEqual(struct1.long_, 1)
+        self.assertEqual(struct3.long_, 3)
+
+    def test_array_simple_struct_in_item_error(self):
+        struct1 = GIMarshallingTests.SimpleStruct()
+        struct1.long_ = 1
+        struct3 = GIMarshallingTests.SimpleStruct()
+        struct3.long_ = 3
+
+        self.assertRaises(TypeError, GIMarshallingTests.array_simple_struct_in,
+                          [struct1, 42, struct3])
+
+        struct2 = GIMarshallingTests.SimpleStruct()
+        struct2.long_ = 2
+        GIMarshallingTests.array_simple_struct_in([struct1, struct2, struct3])
+
     def test_array_multi_array_key_value_in(self):
         GIMarshallingTests.multi_array_key_value_in(["one", "two", "three"],
                                                     [1, 2, 3])
@@ -785,6 +907,25 @@ class TestGStrv(unittest.TestCase):
     def test_gstrv_in(self):
         GIMarshallingTests.gstrv_in(Sequence(['0', '1', '2']))
 
+    def test_gstrv_in_list(self):
+        GIMarshallingTests.gstrv_in(['0', '1', '2'])
+        GIMarshallingTests.gstrv_in(('0', '1', '2'))
+
+    def test_strv_items_kept_alive(self):
+        # The items of this sequence are only referenced while they are
+        # marshalled, their borrowed strings must stay valid for the call.
+        class FreshItems(object):
+            def __len__(self):
+                return 3
+
+            def __getitem__(self, index):
+                if index >= 3:
+                    raise IndexError(index)
+                return ('item %d ' % index) * 64
+
+        items = [FreshItems()[i] for i in range(3)]
+        self.assertEqual(items, GLib.Variant.new_strv(FreshItems()).get_strv())
+
     def test_gstrv_out(self):
         self.assertEqual(['0', '1', '2'], GIMarshallingTests.gstrv_out())
 
@@ -907,8 +1048,11 @@ class TestGList(unittest.TestCase):
 
     def test_glist_int_none_in(self):
         GIMarshallingTests.glist_int_none_in(Sequence((-1, 0, 1, 2)))
+        GIMarshallingTests.glist_int_none_in([-1, 0, 1, 2])
+        GIMarshallingTests.glist_int_none_in((-1, 0, 1, 2))
 
         self.assertRaises(TypeError, GIMarshallingTests.glist_int_none_in, Sequence((-1, '0', 1, 2)))
+        self.assertRaises(TypeError, GIMarshallingTests.glist_int_none_in, [-1, '0', 1, 2])
 
         self.assertRaises(TypeError, GIMarshallingTests.glist_int_none_in, 42)
         self.assertRaises(TypeError, GIMarshallingTests.glist_int_none_in, None)
@@ -951,8 +1095,11 @@ class TestGSList(unittest.TestCase):
 
     def test_gslist_int_none_in(self):
         GIMarshallingTests.gslist_int_none_in(Sequence((-1, 0, 1, 2)))
+        GIMarshallingTests.gslist_int_none_in([-1, 0, 1, 2])
+        GIMarshallingTests.gslist_int_none_in((-1, 0, 1, 2))
 
         self.assertRaises(TypeError, GIMarshallingTests.gslist_int_none_in, Sequence((-1, '0', 1, 2)))
+        self.assertRaises(TypeError, GIMarshallingTests.gslist_int_none_in, [-1, '0', 1, 2])
 
         self.assertRaises(TypeError, GIMarshallingTests.gslist_int_none_in, 42)
         self.assertRaises(TypeError, GIMarshallingTests.gslist_int_none_in, None)
@@ -1116,6 +1263,20 @@ class TestEnum(unittest.TestCase):
         self.assertTrue(isinstance(GIMarshallingTests.Enum.VALUE3, GIMarshallingTests.Enum))
         self.assertEqual(42, GIMarshallingTests.Enum.VALUE3)
 
+    def test_enum_lazy_values(self):
+        self.assertTrue('VALUE2' in dir(GIMarshallingTests.Enum))
+        self.assertTrue(GIMarshallingTests.Enum.VALUE2 is GIMarshallingTests.Enum.VALUE2)
+        self.assertTrue('VALUE2' in GIMarshallingTests.Enum.__dict__)
+        self.assertTrue(GIMarshallingTests.Enum.__enum_values__[42] is GIMarshallingTests.Enum.VALUE3)
+        self.assertTrue(GIMarshallingTests.Enum.VALUE1.VALUE2 is GIMarshallingTests.Enum.VALUE2)
+        self.assertTrue('VALUE1' in vars(GIMarshallingTests.Enum))
+
+        self.assertTrue('VALUE2' in dir(GIMarshallingTests.Flags))
+        self.assertTrue(GIMarshallingTests.Flags.VALUE2 is GIMarshallingTests.Flags.VALUE2)
+        self.assertTrue(GIMarshallingTests.Flags.VALUE1.VALUE3 is GIMarshallingTests.Flags.VALUE3)
+        self.assertTrue('VALUE1' in vars(GIMarshallingTests.Flags))
+        self.assertFalse('__lazy_values__' in vars(GIMarshallingTests.Flags))
+
     def test_value_nick_and_name(self):
         self.assertEqual(GIMarshallingTests.Enum.VALUE1.value_nick, 'value1')
         self.assertEqual(GIMarshallingTests.Enum.VALUE2.value_nick, 'value2')
@@ -1521,6 +1682,37 @@ class TestGObject(unittest.TestCase):
 
         self.assertRaises(TypeError, GIMarshallingTests.SubObject.overwritten_method, GIMarshallingTests.Object())
 
+    def test_sub_object_lazy_members(self):
+        object_ = GIMarshallingTests.SubObject(int=42)
+        object_.method()
+
+        # resolved on the class providing it, not the one it was looked up on
+        self.assertTrue('method' in GIMarshallingTests.Object.__dict__)
+        self.assertFalse('method' in GIMarshallingTests.SubObject.__dict__)
+
+        self.assertTrue('sub_method' in dir(GIMarshallingTests.SubObject))
+        self.assertFalse(hasattr(object_, 'no_such_method'))
+        self.assertFalse(hasattr(GIMarshallingTests.SubObject, 'no_such_method'))
+
+    def test_sub_object_lazy_members_super(self):
+        class SubObject(GIMarshallingTests.SubObject):
+            def method_array_return(self):
+                return super(SubObject, self).method_array_return() + [3]
+
+        object_ = SubObject(int=42)
+        # not defined in the Python subclass nor looked up before
+        self.assertEqual(super(SubObject, object_).sub_method(), None)
+        self.assertEqual(object_.method_array_return(), [-1, 0, 1, 2, 3])
+        self.assertEqual(GIMarshallingTests.Object.method_array_return(object_),
+                         [-1, 0, 1, 2])
+
+    def test_object_member_names(self):
+        names = GIMarshallingTests.Object.__info__.get_member_names()
+        self.assertTrue('new' in names)
+        self.assertTrue('method_array_return' in names)
+        self.assertTrue('do_method_int8_in' in names)
+        self.assertTrue('int_' in names)
+
     def test_sub_object_int(self):
         object_ = GIMarshallingTests.SubObject()
         self.assertEqual(object_.int_, 0)
@@ -1699,6 +1891,18 @@ class TestPythonGObject(unittest.TestCase):
         object_.method_with_default_implementation(87)
         self.assertEqual(object_.val, 87)
 
+    def test_native_vfunc_cached(self):
+        vfunc = GIMarshallingTests.Object.do_method_with_default_implementation
+        self.assertTrue(vfunc is
+                        GIMarshallingTests.Object.do_method_with_default_implementation)
+        self.assertEqual(vfunc.__name__, 'method_with_default_implementation')
+        self.assertEqual(vfunc.__module__, 'GIMarshallingTests')
+        self.assertTrue(isinstance(vfunc.__info__, gi._gi.VFuncInfo))
+
+        object_ = GIMarshallingTests.Object(int=0)
+        vfunc(object_, 42)
+        self.assertEqual(object_.props.int, 42)
+
     def test_dynamic_module(self):
         from gi.module import DynamicGObjectModule
         self.assertTrue(isinstance(GObject, DynamicGObjectModule))
@@ -1780,6 +1984,20 @@ class TestPythonGObject(unittest.TestCase):
         self.assertEqual(sso.subsub_method_int8_called, 1)
         self.assertEqual(sso.sub_method_int8_called, 0)
 
+    def test_vfunc_index(self):
+        from gi.types import _get_vfunc_index, find_vfunc_conflict_in_bases
+
+        index = _get_vfunc_index(GIMarshallingTests.Object)
+        self.assertTrue('method_int8_in' in index)
+        self.assertEqual(index['method_int8_in'].get_name(), 'method_int8_in')
+        self.assertTrue(_get_vfunc_index(GIMarshallingTests.Object) is index)
+
+        class PySubObject(GIMarshallingTests.Object):
+            pass
+
+        self.assertEqual(find_vfunc_conflict_in_bases(index['method_int8_in'],
+                                                      (PySubObject,)), None)
+
     def test_callback_in_vfunc(self):
         class SubObject(GIMarshallingTests.Object):
             def __init__(self):
@@ -1874,6 +2092,23 @@ class TestInterfaces(unittest.TestCase):
                                  GIMarshallingTests.Interface2):
             pass
 
+    def test_mro_plain_classes(self):
+        from gi.types import mro
+
+        class A(object):
+            pass
+
+        class B(A):
+            pass
+
+        class C(A):
+            pass
+
+        class D(B, C):
+            pass
+
+        self.assertEqual(mro(D), list(D.__mro__))
+
 
 class TestInterfaceClash(unittest.TestCase):
 
@@ -2255,6 +2490,228 @@ class TestKeywords(unittest.TestCase):
         self.assertEqual(GLib.IOCondition.IN.value_nicks, ['in'])
 
 
+class TestFunctionInfoCall(unittest.TestCase):
+    def test_bound_method_call(self):
+        object_ = GIMarshallingTests.Object(int=42)
+        method = object_.method_array_in
+        method([-1, 0, 1, 2])
+        # called by map() without the argument vector offset of PEP 590
+        self.assertEqual(list(map(method, [[-1, 0, 1, 2]] * 2)), [None, None])
+        self.assertRaises(TypeError, method)
+        self.assertRaises(TypeError, method, [-1, 0, 1, 2], 42)
+
+    def test_shared_callable_cache(self):
+        repository = gi.Repository.get_default()
+        repository.find_by_name('GIMarshallingTests', 'int8_in_max')(127)
+
+        info = gi.get_callable_cache_info()
+        func = repository.find_by_name('GIMarshallingTests', 'int8_in_max')
+        self.assertFalse(func is GIMarshallingTests.int8_in_max)
+        func(127)
+
+        new_info = gi.get_callable_cache_info()
+        self.assertEqual(new_info['builds'], info['builds'])
+        self.assertEqual(new_info['hits'], info['hits'] + 1)
+        self.assertEqual(new_info['size'], info['size'])
+
+    def test_warmup(self):
+        thread = gi.warmup(namespaces=['GIMarshallingTests'],
+                           classes=['GIMarshallingTests.Object',
+                                    'GIMarshallingTests.int8_in_min'])
+        thread.join()
+
+        info = gi.get_callable_cache_info()
+        GIMarshallingTests.Object.static_method()
+        GIMarshallingTests.int8_in_min(-128)
+        self.assertEqual(gi.get_callable_cache_info()['builds'], info['builds'])
+
+        self.assertEqual(gi.warmup(classes=['GIMarshallingTests.Object'],
+                                   in_thread=False), None)
+
+    def test_module_function(self):
+        func = GIMarshallingTests.int_three_in_three_out
+        self.assertTrue(isinstance(func, gi._gi.FunctionInfo))
+        self.assertEqual(func.__name__, 'int_three_in_three_out')
+        self.assertEqual(func.__module__, 'GIMarshallingTests')
+        self.assertEqual(func.__info__, func)
+        self.assertEqual(func(1, 2, 3), (1, 2, 3))
+
+    def test_bound_method(self):
+        object_ = GIMarshallingTests.Object(int=42)
+        method = object_.method_array_return
+        self.assertEqual(method.__self__, object_)
+        self.assertEqual([-1, 0, 1, 2], method())
+        self.assertEqual([-1, 0, 1, 2],
+                         GIMarshallingTests.Object.method_array_return(object_))
+
+    def test_bound_method_equality(self):
+        object_ = GIMarshallingTests.Object(int=42)
+        other = GIMarshallingTests.Object(int=42)
+        self.assertEqual(object_.method_array_return, object_.method_array_return)
+        self.assertEqual(hash(object_.method_array_return),
+                         hash(object_.method_array_return))
+        self.assertNotEqual(object_.method_array_return, other.method_array_return)
+        self.assertNotEqual(object_.method_array_return, object_.method)
+
+        # handlers are matched by equality
+        other.connect('notify', object_.method_array_return)
+        other.disconnect_by_func(object_.method_array_return)
+        try:
+            other.disconnect_by_func(object_.method_array_return)
+        except TypeError:
+            self.assertTrue('nothing connected' in str(sys.exc_info()[1]))
+        else:
+            self.fail('expected TypeError')
+
+    def test_static_method(self):
+        object_ = GIMarshallingTests.Object(int=42)
+        self.assertTrue(isinstance(object_.static_method, gi._gi.FunctionInfo))
+        object_.static_method()
+
+    def test_invoke_many(self):
+        func = GIMarshallingTests.int_three_in_three_out
+        self.assertEqual(func.invoke_many([(1, 2, 3), [4, 5, 6]]),
+                         [(1, 2, 3), (4, 5, 6)])
+        self.assertEqual(func.invoke_many(iter([])), [])
+
+        # not all scalar, goes through the regular invoker for each item
+        self.assertEqual(GIMarshallingTests.array_in.invoke_many([([-1, 0, 1, 2],)] * 3),
+                         [None, None, None])
+
+    def test_invoke_many_bound(self):
+        object_ = GIMarshallingTests.Object(int=42)
+        method = object_.method_int8_in
+        self.assertTrue(isinstance(method, gi._gi.BoundFunctionInfo))
+        self.assertEqual(method.__func__, GIMarshallingTests.Object.method_int8_in)
+        self.assertEqual(method.invoke_many([(42,)] * 300), [None] * 300)
+
+    def test_invoke_many_error(self):
+        func = GIMarshallingTests.int_three_in_three_out
+        for items, prefix in (([(1, 2, 3), (1, 'a', 3)], 'item 1: '),
+                              ([(1, 2, 3), (1, 2, 3), 42], 'item 2: ')):
+            try:
+                func.invoke_many(items)
+            except TypeError:
+                e = sys.exc_info()[1]
+                self.assertTrue(str(e).startswith(prefix), str(e))
+            else:
+                self.fail('invoke_many() did not raise TypeError')
+
+        self.assertRaises(TypeError, func.invoke_many, 42)
+
+
+class TestMetadataCache(unittest.TestCase):
+    def setUp(self):
+        from gi import cache
+        self.cache = cache
+        self.was_enabled = cache.is_enabled()
+        self.cache_dir = tempfile.mkdtemp()
+        cache.enable(self.cache_dir)
+
+    def tearDown(self):
+        if self.was_enabled:
+            self.cache.enable()
+        else:
+            self.cache.disable()
+        shutil.rmtree(self.cache_dir)
+
+    def test_lookup(self):
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return [('A', 1), ('B', 2)]
+
+        value = self.cache.lookup('GIMarshallingTests', 'test', 'Name', compute)
+        self.assertEqual(value, [('A', 1), ('B', 2)])
+        self.assertEqual(self.cache.lookup('GIMarshallingTests', 'test', 'Name', compute), value)
+        self.assertEqual(len(calls), 1)
+
+        self.cache.save()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        # reloaded from the cache directory
+        self.cache.enable(self.cache_dir)
+        self.assertEqual(self.cache.lookup('GIMarshallingTests', 'test', 'Name', compute), value)
+        self.assertEqual(len(calls), 1)
+
+    def test_stale_file(self):
+        self.cache.lookup('GIMarshallingTests', 'test', 'Name', lambda: 1)
+        self.cache.save()
+
+        path = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        with open(path, 'wb') as cache_file:
+            cache_file.write(_bytes('garbage'))
+
+        self.cache.enable(self.cache_dir)
+        self.assertEqual(self.cache.lookup('GIMarshallingTests', 'test', 'Name', lambda: 2), 2)
+
+    def test_disabled(self):
+        self.cache.disable()
+        self.assertEqual(self.cache.lookup('GIMarshallingTests', 'test', 'Name', lambda: 1), 1)
+        self.assertEqual(self.cache.lookup('GIMarshallingTests', 'test', 'Name', lambda: 2), 2)
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        from gi import cache, snapshot
+        self.cache = cache
+        self.snapshot = snapshot
+
+    def tearDown(self):
+        self.cache._preloaded.pop('GIMarshallingTests', None)
+
+    def test_create_and_load(self):
+        source = self.snapshot.create('GIMarshallingTests')
+        self.assertTrue("register('GIMarshallingTests', '1.0', " in source)
+
+        exec(source, {})
+        self.assertTrue(self.snapshot.load('GIMarshallingTests', '1.0'))
+
+        data = self.cache._preloaded['GIMarshallingTests']
+        self.assertTrue('method_int8_in' in data['members']['Object'])
+        self.assertEqual(data['base_types']['SubObject'][0],
+                         ('GIMarshallingTests', 'Object', 'GIMarshallingTestsObject'))
+        self.assertEqual(self.cache.lookup('GIMarshallingTests', 'members', 'Object', list),
+                         data['members']['Object'])
+
+    def test_checksum_mismatch(self):
+        self.snapshot.register('GIMarshallingTests', '1.0', 'invalid', {})
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter('always')
+            self.assertFalse(self.snapshot.load('GIMarshallingTests', '1.0'))
+        self.assertEqual(len(warns), 1)
+        self.assertTrue(issubclass(warns[0].category, RuntimeWarning))
+        self.assertFalse('GIMarshallingTests' in self.cache._preloaded)
+
+
+class TestProfileImports(unittest.TestCase):
+    def test_profile_imports(self):
+        from gi.module import IntrospectionModule
+
+        with gi.profile_imports() as profile:
+            module = IntrospectionModule('GIMarshallingTests')
+            module.Object
+
+        self.assertTrue(('require', 'GIMarshallingTests') in profile.entries)
+        entry = profile.entries[('getattr', 'GIMarshallingTests.Object')]
+        self.assertEqual(entry.calls, 1)
+        self.assertTrue(entry.total_time >= entry.self_time >= 0)
+
+        if sys.version_info.major < 3:
+            output = BytesIO()
+        else:
+            output = StringIO()
+        profile.report(output)
+        self.assertTrue('GIMarshallingTests.Object' in output.getvalue())
+
+    def test_inactive(self):
+        with gi.profile_imports() as profile:
+            pass
+        GIMarshallingTests.Object.method
+        self.assertEqual(profile.entries, {})
+
+
 class TestModule(unittest.TestCase):
     def test_path(self):
         self.assertTrue(GIMarshallingTests.__path__.endswith('GIMarshallingTests-1.0.typelib'),
@@ -2278,6 +2735,26 @@ class TestModule(unittest.TestCase):
             item = getattr(GIMarshallingTests, item_name)
             self.assertTrue(hasattr(item, '__class__'))
 
+    def test_getattr_cached(self):
+        struct = GIMarshallingTests.SimpleStruct
+        self.assertTrue(GIMarshallingTests.__dict__.get('SimpleStruct') is struct)
+        self.assertTrue(GIMarshallingTests.SimpleStruct is struct)
+
+        GIMarshallingTests._invalidate('SimpleStruct')
+        self.assertFalse('SimpleStruct' in GIMarshallingTests.__dict__)
+        self.assertTrue(GIMarshallingTests.SimpleStruct is struct)
+
+    def test_bases_from_gtype(self):
+        from gi.module import get_parent_for_object, get_interfaces_for_object
+
+        info = GIMarshallingTests.SubObject.__info__
+        self.assertEqual(info.get_parent().get_type_name(), 'GIMarshallingTestsObject')
+        self.assertTrue(get_parent_for_object(info) is GIMarshallingTests.Object)
+
+        from gi.repository import Gio
+        info = Gio.ThemedIcon.__info__
+        self.assertEqual(get_interfaces_for_object(info), [Gio.Icon])
+
     def test_help(self):
         orig_stdout = sys.stdout
         try:
@@ -293,6 +293,24 @@ class TestClosures(unittest.TestCase):
         self.assertEqual(inst.a, 1)
         gc.collect()
 
+    def testExtraArgs(self):
+        # more arguments than fit in the marshaller's stack vector
+        values = []
+        e = E()
+        e.connect('signal', lambda obj, *args: values.append(args), *range(10))
+        e.emit('signal')
+        self.assertEqual(values, [tuple(range(10))])
+
+    def testConnectObject(self):
+        values = []
+        e = E()
+        other = E()
+        e.connect_object('signal', lambda *args: values.append(args), other, 1)
+        e.emit('signal')
+        self.assertEqual(len(values), 1)
+        self.assertTrue(values[0][0] is other)
+        self.assertEqual(values[0][1:], (1,))
+
     def testGString(self):
         class C(GObject.GObject):
             __gsignals__ = {'my_signal': (GObject.SignalFlags.RUN_LAST, GObject.TYPE_GSTRING,